@@ -0,0 +1,36 @@
+"""
+Measures the per-turn attack queries: which attacks the active Pokémon can afford, and their damage.
+
+Run from the repository root:
+
+    python benchmarks/bench_attacks.py
+"""
+import timeit
+
+from common import ENERGIES, make_pokemon
+from ptcgp_sim.game.objects.card import Card
+
+REPEAT = 200_000
+
+
+def main():
+    card = Card(make_pokemon(1, "Venusaur", 160, [("GC", "Razor Leaf", "60"), ("GGCC", "Giant Bloom", "100+")]))
+    for energy in (ENERGIES[0], ENERGIES[1], ENERGIES[0]):
+        card.attach_energy(energy)
+    attack = card.attacks[1]
+
+    def uncached():
+        card._available_attacks = None
+        return card.get_available_attacks()
+
+    for label, statement in [
+        ("get_available_attacks()", card.get_available_attacks),
+        ("... after energy change", uncached),
+        ("attack.get_damage()", attack.get_damage),
+    ]:
+        seconds = min(timeit.repeat(statement, number=REPEAT, repeat=5))
+        print(f"{label:>24}: {seconds / REPEAT * 1e9:6.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmarks the memory footprint of runtime Card instances and the cost of reading
+their static (CardData) and per-instance fields.
+
+Times are the best of REPEAT runs, and still vary by 20-30% between machines and runs; compare
+them within a run. The footprint is exact, and changes whenever a slot is added to Card.
+"""
+import timeit
+import tracemalloc
+
+from common import make_pokemon
+
+from ptcgp_sim.game.objects.card import Card
+
+
+CARDS = 10_000
+NUMBER = 1_000_000
+REPEAT = 5
+
+
+def bytes_per_card() -> float:
+    card_data = make_pokemon(1, "Bulbasaur", 70, [("GC", "Vine Whip", "40")])
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    cards = [Card(card_data) for _ in range(CARDS)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Don't count the list holding the cards
+    return (after - before - 8 * len(cards)) / CARDS
+
+
+def main():
+    print(f"Card instance: {bytes_per_card():.0f} bytes")
+
+    card = Card(make_pokemon(1, "Bulbasaur", 70, [("GC", "Vine Whip", "40")]))
+    for expression in ("card.name", "card.stage", "card.attacks", "card.card_data.name", "card.current_hp"):
+        seconds = min(timeit.repeat(expression, globals={"card": card}, number=NUMBER, repeat=REPEAT))
+        print(f"{expression:>20}: {seconds / NUMBER * 1e9:5.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Measures GameState.clone(), the copy used by search-based agents, in clones per second.
+The game is cloned after a few turns of play, with Pokémon in play, energy attached and damage dealt.
+copy.deepcopy, which also walks the card data and the game log, is timed for comparison.
+"""
+import copy
+import timeit
+
+from common import ENERGIES, deck_lists
+
+from ptcgp_sim.ai.simple_ai_controller import SimpleAIController
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+from ptcgp_sim.game.logic.game_controller import GameController
+from ptcgp_sim.setup.setup_player import setup_player
+
+
+TURNS = 6
+NUMBER = 2_000
+
+
+def mid_game_state():
+    """A game after TURNS turns of play between two simple agents."""
+    grass, fire = deck_lists()
+    players = [
+        setup_player("A", Deck([Card(card_data) for card_data in grass]), ENERGIES),
+        setup_player("B", Deck([Card(card_data) for card_data in fire]), ENERGIES),
+    ]
+    controller = GameController(players)
+    controller.start_game()
+    agents = [SimpleAIController(), SimpleAIController()]
+    game_state = controller.game_state
+    while game_state.turn_number <= TURNS and not game_state.is_game_over:
+        agents[game_state.current_player_index].take_turn(controller)
+    return game_state
+
+
+def main():
+    game_state = mid_game_state()
+    for label, statement, number in [
+        ("GameState.clone()", game_state.clone, NUMBER),
+        ("copy.deepcopy(game_state)", lambda: copy.deepcopy(game_state), NUMBER // 20),
+    ]:
+        seconds = min(timeit.repeat(statement, number=number, repeat=3)) / number
+        print(f"{label:>26}: {seconds * 1e6:8.1f} us  {1 / seconds:10,.0f} clones/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmarks dealing an opening hand, the per-game deck work of the batch runner: a full shuffle of
+a list of cards with a scan for the first Basic, as setup_player used to do, against resetting an
+array-backed Deck, shuffling it lazily and searching it by stage.
+"""
+import timeit
+
+from common import make_pokemon
+
+from ptcgp_sim.game.logic.rng import GameRandom
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+
+
+NUMBER = 20_000
+
+
+def main():
+    basic = make_pokemon(1, "Bulbasaur", 70, [("GC", "Vine Whip", "40")])
+    other = make_pokemon(2, "Ivysaur", 90, [("GC", "Vine Whip", "40")])
+    other.stage = "Stage 1"
+    card_data = [basic] * 4 + [other] * 16
+    rng = GameRandom(0)
+
+    def list_deal():
+        cards = [Card(data) for data in card_data]
+        rng.shuffle(cards)
+        first_basic = next(card for card in cards if card.stage == "Basic")
+        cards.remove(first_basic)
+        return [first_basic] + [cards.pop() for _ in range(4)]
+
+    deck = Deck([Card(data) for data in card_data])
+
+    def deck_deal():
+        deck.reset()
+        deck.shuffle(rng)
+        return [deck.draw_stage("Basic")] + [deck.draw() for _ in range(4)]
+
+    for name, deal in (("new cards, list shuffle", list_deal), ("Deck reset, lazy shuffle", deck_deal)):
+        seconds = timeit.timeit(deal, number=NUMBER)
+        print(f"{name:>25}: {seconds / NUMBER * 1e6:6.2f} us per opening hand")
+
+
+if __name__ == "__main__":
+    main()
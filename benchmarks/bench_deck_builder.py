@@ -0,0 +1,42 @@
+"""
+Evolves decks from a pool of Basic Pokémon of increasing strength against a fixed gauntlet, and
+reports how many candidates the fitness cache saved from being simulated, and how fast the search
+runs with one worker against all CPUs.
+"""
+import math
+import os
+import time
+
+from common import ENERGIES, make_pokemon
+
+from ptcgp_sim.ai.deck_builder import DeckBuilder, Opponent
+
+
+N_CARDS = 16
+HP = 240
+
+
+def make_builder(workers: int) -> DeckBuilder:
+    # Card i knocks out a Pokémon in N_CARDS - i hits
+    pool = [make_pokemon(500 + i, f"Mon {i}", HP, [("C", "Hit", str(math.ceil(HP / (N_CARDS - i))))])
+            for i in range(N_CARDS)]
+    gauntlet = [Opponent([pool[i]] * 20, ENERGIES) for i in (4, 8, 12)]
+    return DeckBuilder(pool, gauntlet, ENERGIES, games_per_opponent=8, workers=workers, seed=0)
+
+
+def main():
+    for workers in (1, os.cpu_count() or 1):
+        builder = make_builder(workers)
+        start = time.perf_counter()
+        result = builder.evolve(generations=10, population_size=24, elite=4)
+        seconds = time.perf_counter() - start
+        candidates = result.evaluations + result.cache_hits
+        strength = sum(int(card_data.name.split()[-1]) for card_data in result.best_deck) / len(result.best_deck)
+        print(f"{workers:>2} workers: {seconds:6.2f} s, best fitness {result.best_fitness:.3f}, "
+              f"mean card strength {strength:.1f} of {N_CARDS - 1}")
+        print(f"   {candidates} candidates, {result.evaluations} simulated, "
+              f"{result.cache_hits} from the cache ({result.cache_hits / candidates:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Measures the observation encoder on a batch of games in progress: encoding every row from scratch
+against updating the rows after one more turn of play. The update skips the slots and players whose
+change counters (GameState.versions) did not move, but a full turn changes most of both players.
+"""
+import time
+
+from common import ENERGIES, deck_lists
+
+from ptcgp_sim.ai.simple_ai_controller import SimpleAIController
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+from ptcgp_sim.game.logic.game_controller import GameController
+from ptcgp_sim.setup.setup_player import setup_player
+from ptcgp_sim.sim.encoder import ObservationEncoder
+
+
+BATCH_SIZE = 256
+STEPS = 20
+
+
+def start_games(count: int) -> list[GameController]:
+    grass, fire = deck_lists()
+    controllers = []
+    for _ in range(count):
+        players = [
+            setup_player("A", Deck([Card(card_data) for card_data in grass]), ENERGIES),
+            setup_player("B", Deck([Card(card_data) for card_data in fire]), ENERGIES),
+        ]
+        controller = GameController(players)
+        controller.start_game()
+        controllers.append(controller)
+    return controllers
+
+
+def main():
+    controllers = start_games(BATCH_SIZE)
+    game_states = [controller.game_state for controller in controllers]
+    agent = SimpleAIController()
+    encoder = ObservationEncoder(BATCH_SIZE)
+    encoder.encode_batch(game_states)
+    scratch = ObservationEncoder(BATCH_SIZE)
+
+    full = incremental = 0.0
+    for _ in range(STEPS):
+        for controller in controllers:
+            if not controller.game_state.is_game_over:
+                agent.take_turn(controller)
+
+        start = time.perf_counter()
+        encoder.update_batch(game_states)
+        incremental += time.perf_counter() - start
+
+        start = time.perf_counter()
+        scratch.encode_batch(game_states)
+        full += time.perf_counter() - start
+
+    for label, seconds in [("encode from scratch", full), ("versioned update", incremental)]:
+        print(f"{label:>24}: {seconds / (STEPS * BATCH_SIZE) * 1e6:6.1f} us per game per step")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmarks event allocation over full games.
+Reports the size of an event instance, how many events a game creates, garbage collections
+triggered, and the time per game.
+"""
+import gc
+import sys
+import time
+
+from common import ENERGIES, deck_lists
+
+from ptcgp_sim.ai.simple_ai_controller import SimpleAIController
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+from ptcgp_sim.game.logic.events import DamageDealtEvent
+from ptcgp_sim.game.logic.game_controller import GameController
+from ptcgp_sim.setup.setup_player import setup_player
+from ptcgp_sim.sim.runner import run_game
+
+
+GAMES = 500
+
+
+def instance_size(obj) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def play() -> tuple[int, int, float]:
+    """Plays GAMES games. Returns (events created, gen 0 collections, seconds)."""
+    deck_a, deck_b = deck_lists()
+    created = 0
+    collections_before = gc.get_stats()[0]["collections"]
+    start = time.perf_counter()
+    for game_index in range(GAMES):
+        players = [
+            setup_player("A", Deck([Card(c) for c in deck_a]), ENERGIES),
+            setup_player("B", Deck([Card(c) for c in deck_b]), ENERGIES),
+        ]
+        controller = GameController(players)
+        run_game(controller, [SimpleAIController(), SimpleAIController()])
+        created += controller.game_state.event_ids.next_id
+    elapsed = time.perf_counter() - start
+    return created, gc.get_stats()[0]["collections"] - collections_before, elapsed
+
+
+def main():
+    print(f"DamageDealtEvent instance: {instance_size(DamageDealtEvent(None, None, 10))} bytes")
+    created, collections, elapsed = play()
+    print(f"{created / GAMES:6.1f} events/game, {collections} gen-0 collections, {elapsed / GAMES * 1e6:7.0f} us/game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmarks GameState.find_object_by_id and DealDamageEffect application as the zones grow.
+With the object index, both should stay flat regardless of how many cards the players hold.
+The linear scan that the index replaced is timed for comparison.
+"""
+import contextlib
+import io
+import timeit
+
+from common import make_pokemon
+
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+from ptcgp_sim.game.objects.player import Player
+from ptcgp_sim.game.logic.game_state import GameState
+from ptcgp_sim.game.logic.effects import DealDamageEffect
+
+
+ZONE_SIZES = [10, 100, 1_000, 10_000]
+NUMBER = 20_000
+
+
+def linear_find(game_state: GameState, object_id):
+    """The original find_object_by_id: a scan over every player's zones."""
+    for player in game_state.players:
+        if player.instance_id == object_id:
+            return player
+        for zone in player.all_zones:
+            for card in zone:
+                if card is not None and card.instance_id == object_id:
+                    return card
+    return None
+
+
+def build_game(zone_size: int) -> tuple[GameState, Card]:
+    """Two players whose discard piles hold zone_size cards. Returns the game and a target on the 2nd bench."""
+    card_data = make_pokemon(1, "Target Mon", 10 ** 9, [])
+    players = []
+    for name in ("A", "B"):
+        player = Player(name, Deck([]), None)
+        player.discard_pile = [Card(card_data) for _ in range(zone_size)]
+        player.active_pokemon = Card(card_data)
+        player.bench[0] = Card(card_data)
+        players.append(player)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game_state = GameState(players)
+    return game_state, players[1].bench[0]
+
+
+def main():
+    print(f"{'zone size':>10} {'index find (ns)':>16} {'linear find (ns)':>17} {'damage effect (ns)':>19}")
+    for zone_size in ZONE_SIZES:
+        game_state, target = build_game(zone_size)
+        target_id = target.instance_id
+        effect = DealDamageEffect(target_id=target_id, amount=1)
+
+        index_find = timeit.timeit(lambda: game_state.find_object_by_id(target_id), number=NUMBER)
+        linear = timeit.timeit(lambda: linear_find(game_state, target_id), number=max(1, NUMBER // zone_size))
+        with contextlib.redirect_stdout(io.StringIO()):
+            apply = timeit.timeit(lambda: effect.apply(game_state), number=NUMBER)
+
+        print(f"{zone_size:>10} {index_find / NUMBER * 1e9:>16.0f} "
+              f"{linear / max(1, NUMBER // zone_size) * 1e9:>17.0f} {apply / NUMBER * 1e9:>19.0f}")
+
+
+if __name__ == "__main__":
+    main()
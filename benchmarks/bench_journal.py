@@ -0,0 +1,63 @@
+"""
+Measures trying a move in place with GameState.checkpoint() and rollback(), against trying it on
+a clone, the two ways a search can expand a node. The move is each legal action of a mid-game
+state in turn, so ending the turn, with its draw and energy roll, is among them.
+"""
+import copy
+import timeit
+
+from common import ENERGIES, deck_lists
+
+from ptcgp_sim.ai.simple_ai_controller import SimpleAIController
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+from ptcgp_sim.game.logic.actions import apply_action, legal_actions
+from ptcgp_sim.game.logic.game_controller import GameController
+from ptcgp_sim.setup.setup_player import setup_player
+
+
+TURNS = 6
+NUMBER = 1_000
+
+
+def mid_game_controller() -> GameController:
+    """A game after TURNS turns of play between two simple agents."""
+    grass, fire = deck_lists()
+    players = [
+        setup_player("A", Deck([Card(card_data) for card_data in grass]), ENERGIES),
+        setup_player("B", Deck([Card(card_data) for card_data in fire]), ENERGIES),
+    ]
+    controller = GameController(players)
+    controller.start_game()
+    agents = [SimpleAIController(), SimpleAIController()]
+    game_state = controller.game_state
+    while game_state.turn_number <= TURNS and not game_state.is_game_over:
+        agents[game_state.current_player_index].take_turn(controller)
+    return controller
+
+
+def main():
+    controller = mid_game_controller()
+    game_state = controller.game_state
+    actions = legal_actions(game_state)
+
+    def expand_with_clones():
+        for action in actions:
+            child = copy.copy(controller)
+            child.game_state = game_state.clone()
+            apply_action(child, action)
+
+    def expand_in_place():
+        for action in actions:
+            checkpoint = game_state.checkpoint()
+            apply_action(controller, action)
+            game_state.rollback(checkpoint)
+
+    print(f"{len(actions)} legal actions")
+    for label, statement in [("clone + action", expand_with_clones), ("checkpoint + action + rollback", expand_in_place)]:
+        seconds = min(timeit.repeat(statement, number=NUMBER, repeat=3)) / NUMBER / len(actions)
+        print(f"{label:>30}: {seconds * 1e6:8.1f} us per action")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Measures legal_actions() at a decision point in the middle of a game: computed from scratch,
+as after a state change, and served from the cache, as for repeated queries in between.
+"""
+import timeit
+
+from common import ENERGIES, deck_lists
+
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+from ptcgp_sim.game.logic.actions import END_TURN, apply_action, legal_action_mask, legal_actions
+from ptcgp_sim.game.logic.game_controller import GameController
+from ptcgp_sim.setup.setup_player import setup_player
+
+
+NUMBER = 100_000
+
+
+def main():
+    grass, fire = deck_lists()
+    players = [
+        setup_player("A", Deck([Card(card_data) for card_data in grass]), ENERGIES),
+        setup_player("B", Deck([Card(card_data) for card_data in fire]), ENERGIES),
+    ]
+    controller = GameController(players)
+    controller.start_game()
+    apply_action(controller, END_TURN)
+    game_state = controller.game_state
+
+    def uncached():
+        game_state.legal_actions_cache = None
+        return legal_actions(game_state)
+
+    print(f"legal actions: {legal_actions(game_state)}")
+    for label, statement in [
+        ("after a state change", uncached),
+        ("legal_actions, cached", lambda: legal_actions(game_state)),
+        ("legal_action_mask, cached", lambda: legal_action_mask(game_state)),
+    ]:
+        seconds = min(timeit.repeat(statement, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{label:>26}: {seconds * 1e9:8.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
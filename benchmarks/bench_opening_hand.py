@@ -0,0 +1,58 @@
+"""
+Scores the opening bench of every deck with 1 to 20 Basics, repeated to 10,000 decks, exactly,
+against estimating it by dealing each deck like setup_player does: a search for a Basic
+Pokémon, then 4 draws from the shuffled Deck.
+"""
+import time
+
+import numpy as np
+
+from common import make_pokemon
+from ptcgp_sim.game.logic.rng import GameRandom
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+from ptcgp_sim.setup.opening_hand import OPENING_HAND_SIZE, bench_size, prob_seen_by_turn
+
+
+N_DECKS = 10_000
+SHUFFLES = 1_000  # Per deck, for the estimate
+
+
+BASIC = make_pokemon(1, "Bulbasaur", 70, [("GC", "Vine Whip", "40")])
+EVOLUTION = make_pokemon(2, "Ivysaur", 90, [("GC", "Vine Whip", "40")], stage="Stage 1")
+
+
+def estimate_bench(n_basics: int, rng: GameRandom) -> np.ndarray:
+    deck = Deck([Card(BASIC) for _ in range(n_basics)] + [Card(EVOLUTION) for _ in range(20 - n_basics)])
+    counts = np.zeros(4)
+    for _ in range(SHUFFLES):
+        deck.reset()
+        deck.shuffle(rng)
+        hand = [deck.draw_stage("Basic")] + [deck.draw() for _ in range(OPENING_HAND_SIZE - 1)]
+        basics = sum(card.stage == "Basic" for card in hand)
+        counts[min(basics - 1, 3)] += 1
+    return counts / SHUFFLES
+
+
+def main():
+    n_basics = np.arange(N_DECKS) % 20 + 1
+
+    start = time.perf_counter()
+    exact = bench_size(n_basics)
+    by_turn = prob_seen_by_turn(2, False, n_basics[:, None], np.arange(1, 11))
+    exact_seconds = time.perf_counter() - start
+
+    rng = GameRandom(0)
+    sample = 20
+    start = time.perf_counter()
+    estimates = np.array([estimate_bench(int(n), rng) for n in n_basics[:sample]])
+    estimate_seconds = (time.perf_counter() - start) * N_DECKS / sample
+
+    error = np.abs(estimates - exact[:sample]).max()
+    print(f"exact:    {N_DECKS:,} decks (bench sizes and 10 turns of draws) in {exact_seconds * 1000:.1f} ms")
+    print(f"estimate: {SHUFFLES:,} shuffles per deck, {estimate_seconds:.1f} s for {N_DECKS:,} decks "
+          f"(extrapolated), max error {error:.3f}")
+
+
+if __name__ == "__main__":
+    main()
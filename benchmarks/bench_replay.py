@@ -0,0 +1,52 @@
+"""
+Measures the replay format: bytes per recorded game, and the time to write, read and replay games.
+"""
+import io
+import time
+
+from common import ENERGIES, deck_lists
+
+from ptcgp_sim.sim.replay import ReplayWriter, read_replays, record_game
+from ptcgp_sim.sim.runner import MatchupConfig
+
+
+GAMES = 500
+
+
+def main():
+    grass, fire = deck_lists()
+    config = MatchupConfig(grass, fire, ENERGIES, ENERGIES, seed=1)
+    cards = {card_data.code: card_data for card_data in grass + fire}
+    energies = {energy.code: energy for energy in ENERGIES}
+
+    start = time.perf_counter()
+    replays = [record_game(config, game_index) for game_index in range(GAMES)]
+    record_seconds = time.perf_counter() - start
+
+    stream = io.BytesIO()
+    start = time.perf_counter()
+    writer = ReplayWriter(stream)
+    for replay in replays:
+        writer.write(replay)
+    write_seconds = time.perf_counter() - start
+
+    stream.seek(0)
+    start = time.perf_counter()
+    read = list(read_replays(stream))
+    read_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for replay in read:
+        replay.replay_to(cards, energies)
+    replay_seconds = time.perf_counter() - start
+
+    size = len(stream.getvalue())
+    actions = sum(len(replay.actions) for replay in replays)
+    print(f"{GAMES} games, {actions / GAMES:.1f} actions per game, {size:,} bytes ({size / GAMES:.1f} per game)")
+    for label, seconds in [("play + record", record_seconds), ("write", write_seconds),
+                           ("read", read_seconds), ("replay", replay_seconds)]:
+        print(f"{label:>14}: {seconds / GAMES * 1e6:8.1f} us per game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Measures the results store: appending game results one by one, and summarizing millions of
+records per deck. The records are synthetic, so no games are played.
+"""
+import tempfile
+import time
+
+import numpy as np
+
+from ptcgp_sim.sim.results import RESULT_DTYPE, ResultsStore, first_player_win_rate, summarize_decks
+from ptcgp_sim.sim.runner import GameResult
+
+
+APPENDS = 200_000
+RECORDS = 10_000_000
+DECKS = 200
+
+
+def main():
+    result = GameResult(winner=0, turns=14, first=1, points=(3, 1), knockouts=(3, 1), seed=12345)
+    with tempfile.TemporaryDirectory() as directory:
+        store = ResultsStore(directory)
+        start = time.perf_counter()
+        for i in range(APPENDS):
+            store.add(i % DECKS, (i + 1) % DECKS, result)
+        store.flush()
+        seconds = time.perf_counter() - start
+        print(f"add: {seconds / APPENDS * 1e9:6.0f} ns per game")
+
+    rng = np.random.default_rng(0)
+    records = np.zeros(RECORDS, dtype=RESULT_DTYPE)
+    records["deck_a"] = rng.integers(0, DECKS, RECORDS)
+    records["deck_b"] = rng.integers(0, DECKS, RECORDS)
+    records["winner"] = rng.integers(-1, 2, RECORDS)
+    records["first"] = rng.integers(0, 2, RECORDS)
+    start = time.perf_counter()
+    summarize_decks(records)
+    first_player_win_rate(records)
+    seconds = time.perf_counter() - start
+    print(f"summarize {RECORDS:,} games ({records.nbytes / 1e6:.0f} MB): {seconds * 1e3:6.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Measures how many games a racing tournament needs to find the strongest deck of a pool, against a
+round robin that gives every deck as many games as the winner of the race played.
+The decks differ only in how many hits their single attack needs to knock out a Pokémon, so the
+strongest deck is known.
+"""
+import math
+import time
+
+from common import ENERGIES, make_pokemon
+
+from ptcgp_sim.sim.tournament import run_tournament
+
+
+N_DECKS = 16
+HP = 240
+
+
+def main():
+    # Deck i knocks out a Pokémon in N_DECKS - i hits
+    decks = [[make_pokemon(300 + i, f"Mon {i}", HP, [("C", "Hit", str(math.ceil(HP / (N_DECKS - i))))])] * 20
+             for i in range(N_DECKS)]
+    energy_types = [ENERGIES] * N_DECKS
+
+    start = time.perf_counter()
+    result = run_tournament(decks, energy_types, n_winners=1, max_rounds=100, seed=0)
+    seconds = time.perf_counter() - start
+
+    winner = result.ranking[0]
+    round_robin = N_DECKS * int(result.games[winner]) // 2
+    print(f"{N_DECKS} decks: winner {winner} (strongest {N_DECKS - 1}) after {result.rounds} rounds, {seconds:.1f} s")
+    print(f"racing: {result.games_played:,} games, round robin at the winner's sample size: {round_robin:,} games")
+
+
+if __name__ == "__main__":
+    main()
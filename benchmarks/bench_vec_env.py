@@ -0,0 +1,39 @@
+"""
+Measures VecEnv throughput in game steps per second, with uniformly random legal actions,
+for several numbers of environments.
+"""
+import time
+
+import numpy as np
+
+from common import ENERGIES, deck_lists
+
+from ptcgp_sim.sim.vec_env import VecEnv
+
+
+ENV_COUNTS = [1, 16, 128]
+STEPS = 20_000  # Game steps per measurement, spread over the environments
+
+
+def main():
+    grass, fire = deck_lists()
+    rng = np.random.default_rng(0)
+    for num_envs in ENV_COUNTS:
+        env = VecEnv(num_envs, grass, fire, ENERGIES)
+        _, legal_masks = env.reset()
+        episodes = 0
+
+        start = time.perf_counter()
+        for _ in range(STEPS // num_envs):
+            # Pick a random legal action per game
+            scores = rng.random(legal_masks.shape) * legal_masks
+            _, _, dones, legal_masks = env.step(scores.argmax(axis=1))
+            episodes += int(dones.sum())
+        seconds = time.perf_counter() - start
+
+        steps = STEPS // num_envs * num_envs
+        print(f"{num_envs:>4} envs: {steps / seconds:10,.0f} steps/s  {episodes / seconds:8,.0f} games/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Compares hashing a game state from scratch with reading the incrementally maintained hash,
+and measures what keeping the hash current costs over a whole game played by two simple agents.
+"""
+import timeit
+
+from common import ENERGIES, deck_lists
+from bench_clone import mid_game_state
+
+from ptcgp_sim.game.logic import zobrist
+from ptcgp_sim.sim.runner import MatchupConfig, create_game, run_game
+
+
+NUMBER = 20_000
+GAMES = 1_000
+
+
+def main():
+    game_state = mid_game_state()
+    for label, statement in [
+        ("compute_hash(game_state)", lambda: zobrist.compute_hash(game_state)),
+        ("game_state.zobrist", lambda: game_state.zobrist),
+    ]:
+        seconds = min(timeit.repeat(statement, number=NUMBER, repeat=3)) / NUMBER
+        print(f"{label:>26}: {seconds * 1e6:8.2f} us")
+
+    grass, fire = deck_lists()
+    config = MatchupConfig(grass, fire, ENERGIES, ENERGIES)
+    for hashing in (False, True):
+        def play():
+            controller, _ = create_game(config, hashing=hashing)
+            run_game(controller, [config.agent_cls(), config.agent_cls()], config.max_turns)
+
+        seconds = min(timeit.repeat(play, number=GAMES, repeat=3)) / GAMES
+        print(f"{f'game, hashing={hashing}':>26}: {seconds * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmarks playing a card from hand: the membership test and removal on a list of cards, which
+compare dataclass Cards field by field, against a CardPile, which finds cards by identity.
+The card is the last of a 7-card hand of copies of the same Pokémon, the worst case for a list.
+"""
+import timeit
+
+from common import make_pokemon
+
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.zone import Bench, CardPile
+
+
+NUMBER = 200_000
+
+
+def main():
+    card_data = make_pokemon(1, "Bulbasaur", 70, [("GC", "Vine Whip", "40")])
+    cards = [Card(card_data) for _ in range(7)]
+    card = cards[-1]
+    as_list = list(cards)
+    as_pile = CardPile(cards)
+
+    def list_play():
+        if card in as_list:
+            as_list.remove(card)
+            as_list.append(card)
+
+    def pile_play():
+        if card in as_pile:
+            as_pile.remove(card)
+            as_pile.append(card)
+
+    for name, play in (("list", list_play), ("CardPile", pile_play)):
+        seconds = timeit.timeit(play, number=NUMBER)
+        print(f"{name:>10} contains + remove + append: {seconds / NUMBER * 1e9:7.0f} ns")
+
+    bench_list = [cards[0], None, cards[1]]
+    bench = Bench(3, bench_list)
+    for name, statement in (("list", "bench_list.index(None)"), ("Bench", "bench.first_free()")):
+        seconds = timeit.timeit(statement, globals=locals(), number=NUMBER)
+        print(f"{name:>10} first free spot:             {seconds / NUMBER * 1e9:7.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""
+Synthetic card data shared by the benchmarks, so that they run without a database. The cards
+come from tests/cards.py, so benchmarks and tests build the same cards. Run the benchmarks with
+the repository root and src on the path, e.g.
+
+    PYTHONPATH=.:src:benchmarks python benchmarks/bench_find_object.py
+"""
+from ptcgp_sim.models.card import CardData
+from tests.cards import ENERGIES, POKEMON, make_pokemon
+
+__all__ = ["ENERGIES", "POKEMON", "make_pokemon", "deck_lists"]
+
+
+def deck_lists() -> tuple[list[CardData], list[CardData]]:
+    """Two 20-card deck lists of Basic Pokémon."""
+    grass = [make_pokemon(100 + i, f"Grass Mon {i}", 60 + 10 * (i % 3), [("CC", "Tackle", "30")])
+             for i in range(10)]
+    fire = [make_pokemon(200 + i, f"Fire Mon {i}", 70, [("C", "Scratch", "20"), ("RCC", "Flare", "60")],
+                         energy_type=ENERGIES[1]) for i in range(10)]
+    return grass * 2, fire * 2
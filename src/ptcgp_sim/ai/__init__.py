@@ -0,0 +1 @@
+from .simple_ai_controller import SimpleAIController
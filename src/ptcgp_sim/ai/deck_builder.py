@@ -0,0 +1,242 @@
+"""
+A genetic deck builder: evolves 20-card decks from a pool of cards, e.g. a Collection's cards.
+
+A deck's fitness is its score against a gauntlet of opponent decks: wins plus half of the draws,
+over games_per_opponent games against each opponent, going first in half of them. Every
+candidate plays the same seeded games (common random numbers), so fitness differences come from
+the decks and not from the luck of the draw, and a deck's fitness is a pure function of its
+cards. It is cached by the deck's canonical form, its sorted card ids, so a deck that comes up
+again in a later generation costs nothing. Candidates are evaluated in a process pool.
+
+Each generation keeps the best decks (elitism) and fills the rest of the population with
+children of parents chosen by tournament selection: a crossover of the parents' cards, then a
+mutation that swaps a few cards for cards from the pool. Children are repaired to be legal:
+20 cards, at most MAX_COPIES cards of a name, and at least one Basic Pokémon, as setup_player requires.
+"""
+from __future__ import annotations
+import os
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
+
+from ptcgp_sim.ai.simple_ai_controller import SimpleAIController
+from ptcgp_sim.sim.pool import ConfigPool
+from ptcgp_sim.sim.results import play_game_records
+from ptcgp_sim.sim.runner import DEFAULT_MAX_TURNS, MatchupConfig
+
+if TYPE_CHECKING:
+    from ptcgp_sim.models.card import CardData
+    from ptcgp_sim.models.energy import Energy
+
+
+DECK_SIZE = 20
+MAX_COPIES = 2  # Cards of the same name allowed in a deck
+
+
+def canonical_deck(deck: Iterable[CardData]) -> tuple[int, ...]:
+    """The deck's card ids in sorted order: the same for every ordering of the same cards."""
+    return tuple(sorted(card_data.id for card_data in deck))
+
+
+def is_legal_deck(deck: list[CardData]) -> bool:
+    """Checks the deck size, the copy limit and that the deck has a Basic Pokémon."""
+    return (
+        len(deck) == DECK_SIZE
+        and max(Counter(card_data.name for card_data in deck).values()) <= MAX_COPIES
+        and any(card_data.stage == "Basic" for card_data in deck)
+    )
+
+
+@dataclass
+class Opponent:
+    """A deck of the gauntlet."""
+    deck: list[CardData]
+    energy_types: list[Energy]
+
+
+@dataclass
+class FitnessConfig:
+    """Everything the workers need to score decks against the gauntlet."""
+    cards: dict[int, CardData]  # The pool by id, so tasks only carry card ids
+    gauntlet: list[Opponent]
+    energy_types: list[Energy]
+    games_per_opponent: int
+    seed: int
+    max_turns: int = DEFAULT_MAX_TURNS
+    agent_cls: type = SimpleAIController
+
+
+def evaluate_deck(config: FitnessConfig, deck_ids: tuple[int, ...]) -> float:
+    """The deck's score against the gauntlet, between 0 and 1."""
+    deck = [config.cards[card_id] for card_id in deck_ids]
+    score = 0.0
+    games = 0
+    for index, opponent in enumerate(config.gauntlet):
+        matchup = MatchupConfig(
+            deck_a=deck,
+            deck_b=opponent.deck,
+            energy_types_a=config.energy_types,
+            energy_types_b=opponent.energy_types,
+            max_turns=config.max_turns,
+            agent_cls=config.agent_cls,
+            seed=config.seed,
+        )
+        # Games are numbered per opponent, the same for every candidate
+        records = play_game_records(matchup, index * config.games_per_opponent, config.games_per_opponent)
+        winner = records["winner"]
+        score += (winner == 0).sum() + 0.5 * (winner == -1).sum()
+        games += len(records)
+    return float(score) / games if games else 0.0
+
+
+@dataclass
+class EvolutionResult:
+    """The best deck found, and how the search went."""
+    best_deck: list[CardData]
+    best_fitness: float
+    generations: int
+    best_fitness_per_generation: list[float] = field(default_factory=list)
+    evaluations: int = 0  # Decks actually simulated
+    cache_hits: int = 0  # Decks whose fitness came from the cache
+
+
+class DeckBuilder:
+    """
+    Evolves decks from a pool of cards against a gauntlet. Decks are lists of CardData.
+    The pool should hold one CardData per card, e.g. collection.cards.values().
+    """
+
+    def __init__(
+            self,
+            card_pool: Iterable[CardData],
+            gauntlet: list[Opponent],
+            energy_types: list[Energy],
+            games_per_opponent: int = 20,
+            max_turns: int = DEFAULT_MAX_TURNS,
+            workers: int | None = None,
+            seed: int = 0,
+    ):
+        if games_per_opponent % 2:
+            raise ValueError("games_per_opponent must be even, so that both decks go first equally often.")
+        self.cards = {card_data.id: card_data for card_data in card_pool}
+        self.basics = [card_data for card_data in self.cards.values() if card_data.stage == "Basic"]
+        if not self.basics:
+            raise ValueError("The card pool must contain at least one Basic Pokémon.")
+        if len({card_data.name for card_data in self.cards.values()}) * MAX_COPIES < DECK_SIZE:
+            raise ValueError(f"The card pool is too small for a {DECK_SIZE}-card deck.")
+        self.fitness_config = FitnessConfig(self.cards, gauntlet, energy_types, games_per_opponent, seed, max_turns)
+        self.workers = workers or os.cpu_count() or 1
+        self.rng = random.Random(seed)
+        # Fitness of every deck evaluated so far, by canonical deck
+        self.fitness_cache: dict[tuple[int, ...], float] = {}
+        self.evaluations = 0
+        self.cache_hits = 0
+
+    # --- Variation ---
+
+    def random_deck(self) -> list[CardData]:
+        """A legal deck of random cards from the pool."""
+        return self.repair([self.rng.choice(self.basics)])
+
+    def repair(self, cards: list[CardData]) -> list[CardData]:
+        """
+        Makes a deck legal: drops cards over MAX_COPIES of a name and over DECK_SIZE, fills up with
+        random cards from the pool, and swaps in a Basic Pokémon if there is none.
+        """
+        rng = self.rng
+        counts: Counter[str] = Counter()
+        deck = []
+        for card_data in cards:
+            if counts[card_data.name] < MAX_COPIES and len(deck) < DECK_SIZE:
+                counts[card_data.name] += 1
+                deck.append(card_data)
+
+        pool = list(self.cards.values())
+        while len(deck) < DECK_SIZE:
+            card_data = rng.choice(pool)
+            if counts[card_data.name] < MAX_COPIES:
+                counts[card_data.name] += 1
+                deck.append(card_data)
+
+        if not any(card_data.stage == "Basic" for card_data in deck):
+            # The deck has no Basic, so any Basic fits the copy limit
+            deck[rng.randrange(DECK_SIZE)] = rng.choice(self.basics)
+        return deck
+
+    def crossover(self, parent_a: list[CardData], parent_b: list[CardData]) -> list[CardData]:
+        """A child of random cards from both parents: their cards, shuffled together, and repaired."""
+        cards = parent_a + parent_b
+        self.rng.shuffle(cards)
+        return self.repair(cards)
+
+    def mutate(self, deck: list[CardData], n_cards: int = 2) -> list[CardData]:
+        """Swaps n_cards random cards of the deck for random cards from the pool."""
+        deck = deck.copy()
+        for _ in range(n_cards):
+            del deck[self.rng.randrange(len(deck))]
+        return self.repair(deck)
+
+    # --- Fitness ---
+
+    def fitness(self, decks: list[list[CardData]], pool: ConfigPool | None = None) -> list[float]:
+        """
+        The fitness of each deck, simulating only the decks that are not in the cache yet, in this
+        process or in a ConfigPool of self.fitness_config.
+        """
+        keys = [canonical_deck(deck) for deck in decks]
+        missing = list(dict.fromkeys(key for key in keys if key not in self.fitness_cache))
+        self.cache_hits += len(keys) - len(missing)
+        if missing:
+            if pool is not None:
+                scores = pool.map(evaluate_deck, missing, chunksize=max(1, len(missing) // (self.workers * 2)))
+            else:
+                scores = [evaluate_deck(self.fitness_config, key) for key in missing]
+            self.fitness_cache.update(zip(missing, scores))
+            self.evaluations += len(missing)
+        return [self.fitness_cache[key] for key in keys]
+
+    # --- Search ---
+
+    def evolve(
+            self,
+            generations: int = 20,
+            population_size: int = 32,
+            elite: int = 4,
+            tournament_size: int = 3,
+            mutation_cards: int = 2,
+            initial: list[list[CardData]] | None = None,
+    ) -> EvolutionResult:
+        """Evolves a population of decks, starting from `initial` decks and random ones, and returns the best."""
+        population = [self.repair(list(deck)) for deck in (initial or [])][:population_size]
+        while len(population) < population_size:
+            population.append(self.random_deck())
+
+        with ConfigPool(self.fitness_config, self.workers) as pool:
+            scores = self.fitness(population, pool)
+            history = [max(scores)]
+            for _ in range(generations):
+                ranked = sorted(range(population_size), key=scores.__getitem__, reverse=True)
+                children = [population[i] for i in ranked[:elite]]
+                while len(children) < population_size:
+                    parent_a = self._select(population, scores, tournament_size)
+                    parent_b = self._select(population, scores, tournament_size)
+                    children.append(self.mutate(self.crossover(parent_a, parent_b), mutation_cards))
+                population = children
+                scores = self.fitness(population, pool)
+                history.append(max(scores))
+
+        best = max(range(population_size), key=scores.__getitem__)
+        return EvolutionResult(
+            best_deck=population[best],
+            best_fitness=scores[best],
+            generations=generations,
+            best_fitness_per_generation=history,
+            evaluations=self.evaluations,
+            cache_hits=self.cache_hits,
+        )
+
+    def _select(self, population: list[list[CardData]], scores: list[float], tournament_size: int) -> list[CardData]:
+        """Tournament selection: the fittest of a few random decks."""
+        contenders = self.rng.sample(range(len(population)), tournament_size)
+        return population[max(contenders, key=scores.__getitem__)]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ptcgp_sim.game.logic.game_controller import GameController
+
+
+class SimpleAIController:
+    """
+    A scripted, greedy player. On its turn it:
+        1. Plays every Basic Pokémon in hand to the bench (while there is room).
+        2. Attaches the available energy to its active Pokémon.
+        3. Attacks with the strongest attack it can afford, which ends the turn.
+    If it cannot attack, it ends the turn.
+    """
+
+    def take_turn(self, controller: GameController):
+        """Plays one full turn for the current player through the controller's public API."""
+        game_state = controller.game_state
+        player = game_state.current_player
+
+        # 1. Fill the bench with Basics
+        for card in list(player.hand):
+            if player.is_bench_full():
+                break
+            if card.card_data.stage == "Basic":
+                controller.request_play_card_to_bench(card.instance_id)
+
+        # 2. Attach energy to the active Pokémon
+        if player.active_pokemon and player.energy_zone and player.energy_zone.current:
+            controller.request_attach_energy(player.active_pokemon.instance_id)
+
+        # 3. Attack if possible. The first player cannot attack on the first turn.
+        defender = game_state.opponent.active_pokemon
+        if player.active_pokemon and defender and game_state.turn_number > 1:
+            attacks = player.active_pokemon.get_available_attacks()
+            if attacks:
+                attack = max(attacks, key=lambda a: a.get_damage())
+                # The controller ends the turn after the attack
+                controller.request_attack(player.active_pokemon.instance_id, defender.instance_id, attack)
+                return
+
+        controller.request_end_turn()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-from ptcgp_sim.game.logic.events import GameEvent, AttackDeclaredEvent, DamageDealtEvent, TurnEndEvent
+from ptcgp_sim.game.logic.events import (
+    GameEvent, AttackDeclaredEvent, DamageDealtEvent, TurnEndEvent, CardDiedEvent, CardDrawnEvent
+)
+from ptcgp_sim.game.logic import trace
 
 if TYPE_CHECKING:
     from ptcgp_sim.game.logic.game_state import GameState
@@ -16,6 +19,11 @@ class ActionResolver:
     """
     Handles complex, multi-stage game actions by orchestrating
     the creation of events and the application of effects.
+
+    Effects do not resolve knockouts themselves: a Pokémon whose HP drops to 0 is pushed onto
+    the game state's knockout queue, which each resolution step drains once, at its end. All the
+    Pokémon knocked out by the step leave play together, then their CardDiedEvents fire and the
+    game checks whether it is over.
     """
 
     def __init__(self, rule_engine: RuleEngine):
@@ -25,10 +33,11 @@ class ActionResolver:
 
     def resolve_attack(self, game_state: GameState, attacker: Card, defender: Card, attack: Attack):
         """Orchestrates the entire combat sequence."""
-        print(f"\n--- Resolving Attack: {attacker.name} vs {defender.name} ---")
+        if trace.enabled:
+            trace.emit("RESOLVER", "attack", attacker=attacker.name, defender=defender.name, attack=attack.name)
 
         # 1. Announce the attack
-        attack_event = AttackDeclaredEvent(attacker, defender, attack)
+        attack_event = AttackDeclaredEvent(attacker, defender, attack, game_state.event_ids.allocate())
         # Process rules that trigger on attack declaration (e.g., "Taunt")
         self.process_and_apply_effects(attack_event, game_state)
 
@@ -36,47 +45,109 @@ class ActionResolver:
         damage_amount = attack.get_damage()
 
         # 3. Create and process damage event
-        damage_event = DamageDealtEvent(source=attacker, target=defender, amount=damage_amount)
+        damage_event = DamageDealtEvent(attacker, defender, damage_amount, game_state.event_ids.allocate())
         self.process_and_apply_effects(damage_event, game_state)
 
-        # In a real game, the defender would also attack back.
-        print("--- Attack Resolution Complete ---")
+        # 4. Resolve knockouts and award points
+        self.resolve_knockouts(game_state)
+
+    def resolve_knockouts(self, game_state: GameState):
+        """
+        Drains the game's knockout queue: removes every queued Pokémon from play, refills the active spots
+        left empty, fires a CardDiedEvent for each Pokémon and checks once whether the game is over.
+        Knockouts caused by the CardDiedEvents' own effects are resolved in a following batch.
+        """
+        queue = game_state.knockout_queue
+        if not queue:
+            return
+        while queue:
+            knocked_out: list[tuple[Card, Player]] = []
+            # A Pokémon damaged twice in a step is queued once, and a queued one that left play is skipped
+            for card in {id(card): card for card in queue}.values():
+                owner = game_state.find_owner(card)
+                if owner is not None and owner.knock_out(card):
+                    knocked_out.append((card, owner))
+            queue.clear()
+
+            for owner in {id(owner): owner for _, owner in knocked_out}.values():
+                owner.fill_active_spot()
+
+            for card, owner in knocked_out:
+                if trace.enabled:
+                    trace.emit("RESOLVER", "knockout", card=card.name, owner=owner.name)
+                died_event = CardDiedEvent(card, owner, game_state.event_ids.allocate())
+                self.process_and_apply_effects(died_event, game_state)
+
+        game_state.check_game_over()
 
     def resolve_end_turn(self, game_state: GameState):
         """
         Resolves the end of a player's turn.
         For now, simply advance the game state to the next player's turn.
         """
-        print(f"\n--- Resolving End Turn for Player: {game_state.current_player.name} ---")
+        if trace.enabled:
+            trace.emit("RESOLVER", "end_turn", player=game_state.current_player.name)
 
         # Process any end-of-turn effects
-        end_turn_event = TurnEndEvent(player=game_state.current_player)
+        end_turn_event = TurnEndEvent(game_state.current_player, game_state.event_ids.allocate())
         self.process_and_apply_effects(end_turn_event, game_state)
+        self.resolve_knockouts(game_state)
 
         # Advance the turn
         game_state.advance_turn()
-        print("--- End Turn Resolution Complete ---")
+
+    def resolve_start_turn(self, game_state: GameState):
+        """
+        Resolves the start of the current player's turn: the energy zone advances
+        and the player draws a card. The first player gets no energy on the first turn.
+        """
+        player = game_state.current_player
+        player.start_turn(first_turn=game_state.turn_number == 1)
+
+        self.resolve_draw(game_state, player)
+
+    def resolve_attach_energy(self, game_state: GameState, player: Player, target: Card) -> bool:
+        """Attaches the energy currently in the player's energy zone to one of their Pokémon in play."""
+        if target is player.active_pokemon:
+            player.attach_energy("active")
+            return True
+
+        for bench_index, card in enumerate(player.bench):
+            if card is target:
+                player.attach_energy("bench", bench_index)
+                return True
+
+        if trace.enabled:
+            trace.emit("RESOLVER", "invalid_energy_target", player=player.name, target=target.name)
+        return False
+
+    def resolve_retreat(self, game_state: GameState, player: Player, bench_index: int) -> bool:
+        """Retreats the player's active Pokémon and promotes the Pokémon on the given bench spot."""
+        if trace.enabled:
+            trace.emit("RESOLVER", "retreat", player=player.name, bench_index=bench_index)
+        return player.retreat(bench_index)
 
     def resolve_draw(self, game_state: GameState, player: Player):
         """
         Resolves the draw phase for a player.
         This is where the player draws cards from their deck.
         """
-        print(f"\n--- Resolving Draw Phase for Player: {player.name} ---")
-
         # Draw a card
         drawn_card = player.draw_card()
         if drawn_card:
-            print(f"{player.name} drew {drawn_card.name}.")
+            if trace.enabled:
+                trace.emit("RESOLVER", "draw", player=player.name, card=drawn_card.name)
             # Process any effects that trigger on drawing a card
-            self.process_and_apply_effects(drawn_card.on_draw_event(), game_state)
-        else:
-            print(f"{player.name} cannot draw a card; their deck is empty.")
-
-        print("--- Draw Phase Resolution Complete ---")
+            draw_event = CardDrawnEvent(player, drawn_card, game_state.event_ids.allocate())
+            self.process_and_apply_effects(draw_event, game_state)
+        elif trace.enabled:
+            trace.emit("RESOLVER", "draw_failed", player=player.name, deck_size=len(player.deck))
 
     def process_and_apply_effects(self, event: GameEvent, game_state: GameState):
-        """Helper to process an event with the rule engine and apply resulting effects."""
+        """
+        Helper to process an event with the rule engine and apply resulting effects.
+        Knockouts the effects cause are queued, to be resolved by resolve_knockouts.
+        """
         effects = self.rule_engine.process_event(event, game_state)
         for effect in effects:
             effect.apply(game_state)
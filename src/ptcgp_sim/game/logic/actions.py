@@ -0,0 +1,121 @@
+"""
+Integer action ids for the decisions a player makes during their turn.
+
+The action space has a fixed size, N_ACTIONS, so that agents can use the ids as indices, e.g.
+into a policy vector or a legal-action mask. Actions are relative to the current player:
+
+    END_TURN                      end the turn
+    ATTACK + j                    attack the opponent's active Pokémon with attack j of the active Pokémon
+    ATTACH_ENERGY + slot          attach the energy zone's energy to the active Pokémon (slot 0)
+                                  or to the Pokémon on bench spot slot - 1
+    PLAY_TO_BENCH + i             play the Basic Pokémon at index i of the hand to the bench
+    RETREAT + i                   retreat the active Pokémon and promote the Pokémon on bench spot i
+
+legal_actions() and legal_action_mask() are cached on the GameState. The cache is reset by every
+change that can affect what is legal: cards changing zones, energy being attached or removed,
+the turn passing and the game ending.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from ptcgp_sim.game.objects.player import MAX_BENCH_SIZE, MAX_HAND_SIZE
+
+if TYPE_CHECKING:
+    from ptcgp_sim.game.logic.game_controller import GameController
+    from ptcgp_sim.game.logic.game_state import GameState
+
+
+MAX_ATTACKS = 2  # Attacks per Pokémon
+
+END_TURN = 0
+ATTACK = END_TURN + 1
+ATTACH_ENERGY = ATTACK + MAX_ATTACKS
+PLAY_TO_BENCH = ATTACH_ENERGY + 1 + MAX_BENCH_SIZE
+RETREAT = PLAY_TO_BENCH + MAX_HAND_SIZE
+N_ACTIONS = RETREAT + MAX_BENCH_SIZE
+
+
+def legal_actions(game_state: GameState) -> tuple[int, ...]:
+    """Returns the ids of the actions the current player may take, in increasing order."""
+    cache = game_state.legal_actions_cache
+    if cache is None:
+        cache = game_state.legal_actions_cache = _compute_legal_actions(game_state)
+    return cache[0]
+
+
+def legal_action_mask(game_state: GameState) -> int:
+    """Returns the current player's legal actions as a bitmask: bit i is set if action i is legal."""
+    cache = game_state.legal_actions_cache
+    if cache is None:
+        cache = game_state.legal_actions_cache = _compute_legal_actions(game_state)
+    return cache[1]
+
+
+def is_legal(game_state: GameState, action: int) -> bool:
+    return 0 <= action < N_ACTIONS and legal_action_mask(game_state) >> action & 1 == 1
+
+
+def _compute_legal_actions(game_state: GameState) -> tuple[tuple[int, ...], int]:
+    if game_state.is_game_over:
+        return (), 0
+
+    player = game_state.current_player
+    active = player.active_pokemon
+    actions = [END_TURN]
+
+    # The first player cannot attack on the first turn
+    defender = game_state.opponent.active_pokemon
+    if active is not None and defender is not None and game_state.turn_number > 1:
+        available = active.get_available_attacks()
+        for index, attack in enumerate(active.card_data.attacks[:MAX_ATTACKS]):
+            if attack in available:
+                actions.append(ATTACK + index)
+
+    if player.energy_zone is not None and player.energy_zone.current is not None:
+        if active is not None:
+            actions.append(ATTACH_ENERGY)
+        for index, card in enumerate(player.bench):
+            if card is not None:
+                actions.append(ATTACH_ENERGY + 1 + index)
+
+    if None in player.bench:
+        for index, card in enumerate(player.hand):
+            if card.card_data.stage == "Basic":
+                actions.append(PLAY_TO_BENCH + index)
+
+    for index in range(MAX_BENCH_SIZE):
+        if player.can_retreat(index):
+            actions.append(RETREAT + index)
+
+    mask = 0
+    for action in actions:
+        mask |= 1 << action
+    return tuple(actions), mask
+
+
+def apply_action(controller: GameController, action: int) -> bool:
+    """
+    Takes an action for the current player through the controller's public API.
+    Returns False, without changing the game, if the action is not legal.
+    """
+    game_state = controller.game_state
+    if not is_legal(game_state, action):
+        return False
+
+    player = game_state.current_player
+    if action == END_TURN:
+        controller.request_end_turn()
+    elif action < ATTACH_ENERGY:
+        attacker = player.active_pokemon
+        defender = game_state.opponent.active_pokemon
+        attack = attacker.card_data.attacks[action - ATTACK]
+        controller.request_attack(attacker.instance_id, defender.instance_id, attack)
+    elif action < PLAY_TO_BENCH:
+        slot = action - ATTACH_ENERGY
+        target = player.active_pokemon if slot == 0 else player.bench[slot - 1]
+        controller.request_attach_energy(target.instance_id)
+    elif action < RETREAT:
+        controller.request_play_card_to_bench(player.hand[action - PLAY_TO_BENCH].instance_id)
+    else:
+        controller.request_retreat(action - RETREAT)
+    return True
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
-import uuid
+
+from ptcgp_sim.game.logic import trace
 
 if TYPE_CHECKING:
     from ptcgp_sim.game.logic.game_state import GameState
@@ -18,13 +19,17 @@ class Effect:
     This makes the change explicit and loggable.
     It separates the decision to do something (the Rule) from the act of doing it (the Effect),
     which is a powerful separation of concerns.
+
+    While the game is journaling (see GameState.checkpoint), an effect that changes a field directly
+    must record how to undo it in game_state.journal before the change. Changes made through
+    Player methods are journaled by the player.
     """
     def apply(self, game_state: GameState):
         """Applies the effect to the given game state."""
         raise NotImplementedError("Subclasses must implement the apply method.")
 
 class DealDamageEffect(Effect):
-    def __init__(self, target_id: uuid.UUID, amount: int, source_id: uuid.UUID | None = None):
+    def __init__(self, target_id: int, amount: int, source_id: int | None = None):
         self.target_id = target_id
         self.amount = amount
         self.source_id = source_id
@@ -33,11 +38,18 @@ class DealDamageEffect(Effect):
         target = game_state.find_object_by_id(self.target_id)
         if target and hasattr(target, 'take_damage'):
             # In a real implementation, you would queue a DamageDealtEvent here.
+            previous_hp = target.current_hp
+            if game_state.journal is not None:
+                game_state.journal.record(setattr, target, "current_hp", previous_hp)
             target.take_damage(self.amount)
-            print(f"[EFFECT] Dealt {self.amount} damage to {target.name}.")
+            game_state.on_hp_changed(target, previous_hp)
+            if previous_hp > 0 and target.current_hp <= 0:
+                game_state.knockout_queue.append(target)
+            if trace.enabled:
+                trace.emit("EFFECT", "deal_damage", target=target.name, amount=self.amount)
 
 class DrawCardEffect(Effect):
-    def __init__(self, player_id: uuid.UUID, count: int = 1):
+    def __init__(self, player_id: int, count: int = 1):
         self.player_id = player_id
         self.count = count
 
@@ -45,4 +57,20 @@ class DrawCardEffect(Effect):
         player = game_state.find_object_by_id(self.player_id)
         if player:
             player.draw_cards(self.count)
-            print(f"[EFFECT] Player {player.name} drew {self.count} card(s).")
+            if trace.enabled:
+                trace.emit("EFFECT", "draw_cards", player=player.name, count=self.count)
+
+class AwardPointsEffect(Effect):
+    def __init__(self, player_id: int, points: int = 1):
+        self.player_id = player_id
+        self.points = points
+
+    def apply(self, game_state: GameState):
+        player = game_state.find_object_by_id(self.player_id)
+        if player:
+            if game_state.journal is not None:
+                game_state.journal.record(setattr, player, "points", player.points)
+            player.points += self.points
+            game_state.on_points_changed(player)
+            if trace.enabled:
+                trace.emit("EFFECT", "award_points", player=player.name, points=self.points, total=player.points)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from datetime import datetime
-import uuid
 
 # Use a forward reference to avoid circular imports. Python's type checker
 # will resolve this at type-checking time.
@@ -11,46 +10,84 @@ if TYPE_CHECKING:
     from ptcgp_sim.game.objects.card import Card
     from ptcgp_sim.game.objects.player import Player
 
+
 class GameEvent:
-    """Base class for all events in the game."""
-    def __init__(self):
-        self.event_id = uuid.uuid4()
-        self.timestamp = datetime.now()
-        self.name = self.__class__.__name__
+    """
+    Base class for all events in the game.
+    Events get increasing integer ids from the event_ids allocator of their GameState, which is
+    passed in where the event is created; events created outside a game have id -1. They are
+    only timestamped when record_timestamps is turned on, since reading the clock for every
+    event is expensive in batch simulations.
+
+    Events are slotted and their name is a class attribute, so creating one only
+    allocates the instance itself. Subclasses must declare __slots__ for their fields.
+    """
+    __slots__ = ("event_id", "timestamp")
+    name: str = "GameEvent"
+    record_timestamps: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.name = cls.__name__
+
+    def __init__(self, event_id: int = -1):
+        self.event_id = event_id
+        self.timestamp = datetime.now() if GameEvent.record_timestamps else None
 
     def __repr__(self) -> str:
         return f"<{self.name}>"
 
 class TurnStartEvent(GameEvent):
     """Fired at the very beginning of a turn."""
-    def __init__(self, player: Player):
-        super().__init__()
+    __slots__ = ("player",)
+
+    def __init__(self, player: Player, event_id: int = -1):
+        super().__init__(event_id)
         self.player = player
 
 class TurnEndEvent(GameEvent):
     """Fired at the end of a player's turn."""
-    def __init__(self, player: Player):
-        super().__init__()
+    __slots__ = ("player",)
+
+    def __init__(self, player: Player, event_id: int = -1):
+        super().__init__(event_id)
+        self.player = player
+
+class CardDrawnEvent(GameEvent):
+    """Fired after a player draws a card from their deck."""
+    __slots__ = ("player", "card")
+
+    def __init__(self, player: Player, card: Card, event_id: int = -1):
+        super().__init__(event_id)
         self.player = player
+        self.card = card
 
 class AttackDeclaredEvent(GameEvent):
     """Fired when a player declares an intention to attack."""
-    def __init__(self, attacker: Card, defender: Card, attack: Attack):
-        super().__init__()
+    __slots__ = ("attacker", "defender", "attack")
+
+    def __init__(self, attacker: Card, defender: Card, attack: Attack, event_id: int = -1):
+        super().__init__(event_id)
         self.attacker = attacker
         self.defender = defender
         self.attack = attack
 
 class DamageDealtEvent(GameEvent):
     """Fired after damage is calculated and applied."""
-    def __init__(self, source: Card | None, target: Card | Player, amount: int):
-        super().__init__()
+    __slots__ = ("source", "target", "amount")
+
+    def __init__(self, source: Card | None, target: Card | Player, amount: int, event_id: int = -1):
+        super().__init__(event_id)
         self.source = source
         self.target = target
         self.amount = amount
 
 class CardDiedEvent(GameEvent):
     """Fired when a card's health is reduced to 0 or less."""
-    def __init__(self, card: Card):
-        super().__init__()
+    __slots__ = ("card", "owner")
+
+    def __init__(self, card: Card, owner: Player | None = None, event_id: int = -1):
+        super().__init__(event_id)
         self.card = card
+        self.owner = owner
+
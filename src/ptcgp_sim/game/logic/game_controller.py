@@ -1,67 +1,137 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
-import uuid
+from typing import TYPE_CHECKING, Callable
 
 from ptcgp_sim.game.logic.game_state import GameState
 from ptcgp_sim.game.logic.rule_engine import RuleEngine
 from ptcgp_sim.game.logic.action_resolver import ActionResolver
 from ptcgp_sim.game.logic.game_log import GameLog
+from ptcgp_sim.game.logic import trace
+from ptcgp_sim.game.logic.actions import ATTACH_ENERGY, ATTACK, END_TURN, MAX_ATTACKS, PLAY_TO_BENCH, RETREAT, is_legal
 from ptcgp_sim.game.logic.events import TurnStartEvent
 
 if TYPE_CHECKING:
     from ptcgp_sim.game.objects.player import Player
+    from ptcgp_sim.game.logic.rng import GameRandom
 
 
 class GameController:
     """
     The central mediator and public API for the game logic. It receives high-level
     commands and uses its child components to execute them.
+
+    The action listener, if set, is called with the action id (see game.logic.actions) of every
+    request that is a legal action, before the request is carried out, e.g. to record a replay.
     """
 
-    def __init__(self, players: list[Player]):
-        self.game_state = GameState(players)
+    def __init__(
+            self, players: list[Player], hashing: bool = True,
+            rng: GameRandom | None = None, game_log: GameLog | None = None, game_id: int = 0,
+    ):
+        self.game_state = GameState(players, hashing, rng, game_id)
         self.rule_engine = RuleEngine()
         self.action_resolver = ActionResolver(self.rule_engine)
-        self.game_log = GameLog()
-        print("GameController initialized.")
+        self.game_log = game_log if game_log is not None else GameLog()
+        self.action_listener: Callable[[int], None] | None = None
+        if trace.enabled:
+            trace.emit("CONTROLLER", "initialized", game_id=self.game_state.game_id)
 
     def start_game(self):
         """Starts the game and the first turn."""
-        print("===== GAME START =====")
+        if trace.enabled:
+            trace.emit("CONTROLLER", "game_start", game_id=self.game_state.game_id)
         self.start_turn()
 
     def start_turn(self):
         """Begins the current player's turn."""
         player = self.game_state.current_player
-        print(f"\n--- Turn {self.game_state.turn_number}: {player.name}'s Turn ---")
+        if trace.enabled:
+            trace.emit("CONTROLLER", "turn_start", turn=self.game_state.turn_number, player=player.name)
+
+        # Advance the energy zone and draw a card
+        self.action_resolver.resolve_start_turn(self.game_state)
 
         # Create and log the event
-        event = TurnStartEvent(player)
-        self.game_log.log_event(event)
+        event = TurnStartEvent(player, self.game_state.event_ids.allocate())
+        if self.game_log:
+            self.game_log.log_event(event)
 
         # Process any "start of turn" rules
-        effects = self.rule_engine.process_event(event, self.game_state)
-        for effect in effects:
-            effect.apply(self.game_state)
+        self.action_resolver.process_and_apply_effects(event, self.game_state)
+        self.action_resolver.resolve_knockouts(self.game_state)
 
     def request_end_turn(self):
         """
         Public method for a player to request the end of their turn.
         The UI/AI layer would call this when the player is done with their actions.
         """
-        print(f"[CONTROLLER] {self.game_state.current_player.name} has ended their turn.")
+        if trace.enabled:
+            trace.emit("CONTROLLER", "end_turn_requested", player=self.game_state.current_player.name)
+        if self.action_listener is not None:
+            self._notify_action(END_TURN)
+        self._end_turn()
 
+    def _end_turn(self):
         # 1. Increment turn number and switch players
-        self.game_state.turn_number += 1
-        self.game_state.current_player_index = (self.game_state.current_player_index + 1) % len(self.game_state.players)
+        self.action_resolver.resolve_end_turn(self.game_state)
 
         # 2. Start the next player's turn
-        self.start_turn()
+        if not self.game_state.is_game_over:
+            self.start_turn()
 
-    def request_attack(self, attacker_id: uuid.UUID, defender_id: uuid.UUID, attack):
+    def request_play_card_to_bench(self, card_id: int) -> bool:
+        """
+        Public method for the current player to play a Basic Pokémon from their hand to the bench.
+        """
+        player = self.game_state.current_player
+        card = self.game_state.find_object_by_id(card_id)
+        if self.action_listener is not None:
+            for index, card_in_hand in enumerate(player.hand):
+                if card_in_hand is card:
+                    self._notify_action(PLAY_TO_BENCH + index)
+                    break
+
+        if card is None or card.card_data.stage != "Basic":
+            if trace.enabled:
+                trace.emit("CONTROLLER", "invalid_request", request="play_card_to_bench", card_id=card_id)
+            return False
+
+        return player.play_card_to_bench(card)
+
+    def request_attach_energy(self, target_id: int) -> bool:
+        """
+        Public method for the current player to attach the energy from their energy zone
+        to one of their Pokémon in play.
+        """
+        player = self.game_state.current_player
+        target = self.game_state.find_object_by_id(target_id)
+        if self.action_listener is not None and target is not None:
+            for slot, card in enumerate((player.active_pokemon, *player.bench)):
+                if card is target:
+                    self._notify_action(ATTACH_ENERGY + slot)
+                    break
+
+        if target is None or player.energy_zone is None or player.energy_zone.current is None:
+            if trace.enabled:
+                trace.emit("CONTROLLER", "invalid_request", request="attach_energy", target_id=target_id)
+            return False
+
+        return self.action_resolver.resolve_attach_energy(self.game_state, player, target)
+
+    def request_retreat(self, bench_index: int) -> bool:
+        """
+        Public method for the current player to retreat their active Pokémon,
+        switching it with the Pokémon on the given bench spot.
+        """
+        player = self.game_state.current_player
+        if self.action_listener is not None:
+            self._notify_action(RETREAT + bench_index)
+        return self.action_resolver.resolve_retreat(self.game_state, player, bench_index)
+
+    def request_attack(self, attacker_id: int, defender_id: int, attack):
         """
         Public method for a player to request an attack.
         The UI/AI layer would call this with the instance_ids of the cards.
+        Attacking ends the player's turn.
         """
         # 1. Validation
         attacker = self.game_state.find_object_by_id(attacker_id)
@@ -69,9 +139,27 @@ class GameController:
 
         # Add checks: Is it the right player's turn? Can the card attack?
         if not all([attacker, defender]):
-            print("[CONTROLLER] Invalid attack request: Card(s) not found.")
+            if trace.enabled:
+                trace.emit("CONTROLLER", "invalid_request", request="attack",
+                           attacker_id=attacker_id, defender_id=defender_id)
             return
+        if self.action_listener is not None:
+            for index, known_attack in enumerate(attacker.card_data.attacks[:MAX_ATTACKS]):
+                if known_attack is attack:
+                    self._notify_action(ATTACK + index)
+                    break
+            else:
+                # An attack with no action id can't be recorded, so it must not run either
+                raise ValueError(f"{attack.name} is not one of the first {MAX_ATTACKS} attacks of {attacker.name}")
 
         # 2. Delegation
         # The controller doesn't know the details of combat; it tells the resolver to handle it.
         self.action_resolver.resolve_attack(self.game_state, attacker, defender, attack)
+
+        # 3. An attack ends the turn
+        if not self.game_state.is_game_over:
+            self._end_turn()
+
+    def _notify_action(self, action: int):
+        if is_legal(self.game_state, action):
+            self.action_listener(action)
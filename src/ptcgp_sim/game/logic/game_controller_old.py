@@ -46,10 +46,7 @@ class GameController:
         """
         Handles a player's request to play a card from their hand to the bench.
         """
-        card_played = player.play_card_to_bench(hand_index, bench_index)
-
-        if card_played:
-            card_played.subscribe_to_death(self.game_master_card_death_handler)
+        player.play_card_to_bench(hand_index, bench_index)
 
     def request_attack(self, attacker: Card, defender: Card):
         """
@@ -112,12 +109,6 @@ class GameController:
         self.log.log(f"=== {player.name}'s turn ends ===\n")
         self.turn += 1
 
-    def game_master_card_death_handler(self, dead_card):
-        """
-        Handles the death of a card, which may trigger abilities or game events.
-        """
-        dead_card.unsubscribe_from_death(self.game_master_card_death_handler)
-
     def game_over(self) -> bool:
         return any((not player.has_cards()) or player.points >= 3 for player in self.players)
 
@@ -1,39 +1,71 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from collections import deque
+from typing import TYPE_CHECKING, TextIO
 from datetime import datetime
 import abc
+import json
+import time
 
 if TYPE_CHECKING:
     from ptcgp_sim.game.logic.events import GameEvent
 
 
+DEFAULT_CHUNK_SIZE = 1_000  # Entries a streaming log holds before writing them to its sink
+
+
 class BaseLogEntry(abc.ABC):
     """Abstract base class for any item that can be logged."""
+    __slots__ = ("time",)
+
     def __init__(self):
-        self.timestamp = datetime.now()
+        self.time = time.time()  # Seconds since the epoch; cheaper to take than a datetime
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.time)
 
     @abc.abstractmethod
     def get_display_message(self) -> str:
         """Returns the formatted string for this log entry."""
         pass
 
+    @abc.abstractmethod
+    def to_dict(self) -> dict:
+        """Returns the entry as a JSON-serializable dict, for streaming to a file."""
+        pass
+
     def __lt__(self, other):
         """Allows sorting by timestamp."""
-        return self.timestamp < other.timestamp
+        return self.time < other.time
 
 
 class TextEntry(BaseLogEntry):
-    """An entry that represents a simple text message."""
-    def __init__(self, message: str):
+    """
+    An entry that represents a simple text message.
+    The message may be a %-style template; it is only formatted with args when it is read.
+    """
+    __slots__ = ("template", "args")
+
+    def __init__(self, message: str, args: tuple = ()):
         super().__init__()
-        self.message = message
+        self.template = message
+        self.args = args
+
+    @property
+    def message(self) -> str:
+        return self.template % self.args if self.args else self.template
 
     def get_display_message(self) -> str:
         return self.message
 
+    def to_dict(self) -> dict:
+        return {"time": self.time, "kind": "text", "message": self.message}
+
 
 class EventEntry(BaseLogEntry):
     """An entry that represents a game event."""
+    __slots__ = ("event",)
+
     def __init__(self, event: GameEvent):
         super().__init__()
         self.event = event
@@ -41,24 +73,57 @@ class EventEntry(BaseLogEntry):
     def get_display_message(self) -> str:
         return str(self.event)  # Relies on the event's __repr__
 
+    def to_dict(self) -> dict:
+        return {"time": self.time, "kind": "event", "event": type(self.event).__name__,
+                "message": self.get_display_message()}
+
 
 class GameLog:
     """
     Records a chronological history of events that have occurred in a game.
     Also allows for simple text entries to be logged.
-    """
-    def __init__(self):
-        self.entries: list[BaseLogEntry] = []
 
-    def log_message(self, message: str):
-        """Adds a simple text message to the log."""
-        entry = TextEntry(message=message)
+    By default the log keeps every entry. It can instead keep only the last max_entries entries,
+    or stream its entries to a text file sink as JSON lines, chunk_size entries at a time, keeping
+    only the entries not written yet. Call flush() to write those before closing the sink.
+    Use NullGameLog to log nothing at all.
+    """
+    def __init__(self, max_entries: int | None = None, sink: TextIO | None = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if max_entries is not None and sink is not None:
+            raise ValueError("A log either keeps its last entries or streams them to a sink, not both.")
+        self.entries: list[BaseLogEntry] | deque[BaseLogEntry] = (
+            deque(maxlen=max_entries) if max_entries is not None else []
+        )
+        self.sink = sink
+        self.chunk_size = chunk_size
+        self.entries_written = 0  # Entries streamed to the sink so far
+
+    def _add(self, entry: BaseLogEntry):
         self.entries.append(entry)
+        if self.sink is not None and len(self.entries) >= self.chunk_size:
+            self.flush()
+
+    def log_message(self, message: str, *args):
+        """
+        Adds a simple text message to the log. Pass values to interpolate as args
+        (e.g. log_message("%s drew %s", name, card.name)) so the message is only formatted when read.
+        The args are kept until then, so pass values that do not change, like names and numbers,
+        never game objects such as a Card, whose state the message would show as of when it is read.
+        """
+        self._add(TextEntry(message, args))
 
     def log_event(self, event: GameEvent):
         """Wraps a GameEvent and adds it to the log."""
-        entry = EventEntry(event)
-        self.entries.append(entry)
+        self._add(EventEntry(event))
+
+    def flush(self):
+        """Writes the entries kept in memory to the sink, if the log has one, and forgets them."""
+        if self.sink is None or not self.entries:
+            return
+        self.sink.write("".join(json.dumps(entry.to_dict()) + "\n" for entry in self.entries))
+        self.entries_written += len(self.entries)
+        self.entries.clear()
 
     def display(self):
         """Prints the log entries in chronological order."""
@@ -73,3 +138,24 @@ class GameLog:
 
     def __str__(self):
         return "\n".join(f"[{e.timestamp.strftime('%H:%M:%S')}] {e.get_display_message()}" for e in self.entries)
+
+
+class NullGameLog(GameLog):
+    """
+    A log that discards everything. It is falsy, so code that checks `if log:` before logging,
+    like Player, skips building the entry at all.
+    """
+    def __init__(self):
+        super().__init__(max_entries=0)
+
+    def _add(self, entry: BaseLogEntry):
+        pass
+
+    def log_message(self, message: str, *args):
+        pass
+
+    def log_event(self, event: GameEvent):
+        pass
+
+    def __bool__(self):
+        return False
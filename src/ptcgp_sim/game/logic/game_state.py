@@ -2,48 +2,338 @@
 # Why it's standard: It creates a "single source of truth." The GameController and RuleEngine act upon the GameState but don't own it. This makes your logic much cleaner and easier to test—you can create a GameState object representing a specific scenario and pass it to your logic functions.
 from __future__ import annotations
 from typing import TYPE_CHECKING
-import uuid
+
+from ptcgp_sim.game.objects.ids import IdAllocator
+from ptcgp_sim.game.objects.zone import Zone
+from ptcgp_sim.models.energy import ENERGY_INDEX
+from ptcgp_sim.game.logic import trace, zobrist
+from ptcgp_sim.game.logic.journal import Checkpoint, Journal
+from ptcgp_sim.game.logic.rng import GameRandom
 
 if TYPE_CHECKING:
     from ptcgp_sim.game.objects.player import Player
     from ptcgp_sim.game.objects.card import Card
+    from ptcgp_sim.models.energy import Energy
+
 
+WINNING_POINTS = 3  # Points needed to win the game
 
 class GameState:
     """
     A container for the entire state of a single game. This object is the
     "single source of truth" that logic functions read from and modify.
+
+    With hashing on, the state carries a 64-bit Zobrist hash in `zobrist`, see game.logic.zobrist.
+    Games that are only played out, such as in the batch runner, can turn it off to save its upkeep.
+
+    A search can explore moves in place instead of on clones: take a checkpoint(), play, then
+    rollback() to it, see game.logic.journal. The game logs are not rolled back.
     """
 
-    def __init__(self, players: list[Player]):
-        self.game_id = uuid.uuid4()
+    def __init__(
+            self, players: list[Player], hashing: bool = True, rng: GameRandom | None = None, game_id: int = 0,
+    ):
+        # Set by whoever starts the game, e.g. its index in a matchup, to tell games apart in traces
+        self.game_id = game_id
         self.players = players
+        # The game's random number generator, normally the one the players were set up with
+        self.rng = rng if rng is not None else GameRandom()
         self.current_player_index = 0
         self.turn_number = 1
         self.is_game_over = False
+        self.winner: Player | None = None
+
+        # Every player and card in the game gets a small integer id, starting at 0 for the first player.
+        self.ids = IdAllocator()
+        for player in players:
+            player.instance_id = self.ids.allocate()
+        # The instance_id of the owner of every player and card, by instance_id
+        self._owners: list[int] = [player.instance_id for player in players]
+        for player in players:
+            for card in player.all_cards():
+                card.instance_id = self.ids.allocate()
+                self._owners.append(player.instance_id)
+        # A change counter for every player and card, by instance_id. The hooks below bump a card's
+        # counter when it moves or its hp or energy change, and a player's when their counters
+        # (zone sizes, points, energy zone) may have changed, so readers such as sim.encoder can
+        # skip what did not change. They only ever increase, even on rollback().
+        self.versions: list[int] = [0] * self.ids.next_id
+        # Events get ids of their own, see game.logic.events
+        self.event_ids = IdAllocator()
+
+        # The undo journal, from the first checkpoint until stop_journal()
+        self.journal: Journal | None = None
+
+        # Pokémon knocked out by effects, waiting for ActionResolver.resolve_knockouts
+        self.knockout_queue: list[Card] = []
+
+        # Index of every player and card in the game by instance_id, and the zone each card is in.
+        # Players keep it current by reporting every card that changes zones.
+        self._objects: dict[int, Player | Card] = {}
+        self._zones: dict[int, Zone] = {}
+        self.hashing = hashing
+        self._positions: dict[int, int] = {}  # Zone and bench spot, see zobrist.position
+        self.zobrist: int | None = 0 if hashing else None
+        for player in players:
+            self._index_player(player)
+
+        # The current player's legal actions as (action ids, bitmask), see game.logic.actions.
+        # Computed on demand and reset by every change that can affect what is legal.
+        self.legal_actions_cache: tuple[tuple[int, ...], int] | None = None
+
+        # The hash is kept current by the players' listeners, the effects and the methods below.
+        # Indexing the players has added the positions of the cards already.
+        self._player_keys: dict[int, int] = {}
+        self._turn_key = 0
+        if hashing:
+            self._player_keys = {player.instance_id: zobrist.player_key(player) for player in players}
+            self._turn_key = zobrist.turn_key(self)
+            self.zobrist += self._turn_key + sum(self._player_keys.values())
+            for player in players:
+                for card in player.all_cards():
+                    if card.current_hp != card.max_hp or card.attached_energy:
+                        self.zobrist += zobrist.card_state_keys(card)
+            self.zobrist &= zobrist.MASK
+
+        if trace.enabled:
+            trace.emit("GAME STATE", "created", game_id=self.game_id, players=[p.name for p in players])
+
+    def clone(self) -> GameState:
+        """
+        Returns an independent copy of the game for search and rollouts. Only the mutable per-game
+        state is copied: zones, hp, attached energy, energy zones, points and turn counters.
+        Card data is shared, and the copy keeps the instance ids of the original.
+        Players in the copy have no log.
+        """
+        memo: dict[int, Player | Card] = {}
+        copy = GameState.__new__(GameState)
+        copy.game_id = self.game_id
+        copy.players = [player.clone(memo) for player in self.players]
+        copy.current_player_index = self.current_player_index
+        copy.turn_number = self.turn_number
+        copy.is_game_over = self.is_game_over
+        copy.winner = memo[self.winner.instance_id] if self.winner is not None else None
+        copy.ids = IdAllocator(self.ids.next_id)
+        copy._owners = self._owners  # Never changes after __init__
+        copy.versions = self.versions.copy()
+        copy.event_ids = IdAllocator(self.event_ids.next_id)
+
+        # The copy draws the same numbers as the original, from generators of its own
+        rngs = {id(self.rng): self.rng.clone()}
+        copy.rng = rngs[id(self.rng)]
+        for player in copy.players:
+            if player.energy_zone is not None:
+                rng = player.energy_zone.rng
+                if id(rng) not in rngs:
+                    rngs[id(rng)] = rng.clone()
+                player.energy_zone.rng = rngs[id(rng)]
+
+        # Every object of the game is in the memo, under the same id as in the original.
+        copy._objects = memo
+        copy._zones = self._zones.copy()
+        copy._positions = self._positions.copy()
+        for player in copy.players:
+            copy._listen_to(player)
+        copy.legal_actions_cache = self.legal_actions_cache
+        copy.hashing = self.hashing
+        copy.zobrist = self.zobrist
+        copy._player_keys = self._player_keys.copy()
+        copy._turn_key = self._turn_key
+        copy.journal = None
+        copy.knockout_queue = [memo[card.instance_id] for card in self.knockout_queue]
+        return copy
+
+    def checkpoint(self) -> Checkpoint:
+        """
+        Marks the current state of the game, to return to it with rollback(). From the first checkpoint
+        on, every change to the game is journaled until stop_journal(). Checkpoints can be nested.
+        """
+        if self.journal is None:
+            self._set_journal(Journal())
+        return Checkpoint(self.journal.mark())
+
+    def rollback(self, checkpoint: Checkpoint):
+        """
+        Undoes every change since the checkpoint, including draws from the game's random number generators.
+        Checkpoints taken after it can no longer be rolled back to.
+        """
+        self.journal.undo_to(checkpoint.position)
+        # The undo bypasses the hooks, and anything may have changed
+        self.versions = [version + 1 for version in self.versions]
+
+    def stop_journal(self):
+        """Stops journaling changes. Earlier checkpoints can no longer be rolled back to."""
+        self._set_journal(None)
+
+    def _set_journal(self, journal: Journal | None):
+        self.journal = journal
+        self.rng.journal = journal
+        for player in self.players:
+            player.journal = journal
+            if player.energy_zone is not None:
+                player.energy_zone.rng.journal = journal
+
+    def _save(self):
+        if self.journal is not None:
+            self.journal.save(self)
 
-        print(f"GameState created for game {self.game_id}.")
+    def snapshot(self) -> tuple:
+        """The turn, outcome, zone index and hash of the game, for the undo journal."""
+        return (
+            self.current_player_index, self.turn_number, self.is_game_over, self.winner,
+            self.legal_actions_cache, self._zones.copy(), self._positions.copy(),
+            self.zobrist, self._player_keys.copy(), self._turn_key,
+        )
+
+    def restore(self, snapshot: tuple):
+        """Restores the state saved by snapshot()."""
+        (self.current_player_index, self.turn_number, self.is_game_over, self.winner,
+         self.legal_actions_cache, self._zones, self._positions,
+         self.zobrist, self._player_keys, self._turn_key) = snapshot
 
     @property
     def current_player(self) -> Player:
         return self.players[self.current_player_index]
 
+    @property
+    def opponent(self) -> Player:
+        return self.players[(self.current_player_index + 1) % len(self.players)]
+
+    def opponent_of(self, player: Player) -> Player:
+        """Returns the other player in a two-player game."""
+        return self.players[1] if player is self.players[0] else self.players[0]
+
     def advance_turn(self):
-        """Advances the game to the next player's turn."""
+        """Advances the game to the next player's turn. Every player's turn counts as one turn."""
+        self._save()
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
-        if self.current_player_index == 0:
-            # If we wrapped around, increment the turn number
-            self.turn_number += 1
+        self.turn_number += 1
+        self.legal_actions_cache = None
+        self._rehash_turn()
+
+    def check_game_over(self) -> bool:
+        """
+        Checks the win conditions and records the winner, if any.
+        A player wins by reaching WINNING_POINTS, or when their opponent has no Pokémon left in play.
+        """
+        if self.is_game_over:
+            return True
+
+        for player in self.players:
+            opponent = self.opponent_of(player)
+            if player.points >= WINNING_POINTS or not opponent.has_cards():
+                self._save()
+                self.is_game_over = True
+                self.winner = player
+                self.legal_actions_cache = None
+                self._rehash_turn()
+                return True
+        return False
+
+    def end_in_draw(self):
+        """Ends the game without a winner (e.g. when a turn limit is reached)."""
+        self._save()
+        self.is_game_over = True
+        self.winner = None
+        self.legal_actions_cache = None
+        self._rehash_turn()
+
+    def _index_player(self, player: Player):
+        """Adds a player and all of their cards to the object index and subscribes to their card moves."""
+        self._objects[player.instance_id] = player
+        for card in player.deck:
+            self._on_card_moved(card, Zone.DECK)
+        for card in player.hand:
+            self._on_card_moved(card, Zone.HAND)
+        if player.active_pokemon is not None:
+            self._on_card_moved(player.active_pokemon, Zone.ACTIVE)
+        for slot, card in enumerate(player.bench):
+            if card is not None:
+                self._on_card_moved(card, Zone.BENCH, slot)
+        for card in player.discard_pile:
+            self._on_card_moved(card, Zone.DISCARD)
+        self._listen_to(player)
+
+    def _listen_to(self, player: Player):
+        player.zone_listener = self._on_card_moved
+        player.energy_listener = self._on_energy_changed
+        player.state_listener = self._on_player_changed
 
-    def find_object_by_id(self, object_id: uuid.UUID) -> Player | Card | None:
-        """Searches all players and their zones for an object with the given ID."""
+    def _on_card_moved(self, card: Card, zone: Zone, slot: int = 0):
+        self._save()
+        instance_id = card.instance_id
+        self._objects[instance_id] = card
+        self._zones[instance_id] = zone
+        self.legal_actions_cache = None
+        self.versions[instance_id] += 1
+        self.versions[self._owners[instance_id]] += 1
+        if not self.hashing:
+            return
+
+        position = zone * 8 + slot  # zobrist.position
+        previous = self._positions.get(instance_id, 0)
+        if previous != position:
+            self._positions[instance_id] = position
+            self.zobrist = (self.zobrist + zobrist.position_key(instance_id, position)
+                            - zobrist.position_key(instance_id, previous)) & zobrist.MASK
+
+    def _on_energy_changed(self, card: Card, energy: Energy, delta: int):
+        self._save()
+        self.legal_actions_cache = None
+        self.versions[card.instance_id] += 1
+        if self.hashing:
+            self.zobrist = (self.zobrist + delta * zobrist.energy_key(card, ENERGY_INDEX[energy.code])) & zobrist.MASK
+
+    def _on_player_changed(self, player: Player):
+        """Rehashes a player's points, energy zone and retreat flag."""
+        self._save()
+        self.legal_actions_cache = None
+        self.versions[player.instance_id] += 1
+        if self.hashing:
+            key = zobrist.player_key(player)
+            self.zobrist = (self.zobrist + key - self._player_keys[player.instance_id]) & zobrist.MASK
+            self._player_keys[player.instance_id] = key
+
+    def _rehash_turn(self):
+        if not self.hashing:
+            return
+        key = zobrist.turn_key(self)
+        self.zobrist = (self.zobrist + key - self._turn_key) & zobrist.MASK
+        self._turn_key = key
+
+    def on_points_changed(self, player: Player):
+        """Call after changing a player's points, to keep the hash current."""
+        self._on_player_changed(player)
+
+    def on_hp_changed(self, card: Card, previous_hp: int):
+        """Call after changing a card's hp, to keep the hash and the versions current."""
+        if card.current_hp == previous_hp:
+            return
+        self.versions[card.instance_id] += 1
+        if self.hashing:
+            self._save()
+            instance_id, max_hp = card.instance_id, card.max_hp
+            self.zobrist = (self.zobrist + zobrist.hp_key(instance_id, max_hp, card.current_hp)
+                            - zobrist.hp_key(instance_id, max_hp, previous_hp)) & zobrist.MASK
+
+    def find_object_by_id(self, object_id: int) -> Player | Card | None:
+        """
+        Returns the player, or the card in play, in hand or in a discard pile, with the given ID.
+        Cards still in a deck are hidden. This is a constant-time lookup in the object index.
+        """
         # This is a critical utility for effects and rules to find their targets.
+        obj = self._objects.get(object_id)
+        if obj is None or self._zones.get(object_id) is Zone.DECK:
+            return None
+        return obj
+
+    def zone_of(self, card: Card) -> Zone | None:
+        """Returns the zone the given card is in, or None if the card is not part of this game."""
+        return self._zones.get(card.instance_id)
+
+    def find_owner(self, card: Card) -> Player | None:
+        """Returns the player that has the given card in play (active or bench)."""
         for player in self.players:
-            if player.instance_id == object_id:
+            if player.active_pokemon is card or card in player.bench:
                 return player
-
-            for zone in player.all_zones:
-                for card in zone:
-                    if card is not None and card.instance_id == object_id:
-                        return card
         return None
@@ -0,0 +1,57 @@
+"""
+An undo journal, for searching a game in place instead of cloning it for every node.
+
+While a GameState is journaling, every change to it is recorded with what it takes to undo it:
+
+    - effects record the inverse of what they change directly, e.g. the hp before damage
+    - players, cards and the game state save their own fields the first time they change after a
+      checkpoint, so a player's zones are copied once per checkpoint rather than on every move
+
+GameState.checkpoint() marks a point in the journal, and GameState.rollback(checkpoint) undoes every
+change recorded since, newest first. The game's random number generator saves its state like the
+other objects, so draws are undone too.
+"""
+from __future__ import annotations
+from typing import Callable, NamedTuple
+
+
+class Checkpoint(NamedTuple):
+    """A point in a game's journal to roll back to."""
+    position: int
+
+
+class Journal:
+    """A stack of undo entries, each a function and the arguments to call it with."""
+    __slots__ = ("entries", "_saved")
+
+    def __init__(self):
+        self.entries: list[tuple[Callable, tuple]] = []
+        # Objects whose fields have been saved since the last checkpoint or rollback
+        self._saved: set[int] = set()
+
+    def record(self, undo: Callable, *args):
+        """Records a change, undone by calling undo(*args)."""
+        self.entries.append((undo, args))
+
+    def save(self, obj):
+        """
+        Saves the fields of an object that is about to change, unless they have been saved since the
+        last checkpoint. The object must provide snapshot() and restore(snapshot).
+        """
+        key = id(obj)
+        if key not in self._saved:
+            self._saved.add(key)
+            self.entries.append((obj.restore, (obj.snapshot(),)))
+
+    def mark(self) -> int:
+        """Starts a new checkpoint: objects must save their fields again when they next change."""
+        self._saved.clear()
+        return len(self.entries)
+
+    def undo_to(self, position: int):
+        """Undoes the entries after position, newest first."""
+        entries = self.entries
+        while len(entries) > position:
+            undo, args = entries.pop()
+            undo(*args)
+        self._saved.clear()
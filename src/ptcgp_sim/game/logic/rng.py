@@ -0,0 +1,110 @@
+"""
+Per-game random number generators.
+
+Every game draws its randomness from its own GameRandom: deck shuffles, energy zone rolls, the
+choice of energy zone types and coin flips. A game seeded with for_game(master_seed, game_index)
+is reproducible from those two numbers alone, so a batch of games can be stored as a seed and
+rerun game by game, and seed ranges can be split across processes without coordination.
+
+The generators are Mersenne Twisters like the `random` module's. Their state is large, so a
+GameRandom caches it between draws, and a clone only loads it before its first draw. Saving the
+state for the undo journal or cloning a game is then cheap while nothing is drawn, which is most
+of a game since energy zones roll ahead in bulk.
+"""
+from __future__ import annotations
+import random
+from typing import TYPE_CHECKING, Sequence, TypeVar
+
+if TYPE_CHECKING:
+    from ptcgp_sim.game.logic.journal import Journal
+
+
+T = TypeVar("T")
+
+MASK = (1 << 64) - 1
+
+
+def derive_seed(master_seed: int, game_index: int) -> int:
+    """The seed of game game_index of a batch, mixed from the master seed so nearby seeds are unrelated."""
+    x = (master_seed * 0x9E3779B97F4A7C15 + game_index) & MASK
+    # splitmix64 finalizer
+    x = (x + 0x9E3779B97F4A7C15) & MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK
+    return x ^ (x >> 31)
+
+
+class GameRandom(random.Random):
+    """
+    The random number generator of a single game. Without a seed, it is seeded from the
+    operating system like random.Random().
+
+    While the game is journaling, the generator saves its state in the journal before its first
+    draw after a checkpoint, see GameState.checkpoint.
+    """
+
+    def __init__(self, seed: int | None = None):
+        self._state = None
+        self._loaded = True  # False for a clone whose state is still only in _state
+        self.journal: Journal | None = None
+        super().__init__(seed)
+
+    @classmethod
+    def for_game(cls, master_seed: int, game_index: int) -> GameRandom:
+        """The generator of game game_index of a batch seeded with master_seed."""
+        return cls(derive_seed(master_seed, game_index))
+
+    def seed(self, a=None, version: int = 2):
+        self._state = None
+        self._loaded = True
+        super().seed(a, version)
+
+    def _before_draw(self):
+        if self.journal is not None:
+            self.journal.save(self)
+        if not self._loaded:
+            super().setstate(self._state)
+            self._loaded = True
+        self._state = None
+
+    def random(self) -> float:
+        self._before_draw()
+        return super().random()
+
+    def getrandbits(self, k: int) -> int:
+        self._before_draw()
+        return super().getrandbits(k)
+
+    def getstate(self) -> tuple:
+        if self._state is None:
+            self._state = super().getstate()
+        return self._state
+
+    def setstate(self, state: tuple):
+        super().setstate(state)
+        self._state = state
+        self._loaded = True
+
+    # The undo journal saves and restores the generator like any other game object
+    snapshot = getstate
+    restore = setstate
+
+    def clone(self) -> GameRandom:
+        """Returns a generator in the same state, which goes on to draw the same numbers."""
+        copy = GameRandom.__new__(GameRandom)
+        copy.journal = None
+        copy._state = self.getstate()
+        copy._loaded = False
+        copy.gauss_next = None
+        return copy
+
+    def flip_coin(self) -> bool:
+        """Flips a coin. True is heads."""
+        return self.random() < 0.5
+
+    def roll_many(self, options: Sequence[T], count: int) -> tuple[T, ...]:
+        """Draws count options uniformly at random, with replacement, in one go."""
+        self._before_draw()
+        draw = super().random
+        n = len(options)
+        return tuple([options[int(draw() * n)] for _ in range(count)])
@@ -1,11 +1,12 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+from ptcgp_sim.game.logic.events import GameEvent
+from ptcgp_sim.game.logic import trace
 from ptcgp_sim.game.logic.rules.base_rule import Rule
-from ptcgp_sim.game.logic.rules.damage_rules import BaseDamageRule
+from ptcgp_sim.game.logic.rules.damage_rules import BaseDamageRule, KnockoutPointsRule
 
 if TYPE_CHECKING:
-    from ptcgp_sim.game.logic.events import GameEvent
     from ptcgp_sim.game.logic.effects import Effect
     from ptcgp_sim.game.logic.game_state import GameState
 
@@ -14,34 +15,76 @@ class RuleEngine:
     """
     The brain of the game's logic. It holds all active rules and processes
     events to determine which rules' actions should be executed.
+
+    Rules are dispatched through a table that maps each event class to the rules
+    subscribed to it (see Rule.event_types), so an event is only checked against
+    the rules that care about it.
     """
 
     def __init__(self):
-        self.rules: list[Rule] = []
+        self._rules: list[Rule] = []
+        self._dispatch: dict[type[GameEvent], list[Rule]] = {}
         self._load_rules()
 
+    @property
+    def rules(self) -> tuple[Rule, ...]:
+        """The rules in evaluation order. Change them with add_rule or by assigning a new list."""
+        return tuple(self._rules)
+
+    @rules.setter
+    def rules(self, rules: list[Rule]):
+        self._rules = list(rules)
+        self._build_dispatch_table()
+
+    def add_rule(self, rule: Rule):
+        """Adds a rule to the engine. Rules are evaluated in the order they were added."""
+        self._rules.append(rule)
+        self._build_dispatch_table()
+
     def _load_rules(self):
         """Loads all the rule objects into the engine."""
         # In a real system, you would discover and instantiate rules automatically
         # or from a configuration file.
-        # self.rules.append(VengefulSpiritRule())
+        # self.add_rule(VengefulSpiritRule())
         self.rules = [
             BaseDamageRule(),
+            KnockoutPointsRule(),
         ]
-        print(f"\nRule engine loaded {len(self.rules)} rules.")
+        if trace.enabled:
+            trace.emit("RULE ENGINE", "rules_loaded", count=len(self.rules))
+
+    def _build_dispatch_table(self):
+        """Precomputes the rules for every known event class, keeping the order of the rules."""
+        self._dispatch = {}
+        event_classes = [GameEvent]
+        while event_classes:
+            event_cls = event_classes.pop()
+            self._rules_for(event_cls)
+            event_classes.extend(event_cls.__subclasses__())
+
+    def _rules_for(self, event_cls: type[GameEvent]) -> list[Rule]:
+        """Returns the rules subscribed to an event class or any of its base classes."""
+        rules = self._dispatch.get(event_cls)
+        if rules is None:
+            # An event class defined after the table was built
+            rules = [rule for rule in self._rules if issubclass(event_cls, rule.event_types)]
+            self._dispatch[event_cls] = rules
+        return rules
 
     def process_event(self, event: GameEvent, game_state: GameState) -> list[Effect]:
         """
-        Takes an event, evaluates it against all rules, and returns a list
-        of effects from all the rules that were triggered.
+        Takes an event, evaluates it against the rules subscribed to its type, and returns
+        a list of effects from all the rules that were triggered.
         """
         triggered_effects: list[Effect] = []
-        print(f"[RULE ENGINE] Processing event: {event.name}")
+        if trace.enabled:
+            trace.emit("RULE ENGINE", "process_event", event=event.name)
 
-        for rule in self.rules:
+        for rule in self._rules_for(type(event)):
             if rule.condition(event, game_state):
                 effects = rule.action(event, game_state)
                 triggered_effects.extend(effects)
-                print(f"[RULE ENGINE] Rule '{rule.__class__.__name__}' triggered.")
+                if trace.enabled:
+                    trace.emit("RULE ENGINE", "rule_triggered", rule=rule.__class__.__name__, event=event.name)
 
         return triggered_effects
\ No newline at end of file
@@ -20,8 +20,9 @@ Why it's standard:
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+from ptcgp_sim.game.logic.events import GameEvent
+
 if TYPE_CHECKING:
-    from ptcgp_sim.game.logic.events import GameEvent
     from ptcgp_sim.game.logic.effects import Effect
     from ptcgp_sim.game.logic.game_state import GameState
 
@@ -29,7 +30,12 @@ class Rule:
     """
     Abstract base class for a single game rule.
     A rule is a piece of logic that says: "IF a condition is met, THEN produce these effects."
+
+    A rule only receives events of the types it subscribes to in event_types (including subclasses),
+    so its condition never has to filter on the event type. By default, a rule receives every event.
     """
+    event_types: tuple[type[GameEvent], ...] = (GameEvent,)
+
     def condition(self, event: GameEvent, game_state: GameState) -> bool:
         """
         Determines if this rule should be triggered by the given event and game state.
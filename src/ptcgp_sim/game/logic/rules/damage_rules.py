@@ -2,12 +2,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 # Import the necessary components from the logic layer
+from ptcgp_sim.game.logic import trace
 from ptcgp_sim.game.logic.rules.base_rule import Rule
-from ptcgp_sim.game.logic.events import DamageDealtEvent  # This is the primary event we listen for
-from ptcgp_sim.game.logic.effects import Effect, DealDamageEffect
+from ptcgp_sim.game.logic.events import DamageDealtEvent, CardDiedEvent  # These are the primary events we listen for
+from ptcgp_sim.game.logic.effects import Effect, DealDamageEffect, AwardPointsEffect
 
 if TYPE_CHECKING:
-    from ptcgp_sim.game.logic.events import GameEvent
     from ptcgp_sim.game.logic.game_state import GameState
 
 
@@ -23,19 +23,47 @@ class BaseDamageRule(Rule):
     This might seem redundant, but it decouples the *announcement* of damage
     from the *application* of damage, allowing other rules to intercept and modify it.
     """
+    event_types = (DamageDealtEvent,)
 
-    def condition(self, event: GameEvent, game_state: GameState) -> bool:
+    def condition(self, event: DamageDealtEvent, game_state: GameState) -> bool:
         # This rule triggers whenever damage is dealt to a card.
-        return isinstance(event, DamageDealtEvent) and hasattr(event.target, 'card_data')
+        return hasattr(event.target, 'card_data')
 
     def action(self, event: DamageDealtEvent, game_state: GameState) -> list[Effect]:
         # The action is to create an effect that formally applies the damage.
         # In a more advanced system, this effect might be intercepted again.
-        print(f"[RULE] BaseDamageRule: Applying {event.amount} damage to {event.target.name}.")
+        if trace.enabled:
+            trace.emit("RULE", "BaseDamageRule", target=event.target.name, amount=event.amount)
         return [
             DealDamageEffect(
                 target_id=event.target.instance_id,
                 amount=event.amount,
                 source_id=event.source.instance_id if event.source else None
             )
-        ]
\ No newline at end of file
+        ]
+
+
+# -----------------------------------------------------------------------------
+# 2. KNOCKOUTS: AWARDING POINTS
+# -----------------------------------------------------------------------------
+
+EX_RULE_NAME = "ex"  # Name of the rule that makes a Pokémon worth 2 points
+
+
+class KnockoutPointsRule(Rule):
+    """
+    Awards points to the opponent of a player whose Pokémon was knocked out.
+    A Pokémon ex is worth 2 points, any other Pokémon is worth 1.
+    """
+    event_types = (CardDiedEvent,)
+
+    def condition(self, event: CardDiedEvent, game_state: GameState) -> bool:
+        return event.owner is not None
+
+    def action(self, event: CardDiedEvent, game_state: GameState) -> list[Effect]:
+        rule = event.card.rule
+        points = 2 if rule is not None and rule.name == EX_RULE_NAME else 1
+        opponent = game_state.opponent_of(event.owner)
+        if trace.enabled:
+            trace.emit("RULE", "KnockoutPointsRule", card=event.card.name, player=opponent.name, points=points)
+        return [AwardPointsEffect(player_id=opponent.instance_id, points=points)]
@@ -0,0 +1,83 @@
+"""
+Tracing for the game engine.
+
+Engine components report what they are doing through this module instead of printing.
+Tracing is off by default. Every call site checks `trace.enabled` before it builds a record,
+so while tracing is off nothing is formatted or emitted:
+
+    from ptcgp_sim.game.logic import trace
+
+    if trace.enabled:
+        trace.emit("CARD", "take_damage", card=self.name, amount=amount, hp=self.current_hp)
+
+Turn tracing on by installing a sink, e.g. `trace.set_sink(PrintSink())` to print every record,
+or `trace.set_sink(ListSink())` to collect them for a test or a debugging session.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Any, NamedTuple
+
+
+class TraceRecord(NamedTuple):
+    """A structured trace record: which component reported what, with its details."""
+    source: str
+    event: str
+    fields: dict[str, Any]
+
+    def __str__(self) -> str:
+        details = ", ".join(f"{key}={value}" for key, value in self.fields.items())
+        return f"[{self.source}] {self.event}" + (f": {details}" if details else "")
+
+
+class TraceSink:
+    """Base class for a destination of trace records."""
+    def emit(self, record: TraceRecord):
+        raise NotImplementedError("Subclasses must implement the emit method.")
+
+
+class PrintSink(TraceSink):
+    """Prints every record to stdout, for interactive debugging."""
+    def emit(self, record: TraceRecord):
+        print(record)
+
+
+class ListSink(TraceSink):
+    """Keeps every record in memory."""
+    def __init__(self):
+        self.records: list[TraceRecord] = []
+
+    def emit(self, record: TraceRecord):
+        self.records.append(record)
+
+
+# Module state. Read `enabled` directly at call sites; change it only through set_sink.
+enabled: bool = False
+_sink: TraceSink | None = None
+
+
+def emit(source: str, event: str, /, **fields):
+    """Sends a record to the installed sink. Guard calls with `if trace.enabled:`."""
+    if _sink is not None:
+        _sink.emit(TraceRecord(source, event, fields))
+
+
+def get_sink() -> TraceSink | None:
+    return _sink
+
+
+def set_sink(sink: TraceSink | None):
+    """Installs a sink and turns tracing on, or turns tracing off when sink is None."""
+    global enabled, _sink
+    _sink = sink
+    enabled = sink is not None
+
+
+@contextmanager
+def tracing(sink: TraceSink):
+    """Traces to the given sink for the duration of a with block."""
+    previous = _sink
+    set_sink(sink)
+    try:
+        yield sink
+    finally:
+        set_sink(previous)
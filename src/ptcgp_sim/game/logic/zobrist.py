@@ -0,0 +1,123 @@
+"""
+Zobrist-style hashing of game states.
+
+A state's hash is the sum, modulo 2**64, of one pseudo-random 64-bit key per feature of the state:
+
+    - the position of every card outside the deck: its zone, and its spot for bench cards
+    - the damage of every damaged card
+    - each energy attached to a card (a card with n energy of a type adds n times that key)
+    - per player: points, energy zone current and next energy, whether they retreated this turn
+    - the turn number, the current player, and whether and by whom the game was won
+
+A GameState keeps its hash current as the game changes by subtracting the keys of what changed
+and adding the new ones, see GameState.zobrist. Keys are derived from the feature by a fixed
+mixing function, so they are the same in every process and need no table.
+Cards in the deck and undamaged cards add nothing, so a new game is cheap to hash.
+
+The order of cards within the deck, the hand and the discard pile is not part of the hash.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from ptcgp_sim.game.objects.zone import Zone
+from ptcgp_sim.models.energy import ENERGY_INDEX
+
+if TYPE_CHECKING:
+    from ptcgp_sim.game.objects.card import Card
+    from ptcgp_sim.game.objects.player import Player
+    from ptcgp_sim.game.logic.game_state import GameState
+
+
+MASK = (1 << 64) - 1
+
+# Feature kinds
+POSITION = 1
+HP = 2
+ENERGY = 3
+PLAYER = 4
+TURN = 5
+
+
+@lru_cache(maxsize=None)
+def key(kind: int, a: int, b: int = 0, c: int = 0) -> int:
+    """The 64-bit key of a feature. Arguments must be non-negative and a, b, c below 2**16."""
+    x = (((kind << 16 | a) << 16 | b) << 16 | c) & MASK
+    # splitmix64 finalizer
+    x = (x + 0x9E3779B97F4A7C15) & MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK
+    return x ^ (x >> 31)
+
+
+def position(zone: Zone, slot: int = 0) -> int:
+    """A card's position for hashing: its zone, and its spot on the bench. Position 0 is the deck."""
+    return zone * 8 + slot
+
+
+def position_key(instance_id: int, position: int) -> int:
+    return key(POSITION, instance_id, position) if position else 0
+
+
+def hp_key(instance_id: int, max_hp: int | None, current_hp: int | None) -> int:
+    damage = (max_hp or 0) - max(current_hp or 0, 0)
+    return key(HP, instance_id, damage) if damage else 0
+
+
+def energy_key(card: Card, energy_index: int) -> int:
+    return key(ENERGY, card.instance_id, energy_index)
+
+
+def player_key(player: Player) -> int:
+    """The key of a player's points, energy zone and retreat flag."""
+    energy_zone = player.energy_zone
+    current = next_energy = 0
+    if energy_zone is not None:
+        if energy_zone.current is not None:
+            current = ENERGY_INDEX[energy_zone.current.code] + 1
+        if energy_zone.next is not None:
+            next_energy = ENERGY_INDEX[energy_zone.next.code] + 1
+    return key(PLAYER, player.instance_id, player.points * 2 + player.has_retreated, current << 8 | next_energy)
+
+
+def turn_key(game_state: GameState) -> int:
+    """The key of the turn number, the current player and the outcome of the game."""
+    if game_state.is_game_over:
+        outcome = 1 if game_state.winner is None else 2 + game_state.winner.instance_id
+    else:
+        outcome = 0
+    return key(TURN, game_state.turn_number, game_state.current_player_index, outcome)
+
+
+def card_state_keys(card: Card) -> int:
+    """The sum of the keys of a card's damage and attached energy; 0 for an undamaged card without energy."""
+    instance_id = card.instance_id
+    total = hp_key(instance_id, card.max_hp, card.current_hp)
+    for energy_index, count in enumerate(card.energy_counts):
+        if count:
+            total += count * key(ENERGY, instance_id, energy_index)
+    return total
+
+
+def card_keys(card: Card, zone: Zone, slot: int = 0) -> int:
+    """The sum of the keys of a card's position, damage and attached energy."""
+    return (position_key(card.instance_id, position(zone, slot)) + card_state_keys(card)) & MASK
+
+
+def compute_hash(game_state: GameState) -> int:
+    """Computes the hash of a game state from scratch."""
+    total = turn_key(game_state)
+    for player in game_state.players:
+        total += player_key(player)
+        for card in player.deck:
+            total += card_keys(card, Zone.DECK)  # Only adds something for damaged or energized cards
+        for card in player.hand:
+            total += card_keys(card, Zone.HAND)
+        if player.active_pokemon is not None:
+            total += card_keys(player.active_pokemon, Zone.ACTIVE)
+        for slot, card in enumerate(player.bench):
+            if card is not None:
+                total += card_keys(card, Zone.BENCH, slot)
+        for card in player.discard_pile:
+            total += card_keys(card, Zone.DISCARD)
+    return total & MASK
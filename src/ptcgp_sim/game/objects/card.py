@@ -1,83 +1,68 @@
-import uuid
+from __future__ import annotations
 from dataclasses import dataclass, field
+from operator import attrgetter
 
 from ptcgp_sim.models.card import CardData
-from ptcgp_sim.models.energy import Energy
+from ptcgp_sim.models.energy import Energy, ENERGY_CODES, ENERGY_INDEX
+from ptcgp_sim.game.objects.ids import unbound_ids
+from ptcgp_sim.game.logic import trace
 
 
-@dataclass
+NO_ENERGY = (0,) * len(ENERGY_CODES)
+
+
+def _forward(field_name: str) -> property:
+    """A read-only property that forwards to a CardData field, implemented in C by attrgetter."""
+    return property(attrgetter(f"card_data.{field_name}"))
+
+
+@dataclass(slots=True)
 class Card:
     """
     Represents a single, unique instance of a card.
+
+    The static card data (name, stage, attacks, ...) lives in a CardData that is shared by
+    every copy of the card, as a flyweight, and must not be modified. A Card only stores its
+    per-game state, in __slots__. Hot paths can read static fields from card.card_data directly.
     """
     card_data: CardData
-    instance_id: uuid.UUID = field(default_factory=uuid.uuid4)
+    instance_id: int = field(default_factory=unbound_ids.allocate)
 
     # Game state attributes
     max_hp: int | None = field(init=False)
     current_hp: int | None = field(init=False)
+    # Change attached energy only through attach_energy and the detach methods, which keep
+    # energy_counts, the number of attached energy of each type in ENERGY_CODES order, in sync.
     attached_energy: list[Energy] = field(default_factory=list)
+    # Cards without energy share the NO_ENERGY tuple, most cards never get a list of their own.
+    energy_counts: list[int] | tuple[int, ...] = field(init=False, repr=False)
     attached_cards: list['Card'] = field(default_factory=list)  # Base evolution cards, Tools, etc.
 
-    # Publisher-Subscriber patterns
-    _death_subscribers: list = field(default_factory=list)
+    # The affordable attacks for the current energy, computed on demand
+    _available_attacks: list | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self.max_hp = self.card_data.hp
         self.current_hp = self.card_data.hp
+        self.energy_counts = NO_ENERGY
+        for energy in self.attached_energy:
+            self._count_energy(energy)
 
     # --- Property Forwarding ---
-    @property
-    def id(self) -> int:
-        return self.card_data.id
-
-    @property
-    def name(self) -> str:
-        return self.card_data.name
-
-    @property
-    def supertype(self):
-        return self.card_data.supertype
-
-    @property
-    def energy_type(self):
-        return self.card_data.energy_type
-
-    @property
-    def evolve_from(self):
-        return self.card_data.evolve_from
-
-    @property
-    def text(self) -> str:
-        return self.card_data.text
-
-    @property
-    def stage(self) -> str:
-        return self.card_data.stage
-
-    @property
-    def weakness(self):
-        return self.card_data.weakness
-
-    @property
-    def retreat_cost(self):
-        return self.card_data.retreat_cost
-
-    @property
-    def subtype(self):
-        return self.card_data.subtype
-
-    @property
-    def rule(self):
-        return self.card_data.rule
-
-    @property
-    def abilities(self):
-        return self.card_data.abilities
-
-    @property
-    def attacks(self):
-        return self.card_data.attacks
+    # For logging, display and other code off the hot paths, which read card.card_data.<field>
+    id = _forward("id")
+    name = _forward("name")
+    supertype = _forward("supertype")
+    energy_type = _forward("energy_type")
+    evolve_from = _forward("evolve_from")
+    text = _forward("text")
+    stage = _forward("stage")
+    weakness = _forward("weakness")
+    retreat_cost = _forward("retreat_cost")
+    subtype = _forward("subtype")
+    rule = _forward("rule")
+    abilities = _forward("abilities")
+    attacks = _forward("attacks")
 
     def __str__(self):
         lines = [
@@ -98,59 +83,100 @@ class Card:
                      + f"{self.retreat_cost if self.retreat_cost else ''}")
         return "\n        ".join(lines)
 
-    def subscribe_to_death(self, callback):
+    def clone(self, memo: dict[int, object]) -> Card:
         """
-        Subscribe a callback to be called when the card is defeated.
-        The callback should accept one argument: the defeated card.
+        Returns a copy of the card's game state that shares its CardData and attached Energy.
+        The copy is added to memo, which maps instance ids to copies.
         """
-        self._death_subscribers.append(callback)
-
-    def unsubscribe_from_death(self, callback):
-        """
-        Unsubscribe a callback from the death event.
-        """
-        if callback in self._death_subscribers:
-            self._death_subscribers.remove(callback)
-
-    def _invoke_death_event(self):
-        """
-        Invoke all subscribed callbacks when the card is defeated.
-        """
-        for callback in self._death_subscribers:
-            callback(self)
+        copy = Card.__new__(Card)
+        memo[self.instance_id] = copy
+        copy.card_data = self.card_data
+        copy.instance_id = self.instance_id
+        copy.max_hp = self.max_hp
+        copy.current_hp = self.current_hp
+        copy.attached_energy = self.attached_energy.copy()
+        energy_counts = self.energy_counts
+        copy.energy_counts = energy_counts if energy_counts is NO_ENERGY else energy_counts.copy()
+        copy.attached_cards = [card.clone(memo) for card in self.attached_cards] if self.attached_cards else []
+        copy._available_attacks = self._available_attacks  # Never modified, only replaced
+        return copy
+
+    def reset(self):
+        """Resets the card's game state, for another game: full hp, no energy or attached cards."""
+        self.max_hp = self.card_data.hp
+        self.current_hp = self.card_data.hp
+        self.attached_energy = []
+        self.energy_counts = NO_ENERGY
+        self.attached_cards = []
+        self._available_attacks = None
+
+    def snapshot(self) -> tuple:
+        """The card's game state, for the undo journal."""
+        energy_counts = self.energy_counts
+        return (
+            self.current_hp,
+            self.attached_energy.copy(),
+            energy_counts if energy_counts is NO_ENERGY else energy_counts.copy(),
+            self.attached_cards.copy(),
+            self._available_attacks,
+        )
+
+    def restore(self, snapshot: tuple):
+        """Restores the game state saved by snapshot()."""
+        (self.current_hp, self.attached_energy, self.energy_counts, self.attached_cards,
+         self._available_attacks) = snapshot
 
     def take_damage(self, amount: int):
         """
-        Apply damage to the card. If the card's HP drops to 0 or below, invoke death event.
+        Apply damage to the card, down to 0 HP. A card at 0 HP stays where it is: knockouts are
+        queued by DealDamageEffect and resolved by the ActionResolver.
         """
         self.current_hp = max(0, self.current_hp - amount)
-        print(f"[CARD] {self.name} takes {amount} damage. Max HP: {self.max_hp}. Current HP: {self.current_hp}")
-        if not self.is_alive():
-            self._invoke_death_event()
+        if trace.enabled:
+            trace.emit("CARD", "take_damage", card=self.name, amount=amount, max_hp=self.max_hp, hp=self.current_hp)
 
     def is_alive(self):
         return self.current_hp > 0
 
     def get_available_attacks(self):
-        available_attacks = []
-        for attack in self.attacks:
-            colorless_count = 0
-            attack_costs = attack.costs
-            attached_energy = self.attached_energy
-
-            for energy in attack_costs:
-                if energy in attached_energy:
-                    attached_energy.remove(energy)
-                elif energy == "Colorless":
-                    colorless_count = colorless_count + 1
-                else:
-                    # Attack requires energy that the card does not have
-                    break
-
-            if colorless_count <= len(attached_energy):
-                available_attacks.append(attack)
-
-        return available_attacks
-
-    def attach_energy(self, energy_type):
-        self.attached_energy.append(energy_type)
+        """
+        Returns the attacks whose energy cost is covered by the attached energy.
+        The list is cached until the attached energy changes and must not be modified.
+        """
+        if self._available_attacks is None:
+            energy_counts = self.energy_counts
+            self._available_attacks = [
+                attack for attack in self.card_data.attacks if attack.is_affordable(energy_counts)
+            ]
+        return self._available_attacks
+
+    def attach_energy(self, energy: Energy):
+        self.attached_energy.append(energy)
+        self._count_energy(energy)
+        self._available_attacks = None
+
+    def _count_energy(self, energy: Energy):
+        if self.energy_counts is NO_ENERGY:
+            self.energy_counts = list(NO_ENERGY)
+        self.energy_counts[ENERGY_INDEX[energy.code]] += 1
+
+    def detach_energy(self, count: int) -> list[Energy]:
+        """Removes the last `count` attached energy and returns them."""
+        start = max(0, len(self.attached_energy) - count)
+        detached = self.attached_energy[start:]
+        del self.attached_energy[start:]
+        if detached:
+            energy_counts = list(self.energy_counts)
+            for energy in detached:
+                energy_counts[ENERGY_INDEX[energy.code]] -= 1
+            self.energy_counts = energy_counts if any(energy_counts) else NO_ENERGY
+            self._available_attacks = None
+        return detached
+
+    def detach_all_energy(self) -> list[Energy]:
+        """Removes all attached energy and returns it."""
+        detached = self.attached_energy
+        self.attached_energy = []
+        self.energy_counts = NO_ENERGY
+        self._available_attacks = None
+        return detached
@@ -1,26 +1,216 @@
-import random
-from dataclasses import dataclass, field
+from __future__ import annotations
+from typing import Iterator
 
+from ptcgp_sim.game.logic.rng import GameRandom, derive_seed
 from ptcgp_sim.game.objects.card import Card
 
 
-@dataclass
 class Deck:
-    cards: list[Card] = field(default_factory=list)
+    """
+    A player's deck.
 
-    def add(self, card):
-        self.cards.append(card)
+    The deck keeps every card it was built with in a list, and the cards still in it as indices
+    into that list: _order[:_size], in a list preallocated to the size of the deck. Shuffling is
+    lazy: shuffle() only takes a seed from the game's generator, and from then on every draw is one
+    step of a Fisher-Yates shuffle, which picks a random card among the cards left and swaps it
+    behind them. Cards that are never drawn are never moved. An unshuffled deck draws its last card.
+    The random numbers of the draws are mixed from the seed and the number of draws so far, so the
+    whole state of the deck is a few small lists and ints, cheap to journal and to clone.
 
-    def remove(self, card):
-        self.cards.remove(card)
+    The cards left of each stage ("Basic", "Stage 1", ..., None for Trainers) are kept in lists
+    too, so counting them and drawing one of them, like setup_player's search for a Basic Pokémon,
+    take constant time. reset() puts every card back in the deck, to play another game with it.
+    """
+    __slots__ = ("_cards", "_order", "_position", "_size", "_stages", "_by_stage", "_stage_position",
+                 "_index", "_template", "_seed", "_draws")
 
-    def shuffle(self):
-        random.shuffle(self.cards)
+    def __init__(self, cards: list[Card] | None = None):
+        self._cards: list[Card] = list(cards) if cards is not None else []
+        self._stages = [card.card_data.stage for card in self._cards]
+        self._index: dict[int, int] | None = None  # Card index by id(card), built on demand
+        self._template: tuple | None = None  # The stage lists of the full deck, built on demand
+        self._seed: int | None = None  # Set by shuffle()
+        self._draws = 0  # Random numbers taken since the shuffle
+        self._fill()
 
-    def draw(self):
-        if len(self.cards) > 0:
-            return self.cards.pop()
-        return None
+    def _fill(self):
+        """Puts every card in the deck, in the order they were added."""
+        if self._template is None:
+            by_stage: dict[str | None, list[int]] = {}
+            stage_position = []
+            for index, stage in enumerate(self._stages):
+                indices = by_stage.setdefault(stage, [])
+                stage_position.append(len(indices))
+                indices.append(index)
+            self._template = (by_stage, stage_position)
+
+        by_stage, stage_position = self._template
+        count = len(self._cards)
+        self._order = list(range(count))  # Card indices; the first _size are in the deck
+        self._position = list(range(count))  # Position of each card in _order
+        self._size = count
+        # Indices of the cards in the deck by stage, and the position of each card in its stage list
+        self._by_stage = {stage: indices.copy() for stage, indices in by_stage.items()}
+        self._stage_position = stage_position.copy()
+
+    @property
+    def cards(self) -> list[Card]:
+        """The cards in the deck. Until they are drawn, the order of a shuffled deck is not random."""
+        cards = self._cards
+        return [cards[index] for index in self._order[:self._size]]
+
+    def __iter__(self) -> Iterator[Card]:
+        cards = self._cards
+        for index in self._order[:self._size]:
+            yield cards[index]
 
     def __len__(self):
-        return len(self.cards)
+        return self._size
+
+    def count(self, stage: str | None) -> int:
+        """The number of cards of a stage in the deck, e.g. count("Basic")."""
+        indices = self._by_stage.get(stage)
+        return len(indices) if indices is not None else 0
+
+    def _card_index(self, card: Card) -> int | None:
+        if self._index is None:
+            self._index = {id(added): index for index, added in enumerate(self._cards)}
+        return self._index.get(id(card))
+
+    def _take(self, index: int) -> Card:
+        """Removes a card from the deck by swapping it with the last card in the deck."""
+        order, position = self._order, self._position
+        last = self._size - 1
+        moved = order[last]
+        at = position[index]
+        order[at] = moved
+        position[moved] = at
+        order[last] = index
+        position[index] = last
+        self._size = last
+
+        indices = self._by_stage[self._stages[index]]
+        stage_position = self._stage_position
+        moved = indices.pop()
+        if moved != index:
+            indices[stage_position[index]] = moved
+            stage_position[moved] = stage_position[index]
+        return self._cards[index]
+
+    def add(self, card: Card):
+        """Puts a card in the deck, last."""
+        index = self._card_index(card)
+        if index is None:
+            index = len(self._cards)
+            self._cards.append(card)
+            self._stages.append(card.card_data.stage)
+            self._order.append(index)
+            self._position.append(index)
+            self._stage_position.append(0)
+            self._index[id(card)] = index
+            self._template = None
+        elif self._position[index] < self._size:
+            raise ValueError(f"{card.name} is already in the deck.")
+
+        # Swap the card in behind the cards in the deck
+        order, position = self._order, self._position
+        at, size = position[index], self._size
+        order[at], order[size] = order[size], index
+        position[order[at]] = at
+        position[index] = size
+        self._size = size + 1
+
+        indices = self._by_stage.setdefault(self._stages[index], [])
+        self._stage_position[index] = len(indices)
+        indices.append(index)
+
+    def remove(self, card: Card):
+        """Takes a card out of the deck. The last card of the deck takes its place."""
+        index = self._card_index(card)
+        if index is None or self._position[index] >= self._size:
+            raise ValueError(f"{card.name} is not in the deck.")
+        self._take(index)
+
+    @property
+    def is_shuffled(self) -> bool:
+        return self._seed is not None
+
+    def shuffle(self, rng: GameRandom | None = None):
+        """
+        Shuffles the deck with a seed from the game's generator, or a new one. The cards only move
+        when they are drawn, so this takes constant time.
+        """
+        self._seed = (rng if rng is not None else GameRandom()).getrandbits(64)
+        self._draws = 0
+
+    def _random_below(self, stop: int) -> int:
+        """A random int in [0, stop). The bias of the modulo is below stop / 2**64."""
+        value = derive_seed(self._seed, self._draws)
+        self._draws += 1
+        return value % stop
+
+    def draw(self) -> Card | None:
+        """Draws a random card of a shuffled deck, or the last card of an unshuffled one."""
+        size = self._size
+        if not size:
+            return None
+        position = self._random_below(size) if self._seed is not None and size > 1 else size - 1
+        return self._take(self._order[position])
+
+    def draw_stage(self, stage: str | None) -> Card | None:
+        """Searches the deck for a card of a stage, e.g. a Basic Pokémon, and draws it. Random if the deck is shuffled."""
+        indices = self._by_stage.get(stage)
+        if not indices:
+            return None
+        count = len(indices)
+        position = self._random_below(count) if self._seed is not None and count > 1 else count - 1
+        return self._take(indices[position])
+
+    def reset(self):
+        """Puts every card back in the deck, unshuffled, with the game state of each card reset."""
+        for card in self._cards:
+            card.reset()
+        self._fill()
+        self._seed = None
+        self._draws = 0
+
+    def snapshot(self) -> tuple:
+        """The deck's state, for the undo journal."""
+        return (
+            len(self._cards), self._order.copy(), self._position.copy(), self._size,
+            {stage: indices.copy() for stage, indices in self._by_stage.items()}, self._stage_position.copy(),
+            self._seed, self._draws,
+        )
+
+    def restore(self, snapshot: tuple):
+        """Restores the state saved by snapshot()."""
+        (count, self._order, self._position, self._size, self._by_stage, self._stage_position,
+         self._seed, self._draws) = snapshot
+        if len(self._cards) > count:
+            # Cards added since the snapshot
+            del self._cards[count:]
+            del self._stages[count:]
+            self._index = None
+            self._template = None
+
+    def clone(self, memo: dict[int, object]) -> Deck:
+        """
+        Returns a copy of the deck with copies of its cards, in the same order, that draws the same
+        cards. Cards no longer in the deck are taken from memo, so clone the other zones of the player first.
+        """
+        copy = Deck.__new__(Deck)
+        size = self._size
+        position = self._position
+        copy._cards = [card.clone(memo) if position[index] < size else memo.get(card.instance_id, card)
+                       for index, card in enumerate(self._cards)]
+        copy._stages = self._stages.copy()
+        copy._index = None
+        copy._template = self._template  # Never modified, only replaced
+        copy._seed = self._seed
+        copy._draws = self._draws
+        copy._order = self._order.copy()
+        copy._position = position.copy()
+        copy._size = size
+        copy._by_stage = {stage: indices.copy() for stage, indices in self._by_stage.items()}
+        copy._stage_position = self._stage_position.copy()
+        return copy
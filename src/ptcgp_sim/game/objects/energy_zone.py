@@ -1,7 +1,8 @@
-import random
-from dataclasses import dataclass
+import copy
+from dataclasses import dataclass, field
 from typing import List
 from ptcgp_sim.models.energy import Energy
+from ptcgp_sim.game.logic.rng import GameRandom
 
 
 DISALLOWED_ENERGY_TYPES = [
@@ -9,11 +10,17 @@ DISALLOWED_ENERGY_TYPES = [
     "Colorless"
 ]  # Energy types that cannot be used in EnergyZone
 
+ROLL_BLOCK_SIZE = 32  # Energy rolled ahead at a time
+
 @dataclass
 class EnergyZone:
     allowed_types: List[Energy]  # 1 to 3 elements
     current: Energy | None = None
     next: Energy | None = None
+    rng: GameRandom = field(default_factory=GameRandom, repr=False, compare=False)
+    # Energy rolled ahead in bulk, taken in order from _roll_index. The tuple is never changed, only replaced.
+    _rolls: tuple[Energy, ...] = field(default=(), init=False, repr=False, compare=False)
+    _roll_index: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if not (1 <= len(self.allowed_types) <= 3):
@@ -22,10 +29,32 @@ class EnergyZone:
             raise ValueError(f"Energy types {DISALLOWED_ENERGY_TYPES} are not allowed in EnergyZone.")
         self.roll_initial()
 
+    def _roll(self) -> Energy:
+        if self._roll_index == len(self._rolls):
+            self._rolls = self.rng.roll_many(self.allowed_types, ROLL_BLOCK_SIZE)
+            self._roll_index = 0
+        energy = self._rolls[self._roll_index]
+        self._roll_index += 1
+        return energy
+
     def roll_initial(self):
-        self.next = random.choice(self.allowed_types)
+        self.next = self._roll()
 
     def advance_turn(self):
         """Call at the start of each turn to rotate energy."""
         self.current = self.next
-        self.next = random.choice(self.allowed_types)
+        self.next = self._roll()
+
+    def snapshot(self) -> tuple:
+        """The current and next energy and the position in the rolls, for the undo journal."""
+        return self.current, self.next, self._rolls, self._roll_index
+
+    def restore(self, snapshot: tuple):
+        self.current, self.next, self._rolls, self._roll_index = snapshot
+
+    def clone(self) -> 'EnergyZone':
+        """
+        Returns a copy of the zone with the same current and next energy, without rolling again.
+        The copy shares the generator; GameState.clone gives it its own.
+        """
+        return copy.copy(self)
@@ -0,0 +1,19 @@
+class IdAllocator:
+    """
+    Hands out small, increasing integer ids.
+    Ints are cheap to create, hash, compare and pickle, and dense ids can be used as array indices.
+    """
+    __slots__ = ("next_id",)
+
+    def __init__(self, start: int = 0):
+        self.next_id = start
+
+    def allocate(self) -> int:
+        allocated = self.next_id
+        self.next_id += 1
+        return allocated
+
+
+# Ids for cards and players created outside a game. A GameState renumbers every object
+# it owns with its own allocator, so that ids within a game are dense and start at 0.
+unbound_ids = IdAllocator()
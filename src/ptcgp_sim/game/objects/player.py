@@ -1,11 +1,15 @@
-import uuid
 from dataclasses import dataclass, field
+from typing import Callable
 
 from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.ids import unbound_ids
 from ptcgp_sim.models.energy import Energy
 from ptcgp_sim.game.objects.deck import Deck
 from ptcgp_sim.game.objects.energy_zone import EnergyZone
+from ptcgp_sim.game.objects.zone import Bench, CardPile, Zone
 from ptcgp_sim.game.logic.game_log import GameLog
+from ptcgp_sim.game.logic.journal import Journal
+from ptcgp_sim.game.logic import trace
 
 
 MAX_BENCH_SIZE = 3  # Maximum number of Pokémon on the bench
@@ -20,16 +24,27 @@ class Player:
     log: GameLog
 
     # Unique identifier for the player instance
-    instance_id: uuid.UUID = field(default_factory=uuid.uuid4)
+    instance_id: int = field(default_factory=unbound_ids.allocate)
 
     # Game state attributes
+    # Zones hold cards by identity, see CardPile and Bench
     active_pokemon: Card | None = None
-    bench: list[Card | None] = field(default_factory=lambda: [None] * MAX_BENCH_SIZE)
-    discard_pile: list[Card] = field(default_factory=list)
+    bench: Bench = field(default_factory=lambda: Bench(MAX_BENCH_SIZE))
+    discard_pile: CardPile = field(default_factory=CardPile)
     discarded_energy: list[Energy] = field(default_factory=list)
     energy_zone: EnergyZone | None = None
-    hand: list[Card] = field(default_factory=list)
+    hand: CardPile = field(default_factory=CardPile)
     points: int = 0
+    has_retreated: bool = False  # Retreating is allowed once per turn
+
+    # Called with (card, zone, bench spot) whenever a card moves to another zone. Set by the GameState.
+    zone_listener: Callable[[Card, Zone, int], None] | None = field(default=None, repr=False, compare=False)
+    # Called with (card, energy, +1 or -1) whenever energy is attached to or removed from a card. Set by the GameState.
+    energy_listener: Callable[[Card, Energy, int], None] | None = field(default=None, repr=False, compare=False)
+    # Called with the player when their energy zone or retreat flag changes. Set by the GameState.
+    state_listener: Callable[['Player'], None] | None = field(default=None, repr=False, compare=False)
+    # The undo journal of the game while it is journaling, see GameState.checkpoint. Set by the GameState.
+    journal: Journal | None = field(default=None, repr=False, compare=False)
 
     @property
     def all_zones(self):
@@ -38,25 +53,115 @@ class Player:
         yield self.bench
         yield self.discard_pile
 
+    def all_cards(self):
+        """Yields every card the player owns: in the deck, in hand, in play and in the discard pile."""
+        yield from self.deck
+        yield from self.hand
+        if self.active_pokemon is not None:
+            yield self.active_pokemon
+        for card in self.bench:
+            if card is not None:
+                yield card
+        yield from self.discard_pile
+
+    def _save(self, *cards: Card):
+        """Saves the player, and the given cards, in the undo journal before they change."""
+        journal = self.journal
+        if journal is not None:
+            journal.save(self)
+            for card in cards:
+                journal.save(card)
+
+    def snapshot(self) -> tuple:
+        """The player's game state, for the undo journal."""
+        return (
+            self.deck.snapshot(), self.hand.copy(), self.active_pokemon, self.bench.copy(),
+            self.discard_pile.copy(), self.discarded_energy.copy(), self.points, self.has_retreated,
+            self.energy_zone.snapshot() if self.energy_zone is not None else None,
+        )
+
+    def restore(self, snapshot: tuple):
+        """Restores the game state saved by snapshot()."""
+        (deck, self.hand, self.active_pokemon, self.bench, self.discard_pile, self.discarded_energy,
+         self.points, self.has_retreated, energy_zone) = snapshot
+        self.deck.restore(deck)
+        if energy_zone is not None:
+            self.energy_zone.restore(energy_zone)
+
+    def _track(self, card: Card, zone: Zone, slot: int = 0):
+        """Notifies the zone listener that a card has moved to a new zone, or bench spot."""
+        if self.zone_listener is not None:
+            self.zone_listener(card, zone, slot)
+
+    def _track_energy(self, card: Card, energy: list[Energy], delta: int):
+        """Notifies the energy listener that energy was attached to (+1) or removed from (-1) a card."""
+        if self.energy_listener is not None:
+            for attached in energy:
+                self.energy_listener(card, attached, delta)
+
+    def _track_state(self):
+        """Notifies the state listener that the energy zone or the retreat flag changed."""
+        if self.state_listener is not None:
+            self.state_listener(self)
+
+    def start_turn(self, first_turn: bool = False):
+        """Prepares the player's turn: the energy zone advances, except on the first turn of the game."""
+        self._save()
+        self.has_retreated = False
+        if self.energy_zone:
+            if first_turn:
+                self.energy_zone.current = None
+            else:
+                self.energy_zone.advance_turn()
+        self._track_state()
+
+    def clone(self, memo: dict[int, object]) -> 'Player':
+        """
+        Returns a copy of the player's game state: zones, hp and energy of their cards, energy zone
+        and points. Card data is shared. The copy has no log and no zone listener.
+        """
+        copy = Player.__new__(Player)
+        memo[self.instance_id] = copy
+        copy.name = self.name
+        copy.log = None
+        copy.instance_id = self.instance_id
+        copy.active_pokemon = self.active_pokemon.clone(memo) if self.active_pokemon is not None else None
+        copy.bench = Bench(MAX_BENCH_SIZE, [card.clone(memo) if card is not None else None for card in self.bench])
+        copy.discard_pile = CardPile([card.clone(memo) for card in self.discard_pile])
+        copy.discarded_energy = self.discarded_energy.copy()
+        copy.energy_zone = self.energy_zone.clone() if self.energy_zone is not None else None
+        copy.hand = CardPile([card.clone(memo) for card in self.hand])
+        copy.deck = self.deck.clone(memo)  # Last, so that it finds the copies of the cards it no longer holds
+        copy.points = self.points
+        copy.has_retreated = self.has_retreated
+        copy.zone_listener = None
+        copy.energy_listener = None
+        copy.state_listener = None
+        copy.journal = None
+        return copy
+
     # Deck mechanics
-    def draw_card(self):
+    def draw_card(self) -> Card | None:
         # Check for full hand
         if len(self.hand) >= MAX_HAND_SIZE:
             if self.log:
-                self.log.log_message(f"{self.name} could not draw because their hand is full.")
+                self.log.log_message("%s could not draw because their hand is full.", self.name)
             return
 
         # Draw a card from the deck. If the deck is empty, notify the player.
+        self._save()
         card = self.deck.draw()
         if card is None:
             if self.log:
-                self.log.log_message(f"{self.name} has no cards left to draw.")
+                self.log.log_message("%s has no cards left to draw.", self.name)
             return
 
         # Add the drawn card to the player's hand
         self.hand.append(card)
+        self._track(card, Zone.HAND)
         if self.log:
-            self.log.log_message(f"{self.name} drew card: {card}")
+            self.log.log_message("%s drew card: %s", self.name, str(card))  # The card as it is now
+        return card
 
     def draw_cards(self, count: int):
         for _ in range(count):
@@ -70,143 +175,206 @@ class Player:
         """
         if card_to_set not in self.hand:
             if self.log:
-                self.log.log_message(f"ERROR: {card_to_set.name} is not in {self.name}'s hand.")
+                self.log.log_message("ERROR: %s is not in %s's hand.", card_to_set.name, self.name)
             return False
 
+        self._save(card_to_set)
         self.hand.remove(card_to_set)
         self.active_pokemon = card_to_set
-        card_to_set.subscribe_to_death(self.handle_card_death)
+        self._track(card_to_set, Zone.ACTIVE)
         if self.log:
-            self.log.log_message(f"{self.name} set active Pokémon: {card_to_set.name}")
+            self.log.log_message("%s set active Pokémon: %s", self.name, card_to_set.name)
         return True
 
     # Bench mechanics
     def is_bench_full(self) -> bool:
         """Checks if there are any empty spots left on the bench."""
-        return None not in self.bench
+        return self.bench.is_full()
 
     def play_card_to_bench(self, card_to_play: Card, bench_index: int | None = None) -> bool:
         """Play a card from hand to the bench at the specified index."""
         if card_to_play not in self.hand:
             if self.log:
-                self.log.log_message(f"ERROR: {card_to_play.name} is not in {self.name}'s hand.")
+                self.log.log_message("ERROR: %s is not in %s's hand.", card_to_play.name, self.name)
             return False
 
         if bench_index is not None:
             # --- Case 1: Player specifies a bench index ---
             if not (0 <= bench_index < MAX_BENCH_SIZE):
                 if self.log:
-                    self.log.log_message(f"Invalid index {bench_index}. Must be between 0 and {MAX_BENCH_SIZE - 1}.")
+                    self.log.log_message("Invalid index %s. Must be between 0 and %s.", bench_index, MAX_BENCH_SIZE - 1)
                 return False
             if self.bench[bench_index] is not None:
                 if self.log:
-                    self.log.log_message(f"Bench index {bench_index} is already occupied by {self.bench[bench_index].name}.")
+                    self.log.log_message("Bench index %s is already occupied by %s.",
+                                         bench_index, self.bench[bench_index].name)
                 return False
             target_index = bench_index
         else:
-            try:
-                target_index = self.bench.index(None)  # Find the first available spot
-            except ValueError:
+            target_index = self.bench.first_free()
+            if target_index is None:
                 if self.log:
-                    self.log.log_message(f"{self.name} cannot play {card_to_play.name} to the bench. Bench is full.")
+                    self.log.log_message("%s cannot play %s to the bench. Bench is full.", self.name, card_to_play.name)
                 return False
 
+        self._save(card_to_play)
         self.hand.remove(card_to_play)
         self.bench[target_index] = card_to_play
-        card_to_play.subscribe_to_death(self.handle_card_death)
+        self._track(card_to_play, Zone.BENCH, target_index)
         return True
 
     # Discard mechanics
     def discard_card_and_attachments(self, card: Card):
         """Discard a card with any attached energy and cards."""
+        self._save(card, *card.attached_cards)
         # Move the main card to the discard pile
         self.discard_pile.append(card)
+        self._track(card, Zone.DISCARD)
 
         # Move any attached energy to the discarded energy list
         if card.attached_energy:
-            self.discarded_energy.extend(card.attached_energy)
-            card.attached_energy.clear()
+            detached = card.detach_all_energy()
+            self._track_energy(card, detached, -1)
+            self.discarded_energy.extend(detached)
 
         # Discard any attached cards (e.g., Trainer cards)
         if card.attached_cards:
             self.discard_pile += card.attached_cards
+            for attached_card in card.attached_cards:
+                self._track(attached_card, Zone.DISCARD)
             card.attached_cards.clear()
 
         # TODO: Remove any effects associated with the card
 
-    def handle_card_death(self, dead_card: Card):
-        """Handle the death of a card, removing it from the active or bench position."""
-        # Search the bench first
-        for i, card_on_bench in enumerate(self.bench):
-            if card_on_bench is dead_card:
-                self.bench[i] = None
-                self.discard_card_and_attachments(dead_card)
-                dead_card.unsubscribe_from_death(self.handle_card_death)
-                return
-
-        # Check active Pokémon
-        if dead_card is self.active_pokemon:
-            # Activate on-death effects if any
+    def knock_out(self, card: Card) -> bool:
+        """
+        Removes a knocked out Pokémon from the active spot or the bench and discards it with its
+        attachments. Returns False if the card is not in play. An empty active spot is not refilled
+        here, see fill_active_spot, so that a batch of knockouts is removed before a promotion.
+        """
+        spot = self.bench.spot_of(card)
+        if spot is not None:
+            self._save(card)
+            self.bench[spot] = None
+            self.discard_card_and_attachments(card)
+            return True
+
+        if card is self.active_pokemon:
             # TODO: Implement on-death effects
-            # Remove the active Pokémon
+            self._save(card)
             self.active_pokemon = None
-            self.discard_card_and_attachments(dead_card)
+            self.discard_card_and_attachments(card)
+            if self.log:
+                self.log.log_message("%s's active Pokémon %s has been defeated.", self.name, card.name)
+            return True
+        return False
 
+    def fill_active_spot(self):
+        """Promotes the first benched Pokémon if the active spot is empty."""
+        if self.active_pokemon is not None:
+            return
+        bench_index = self.first_occupied_bench_index()
+        if bench_index is not None:
+            # TODO: For now, promote the first benched Pokémon if available
+            self.promote_from_bench(bench_index)
+        else:
             if self.log:
-                self.log.log_message(f"{self.name}'s active Pokémon {dead_card.name} has been defeated.")
-            if self.bench:
-                # TODO: For now, promote the first benched Pokémon if available
-                self.promote_from_bench(0)
-            else:
-                if self.log:
-                    self.log.log_message(f"{self.name} has no benched Pokémon to promote.")
-                # TODO: Broadcast that the player has no available Pokémon
+                self.log.log_message("%s has no benched Pokémon to promote.", self.name)
+            # TODO: Broadcast that the player has no available Pokémon
 
     def attach_energy(self, target, bench_index=0):
         if not self.energy_zone.current:
-            print(f"{self.name} has no available energy.")
+            if trace.enabled:
+                trace.emit("PLAYER", "no_energy", player=self.name)
             return
 
         # Only one energy from the energy zone can be attached per turn
+        energy = self.energy_zone.current
         if target == "active" and self.active_pokemon:
-            self.active_pokemon.attach_energy(self.energy_zone.current)
-            if self.log:
-                self.log.log_message(f"{self.name} attached {self.energy_zone.current} energy to active card " +
-                             f"{self.active_pokemon.name}.")
+            self._save(self.active_pokemon)
             self.energy_zone.current = None
-        elif target == "bench" and 0 <= bench_index < len(self.bench):
-            self.bench[bench_index].attach_energy(self.energy_zone.current)
+            self.active_pokemon.attach_energy(energy)
+            self._track_energy(self.active_pokemon, [energy], 1)
+            self._track_state()
             if self.log:
-                self.log.log_message(f"{self.name} attached {self.energy_zone.current} energy to benched card " +
-                             f"{self.bench[bench_index].name}.")
+                self.log.log_message("%s attached %s energy to active card %s.",
+                                     self.name, energy, self.active_pokemon.name)
+        elif target == "bench" and 0 <= bench_index < len(self.bench):
+            self._save(self.bench[bench_index])
             self.energy_zone.current = None
+            self.bench[bench_index].attach_energy(energy)
+            self._track_energy(self.bench[bench_index], [energy], 1)
+            self._track_state()
+            if self.log:
+                self.log.log_message("%s attached %s energy to benched card %s.",
+                                     self.name, energy, self.bench[bench_index].name)
         else:
-            print(f"Invalid energy attachment target: {target}, bench index: {bench_index} out of {len(self.bench)}")
+            if trace.enabled:
+                trace.emit("PLAYER", "invalid_energy_target", player=self.name, target=target, bench_index=bench_index)
+
+    def first_occupied_bench_index(self) -> int | None:
+        """Returns the index of the first occupied bench spot, or None if the bench is empty."""
+        return self.bench.first_occupied()
 
     def promote_from_bench(self, index):
-        if self.bench:
-            if self.active_pokemon:
-                # Swap bench and active
-                card = self.active_pokemon
-                self.active_pokemon = self.bench[index]
-                self.bench[index] = card
-            else:
-                self.active_pokemon = self.bench.pop(index)
+        if self.bench[index] is not None:
+            # Swap bench and active. The bench spot is left empty if there was no active Pokémon.
+            self._save()
+            card = self.active_pokemon
+            self.active_pokemon = self.bench[index]
+            self.bench[index] = card
+            self._track(self.active_pokemon, Zone.ACTIVE)
+            if card is not None:
+                self._track(card, Zone.BENCH, index)
         else:
-            print(f"{self.name} has no benched cards to promote.")
+            if trace.enabled:
+                trace.emit("PLAYER", "nothing_to_promote", player=self.name, bench_index=index)
+
+    def can_retreat(self, bench_index: int) -> bool:
+        """Checks whether the active Pokémon can retreat and be replaced by the Pokémon on the given bench spot."""
+        active = self.active_pokemon
+        return (
+            not self.has_retreated
+            and active is not None
+            and 0 <= bench_index < len(self.bench)
+            and self.bench[bench_index] is not None
+            and len(active.attached_energy) >= (active.card_data.retreat_cost or 0)
+        )
+
+    def retreat(self, bench_index: int) -> bool:
+        """
+        Retreats the active Pokémon to the bench, discarding energy to pay its retreat cost,
+        and promotes the Pokémon on the given bench spot.
+        """
+        if not self.can_retreat(bench_index):
+            if trace.enabled:
+                trace.emit("PLAYER", "cannot_retreat", player=self.name, bench_index=bench_index)
+            return False
+
+        retreating = self.active_pokemon
+        self._save(retreating)
+        paid = retreating.detach_energy(retreating.retreat_cost or 0)
+        self._track_energy(retreating, paid, -1)
+        self.discarded_energy.extend(paid)
+        self.promote_from_bench(bench_index)
+        self.has_retreated = True
+        self._track_state()
+        if self.log:
+            self.log.log_message("%s retreated %s for %s.", self.name, retreating.name, self.active_pokemon.name)
+        return True
 
     def _attack_active(self, attack, opponent):
         if self.active_pokemon and attack in self.active_pokemon.get_available_attacks():
             damage = attack.get_damage()
             opponent.active_pokemon.current_hp -= damage
             if self.log:
-                self.log.log_message(f"{self.name}'s {self.active_pokemon.name} attacked {opponent.active_pokemon.name} for " +
-                    f"{damage} damage!")
-                self.log.log_message(f"{opponent.active_pokemon.name} HP: {opponent.active_pokemon.current_hp}")
+                self.log.log_message("%s's %s attacked %s for %s damage!",
+                                     self.name, self.active_pokemon.name, opponent.active_pokemon.name, damage)
+                self.log.log_message("%s HP: %s", opponent.active_pokemon.name, opponent.active_pokemon.current_hp)
 
             if not opponent.active_pokemon.is_alive():
                 if self.log:
-                    self.log.log_message(f"{opponent.active_pokemon.name} is defeated!")
+                    self.log.log_message("%s is defeated!", opponent.active_pokemon.name)
                 self.points += 1
                 opponent.discard(opponent.active_pokemon)
                 opponent.active_pokemon = None
@@ -214,22 +382,24 @@ class Player:
                     # For now, promote the first benched Pokémon if available
                     opponent.promote_from_bench(0)
         else:
-            print(f"{self.name}'s active Pokémon cannot perform that attack.")
+            if trace.enabled:
+                trace.emit("PLAYER", "attack_not_available", player=self.name, attack=attack.name)
 
     def _attack_bench(self, attack, opponent, bench_index):
         if self.active_pokemon and attack in self.active_pokemon.get_available_attacks():
             damage = attack.get_damage()
             opponent.bench[bench_index].current_hp -= damage
             if self.log:
-                self.log.log_message(f"{self.name}'s {self.active_pokemon.name} attacked {opponent.bench[bench_index].name} for " +
-                    f"{damage} damage!")
-            self.log.log_message(f"{opponent.active_pokemon.name} HP: {opponent.active_pokemon.current_hp}")
+                self.log.log_message("%s's %s attacked %s for %s damage!",
+                                     self.name, self.active_pokemon.name, opponent.bench[bench_index].name, damage)
+            self.log.log_message("%s HP: %s", opponent.active_pokemon.name, opponent.active_pokemon.current_hp)
 
             if not opponent.bench[bench_index].is_alive():
-                print(f"{opponent.bench[bench_index].name} is defeated!")
+                if trace.enabled:
+                    trace.emit("PLAYER", "defeated", card=opponent.bench[bench_index].name)
                 self.points += 1
                 opponent.discard(opponent.bench[bench_index])
-                del opponent.bench[bench_index]
+                opponent.bench[bench_index] = None
 
     def attack(self, attack, opponent, target, bench_index=0):
         if self.active_pokemon:
@@ -241,22 +411,26 @@ class Player:
                 self._attack_bench(attack, opponent, bench_index)
             else:
                 # How did we get here
-                print(f"{self.name} tried to attack opponent's {target} card but it failed.")
+                if trace.enabled:
+                    trace.emit("PLAYER", "invalid_attack_target", player=self.name, target=target)
         else:
-            print("Attack not possible.")
+            if trace.enabled:
+                trace.emit("PLAYER", "no_active_pokemon", player=self.name)
 
     def discard(self, card):
+        self._save(card)
         if card in self.hand:
             self.hand.remove(card)
         self.discard_pile.append(card)
-        if card.supertype == "Pokemon" and card.attached_energy:
-            self.discarded_energy.extend(card.attached_energy)
-            card.attached_energy.clear()
+        self._track(card, Zone.DISCARD)
+        if card.card_data.supertype == "Pokemon" and card.attached_energy:
+            detached = card.detach_all_energy()
+            self._track_energy(card, detached, -1)
+            self.discarded_energy.extend(detached)
 
     def has_cards(self):
-        if self.active_pokemon or len(self.bench) > 0:
-            return True
-        return False
+        """Returns True if the player still has a Pokémon in play."""
+        return self.active_pokemon is not None or bool(self.bench)
 
     def __repr__(self) -> str:
         bench_str_list = [c.name if c else '—EMPTY—' for c in self.bench]
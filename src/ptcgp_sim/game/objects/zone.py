@@ -0,0 +1,165 @@
+from __future__ import annotations
+from enum import IntEnum
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from ptcgp_sim.game.objects.card import Card
+
+
+class Zone(IntEnum):
+    """The places a card can be in during a game."""
+    DECK = 0
+    HAND = 1
+    ACTIVE = 2
+    BENCH = 3
+    DISCARD = 4
+
+
+class CardPile:
+    """
+    An ordered pile of cards, such as a hand or a discard pile, that knows its cards by identity.
+
+    Cards are kept in a dict by id(card), so adding, removing and finding a card take constant
+    time and never compare cards field by field; two copies of the same card are always told
+    apart. A card is in a pile at most once. The pile iterates in the order cards were added, like
+    a list, but indexing walks the pile, so prefer iterating.
+    """
+    __slots__ = ("_cards",)
+
+    def __init__(self, cards: Iterable[Card] = ()):
+        self._cards: dict[int, Card] = {id(card): card for card in cards}
+
+    def __iter__(self) -> Iterator[Card]:
+        return iter(self._cards.values())
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __contains__(self, card) -> bool:
+        return id(card) in self._cards
+
+    def __getitem__(self, index):
+        return list(self._cards.values())[index]
+
+    def __iadd__(self, cards: Iterable[Card]) -> CardPile:
+        self.extend(cards)
+        return self
+
+    def __repr__(self) -> str:
+        return f"CardPile({list(self._cards.values())!r})"
+
+    def append(self, card: Card):
+        self._cards[id(card)] = card
+
+    def extend(self, cards: Iterable[Card]):
+        for card in cards:
+            self._cards[id(card)] = card
+
+    def remove(self, card: Card):
+        """Removes the card, raising ValueError like list.remove if it is not in the pile."""
+        try:
+            del self._cards[id(card)]
+        except KeyError:
+            raise ValueError(f"{card.name} is not in the pile.") from None
+
+    def index(self, card: Card) -> int:
+        for index, other in enumerate(self._cards.values()):
+            if other is card:
+                return index
+        raise ValueError(f"{card.name} is not in the pile.")
+
+    def clear(self):
+        self._cards.clear()
+
+    def copy(self) -> CardPile:
+        copy = CardPile.__new__(CardPile)
+        copy._cards = self._cards.copy()
+        return copy
+
+
+class Bench:
+    """
+    The bench spots of a player, each holding a Pokémon or None, addressed by spot like a list of
+    fixed size. The bench also keeps the spot of each Pokémon by identity and a bitmask of the
+    occupied spots, so finding a Pokémon, counting them and finding the first free or occupied
+    spot take constant time.
+    """
+    __slots__ = ("_spots", "_spot_of", "_occupied", "_full")
+
+    def __init__(self, size: int, cards: Iterable[Card | None] = ()):
+        self._spots: list[Card | None] = [None] * size
+        self._spot_of: dict[int, int] = {}  # Spot by id(card)
+        self._occupied = 0  # Bit i is set if spot i holds a Pokémon
+        self._full = (1 << size) - 1
+        for spot, card in enumerate(cards):
+            self[spot] = card
+
+    def __iter__(self) -> Iterator[Card | None]:
+        return iter(self._spots)
+
+    def __len__(self) -> int:
+        """The number of spots, occupied or not."""
+        return len(self._spots)
+
+    def __bool__(self) -> bool:
+        return self._occupied != 0
+
+    def __contains__(self, card) -> bool:
+        """Whether the Pokémon is on the bench, or for None, whether a spot is free."""
+        if card is None:
+            return self._occupied != self._full
+        return id(card) in self._spot_of
+
+    def __getitem__(self, spot):
+        return self._spots[spot]
+
+    def __setitem__(self, spot: int, card: Card | None):
+        spots = self._spots
+        previous = spots[spot]
+        if previous is not None:
+            del self._spot_of[id(previous)]
+        spots[spot] = card
+        if card is not None:
+            self._spot_of[id(card)] = spot
+            self._occupied |= 1 << spot
+        else:
+            self._occupied &= ~(1 << spot)
+
+    def __repr__(self) -> str:
+        return f"Bench({self._spots!r})"
+
+    def occupied(self) -> int:
+        """The number of Pokémon on the bench."""
+        return self._occupied.bit_count()
+
+    def is_full(self) -> bool:
+        return self._occupied == self._full
+
+    def spot_of(self, card: Card) -> int | None:
+        """The spot of the Pokémon, or None if it is not on the bench."""
+        return self._spot_of.get(id(card))
+
+    def first_free(self) -> int | None:
+        """The first free spot, or None if the bench is full."""
+        free = self._full ^ self._occupied
+        return (free & -free).bit_length() - 1 if free else None
+
+    def first_occupied(self) -> int | None:
+        """The first spot with a Pokémon, or None if the bench is empty."""
+        occupied = self._occupied
+        return (occupied & -occupied).bit_length() - 1 if occupied else None
+
+    def index(self, card: Card | None) -> int:
+        """The spot of the Pokémon, or the first free spot for None, raising ValueError like list.index."""
+        spot = self.first_free() if card is None else self._spot_of.get(id(card))
+        if spot is None:
+            raise ValueError("Not on the bench." if card is not None else "The bench is full.")
+        return spot
+
+    def copy(self) -> Bench:
+        copy = Bench.__new__(Bench)
+        copy._spots = self._spots.copy()
+        copy._spot_of = self._spot_of.copy()
+        copy._occupied = self._occupied
+        copy._full = self._full
+        return copy
@@ -1,5 +1,12 @@
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from ptcgp_sim.models.energy import COLORLESS_CODE, ENERGY_CODES, ENERGY_INDEX
+
+
+DAMAGE_PATTERN = re.compile(r"(\d+)\s*([x×+])?")
+MULTIPLY_MODIFIER = "x"  # e.g. "50x": 50 damage for each of something
+PLUS_MODIFIER = "+"  # e.g. "30+": 30 damage, plus more under some condition
 
 
 @dataclass
@@ -11,12 +18,60 @@ class Attack:
     effect: str | None = None
     damage: str | None = None
 
+    # Compiled from costs and damage when the attack is loaded, see compile()
+    cost_vector: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    typed_costs: tuple[tuple[int, int], ...] = field(init=False, repr=False, compare=False)
+    colorless_cost: int = field(init=False, repr=False, compare=False)
+    total_cost: int = field(init=False, repr=False, compare=False)
+    base_damage: int = field(init=False, repr=False, compare=False)
+    damage_modifier: str | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.compile()
+
+    def compile(self):
+        """
+        Parses the costs and damage strings into the fields used during a game. Costs such as
+        "GCC" become a count vector over ENERGY_CODES plus a colorless count, and damage such
+        as "50x" becomes a base damage of 50 with modifier "x".
+        Call again after changing costs or damage.
+        """
+        counts = [0] * len(ENERGY_CODES)
+        colorless = 0
+        for code in self.costs or "":
+            if code == COLORLESS_CODE:
+                colorless += 1
+            elif code in ENERGY_INDEX:
+                counts[ENERGY_INDEX[code]] += 1
+            else:
+                raise ValueError(f"Unknown energy code {code!r} in the costs of attack {self.name!r}")
+        self.cost_vector = tuple(counts)
+        self.typed_costs = tuple((index, count) for index, count in enumerate(counts) if count)
+        self.colorless_cost = colorless
+        self.total_cost = sum(counts) + colorless
+
+        match = DAMAGE_PATTERN.search(self.damage) if self.damage else None
+        if match:
+            self.base_damage = int(match.group(1))
+            modifier = match.group(2)
+            self.damage_modifier = MULTIPLY_MODIFIER if modifier == "×" else modifier
+        else:
+            self.base_damage = 0
+            self.damage_modifier = None
+
     def __str__(self):
         return f"""{{{self.costs}}} {self.name}{' ' + self.damage if self.damage else ''}{': ' + self.effect if self.effect else ''}"""
 
     def get_damage(self):
         """Returns the numeric portion of the damage string as an int, or 0 if none is found."""
-        if not self.damage:
-            return 0
-        match = re.search(r'\d+', self.damage)
-        return int(match.group()) if match else 0
+        return self.base_damage
+
+    def is_affordable(self, energy_counts) -> bool:
+        """
+        Checks the cost against a count vector of attached energy over ENERGY_CODES.
+        Typed costs must be met by energy of that type; colorless costs by whatever is left over.
+        """
+        for index, need in self.typed_costs:
+            if energy_counts[index] < need:
+                return False
+        return sum(energy_counts) >= self.total_cost
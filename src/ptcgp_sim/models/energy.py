@@ -1,6 +1,13 @@
 from dataclasses import dataclass
 
 
+COLORLESS_CODE = "C"  # Attack costs use this code for energy of any type
+
+# The typed energy codes, in a fixed order. Energy requirements and attached energy are kept
+# as count vectors indexed by this order.
+ENERGY_CODES = ("G", "R", "W", "L", "P", "F", "D", "M", "A")
+ENERGY_INDEX = {code: index for index, code in enumerate(ENERGY_CODES)}
+
 @dataclass
 class Energy:
     id: int
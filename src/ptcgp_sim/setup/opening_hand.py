@@ -0,0 +1,134 @@
+"""
+Exact probabilities of the cards a player starts with and draws, as dealt by setup_player.
+
+setup_player searches the shuffled deck for a Basic Pokémon, picked uniformly from the Basics of
+the deck, then draws the other 4 cards, and every later card, uniformly from the rest. After n
+cards, a player has therefore seen a random Basic plus a uniformly random set of n - 1 of the
+other cards. Every distribution below follows from that in closed form, as (multivariate)
+hypergeometric terms.
+
+The functions take deck compositions as NumPy arrays and broadcast over them, so the
+probabilities of thousands of decks are a few array operations, without shuffling any deck.
+"""
+from __future__ import annotations
+import math
+
+import numpy as np
+
+from ptcgp_sim.game.objects.player import MAX_BENCH_SIZE
+
+
+DECK_SIZE = 20
+OPENING_HAND_SIZE = 5
+
+_MAX_CARDS = 60
+_COMB = np.array([[math.comb(n, k) for k in range(_MAX_CARDS + 1)] for n in range(_MAX_CARDS + 1)], dtype=np.float64)
+
+
+def _comb(n, k) -> np.ndarray:
+    """Binomial coefficients of arrays, 0 where k < 0 or k > n."""
+    n = np.asarray(n)
+    k = np.asarray(k)
+    valid = (k >= 0) & (k <= n)
+    return np.where(valid, _COMB[np.clip(n, 0, _MAX_CARDS), np.clip(k, 0, _MAX_CARDS)], 0.0)
+
+
+def cards_seen(turn, went_first=True) -> np.ndarray:
+    """
+    Cards a player has seen by game turn `turn` (counted from 1 for both players, as in
+    GameState.turn_number), including the draw of that turn. Every turn starts with a draw.
+    """
+    turn = np.asarray(turn)
+    own_turns = np.where(went_first, (turn + 1) // 2, turn // 2)
+    return np.minimum(OPENING_HAND_SIZE + own_turns, DECK_SIZE)
+
+
+def basics_seen(n_basics, n_cards: int = OPENING_HAND_SIZE, deck_size: int = DECK_SIZE) -> np.ndarray:
+    """
+    The distribution of the number of Basic Pokémon among the first n_cards cards, for decks with
+    n_basics Basics. Returns an array of shape n_basics.shape + (n_cards + 1,): the probability of
+    0, 1, ..., n_cards Basics.
+    """
+    n_basics = np.asarray(n_basics)[..., None]
+    basics = np.arange(n_cards + 1)
+    # The searched Basic, and basics - 1 more Basics among the other cards drawn
+    return (_comb(n_basics - 1, basics - 1) * _comb(deck_size - n_basics, n_cards - basics)
+            / _comb(deck_size - 1, n_cards - 1))
+
+
+def bench_size(n_basics, deck_size: int = DECK_SIZE) -> np.ndarray:
+    """
+    The distribution of the number of Pokémon setup_player benches: every Basic of the opening
+    hand but the active one, up to MAX_BENCH_SIZE. Returns an array of shape
+    n_basics.shape + (MAX_BENCH_SIZE + 1,).
+    """
+    hand = basics_seen(n_basics, OPENING_HAND_SIZE, deck_size)
+    bench = np.zeros(hand.shape[:-1] + (MAX_BENCH_SIZE + 1,))
+    for basics in range(1, OPENING_HAND_SIZE + 1):
+        bench[..., min(basics - 1, MAX_BENCH_SIZE)] += hand[..., basics]
+    return bench
+
+
+def prob_seen(copies, basic, n_basics, n_cards=OPENING_HAND_SIZE, deck_size: int = DECK_SIZE) -> np.ndarray:
+    """
+    The probability that at least one of `copies` copies of a card is among the first n_cards
+    cards, for a card that is a Basic or not (`basic`) in a deck with n_basics Basics. All
+    arguments broadcast, so many cards, decks or numbers of cards can be scored at once.
+    """
+    copies, basic, n_basics, n_cards = np.broadcast_arrays(copies, basic, n_basics, n_cards)
+    # No copy among the n_cards - 1 cards drawn from the rest of the deck ...
+    none_drawn = _comb(deck_size - 1 - copies, n_cards - 1) / _comb(deck_size - 1, n_cards - 1)
+    # ... and, for a Basic, none searched either
+    none_searched = np.where(basic, (n_basics - copies) / np.maximum(n_basics, 1), 1.0)
+    return 1.0 - none_searched * none_drawn
+
+
+def prob_seen_by_turn(copies, basic, n_basics, turn, went_first=True, deck_size: int = DECK_SIZE) -> np.ndarray:
+    """The probability of having drawn at least one copy of a card by game turn `turn`; see prob_seen."""
+    return prob_seen(copies, basic, n_basics, cards_seen(turn, went_first), deck_size)
+
+
+def _compositions(n_cards: int, limits: np.ndarray) -> np.ndarray:
+    """Every way to pick n_cards cards of len(limits) kinds, with at most limits[i] of kind i."""
+    partial = np.zeros((1, 0), dtype=np.int64)
+    sums = np.zeros(1, dtype=np.int64)
+    for limit in limits:
+        picks = np.arange(min(int(limit), n_cards) + 1)
+        partial = np.hstack([np.repeat(partial, len(picks), axis=0), np.tile(picks, len(partial))[:, None]])
+        sums = np.repeat(sums, len(picks)) + np.tile(picks, len(sums))
+        keep = sums <= n_cards
+        partial, sums = partial[keep], sums[keep]
+    return partial[sums == n_cards]
+
+
+def hand_distribution(counts, basic, n_cards: int = OPENING_HAND_SIZE) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The distribution of the first n_cards cards of decks, by how many copies of each card they hold.
+    counts has shape (kinds,) or (decks, kinds): the copies of each kind of card in each deck;
+    basic has shape (kinds,): whether each kind is a Basic Pokémon. Returns hands, of shape
+    (hands, kinds), and their probabilities, of shape (hands,) or (decks, hands).
+    The number of hands grows quickly with n_cards and kinds, so this is meant for opening hands
+    and the first few draws.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    single = counts.ndim == 1
+    counts = np.atleast_2d(counts)
+    basic = np.asarray(basic, dtype=bool)
+    deck_size = counts.sum(axis=1)[:, None]
+    n_basics = (counts * basic).sum(axis=1)[:, None]
+
+    hands = _compositions(n_cards, counts.max(axis=0))
+    probs = np.zeros((len(counts), len(hands)))
+    total = _comb(deck_size - 1, n_cards - 1)
+    for kind in np.flatnonzero(basic):
+        # Hands where a card of this kind is the searched Basic, and the other cards are drawn
+        has_kind = hands[:, kind] > 0
+        drawn = hands[has_kind].copy()
+        drawn[:, kind] -= 1
+        left = counts.copy()
+        left[:, kind] -= 1
+        p_drawn = _comb(left[:, None, :], drawn[None, :, :]).prod(axis=2) / total
+        p_searched = counts[:, kind, None] / np.maximum(n_basics, 1)
+        probs[:, has_kind] += p_searched * p_drawn
+
+    return hands, probs[0] if single else probs
@@ -0,0 +1,6 @@
+from .encoder import OBSERVATION_SIZE, ObservationEncoder, encode_game_state
+from .results import RESULT_DTYPE, ResultsStore, first_player_win_rate, summarize_decks
+from .replay import Replay, ReplayHeader, ReplayWriter, read_replays, record_game
+from .runner import GameResult, MatchupResult, run_game, run_matchup
+from .tournament import TournamentResult, run_tournament
+from .vec_env import VecEnv
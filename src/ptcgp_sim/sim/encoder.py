@@ -0,0 +1,171 @@
+"""
+Encodes game states as fixed-size NumPy vectors, for many games at once.
+
+Each game is one row of a preallocated float32 batch array. The row holds, for each player in
+seat order, their Pokémon slots (active, then bench) followed by the player's counters, and
+finally a few global values:
+
+    slot:    present, current hp, max hp, attached energy count per type (ENERGY_CODES order)
+    player:  hand size, deck size, discard pile size, points,
+             energy zone current and next energy (one-hot over ENERGY_CODES, zeros if none)
+    global:  turn number, current player index, game over
+
+Values are not normalized. The encoder remembers, for every row, the game it holds and the
+change counter (GameState.versions) of every player and slotted card when they were written.
+update() skips the slots whose card and counter are unchanged, and the players whose counter is,
+without reading them; the parts it does recompute are only written if their values differ.
+Changes must go through the GameState hooks to be seen, as they must to keep the hash current.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ptcgp_sim.game.objects.player import MAX_BENCH_SIZE
+from ptcgp_sim.models.energy import ENERGY_CODES, ENERGY_INDEX
+
+if TYPE_CHECKING:
+    from ptcgp_sim.game.objects.card import Card
+    from ptcgp_sim.game.objects.player import Player
+    from ptcgp_sim.game.logic.game_state import GameState
+
+
+N_PLAYERS = 2
+N_ENERGY_TYPES = len(ENERGY_CODES)
+
+SLOTS_PER_PLAYER = 1 + MAX_BENCH_SIZE  # Active first, then the bench spots
+SLOT_SIZE = 3 + N_ENERGY_TYPES
+PLAYER_COUNTERS_SIZE = 4 + 2 * N_ENERGY_TYPES
+PLAYER_SIZE = SLOTS_PER_PLAYER * SLOT_SIZE + PLAYER_COUNTERS_SIZE
+GLOBAL_SIZE = 3
+OBSERVATION_SIZE = N_PLAYERS * PLAYER_SIZE + GLOBAL_SIZE
+
+N_SLOTS = N_PLAYERS * SLOTS_PER_PLAYER
+EMPTY_SLOT = (0.0,) * SLOT_SIZE
+
+
+def slot_offset(player_index: int, slot: int) -> int:
+    """Column of the first value of a Pokémon slot. Slot 0 is the active spot, slot i + 1 bench spot i."""
+    return player_index * PLAYER_SIZE + slot * SLOT_SIZE
+
+
+def counters_offset(player_index: int) -> int:
+    """Column of the first counter of a player."""
+    return player_index * PLAYER_SIZE + SLOTS_PER_PLAYER * SLOT_SIZE
+
+
+GLOBAL_OFFSET = N_PLAYERS * PLAYER_SIZE
+
+
+def _slot_values(card: Card | None) -> tuple:
+    if card is None:
+        return EMPTY_SLOT
+    return (1.0, card.current_hp, card.max_hp, *card.energy_counts)
+
+
+def _counter_values(player: Player) -> tuple:
+    values = [0.0] * PLAYER_COUNTERS_SIZE
+    values[0] = len(player.hand)
+    values[1] = len(player.deck)
+    values[2] = len(player.discard_pile)
+    values[3] = player.points
+    energy_zone = player.energy_zone
+    if energy_zone is not None:
+        if energy_zone.current is not None:
+            values[4 + ENERGY_INDEX[energy_zone.current.code]] = 1.0
+        if energy_zone.next is not None:
+            values[4 + N_ENERGY_TYPES + ENERGY_INDEX[energy_zone.next.code]] = 1.0
+    return tuple(values)
+
+
+class ObservationEncoder:
+    """Encodes up to batch_size games into the rows of `observations`, a (batch_size, OBSERVATION_SIZE) array."""
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.observations = np.zeros((batch_size, OBSERVATION_SIZE), dtype=np.float32)
+        # The game each row holds, and per slot and per player the values last written to the row
+        # and the card and version they were computed from.
+        self._games: list[GameState | None] = [None] * batch_size
+        self._slots: list[list[tuple | None]] = [[None] * N_SLOTS for _ in range(batch_size)]
+        self._slot_cards: list[list[Card | None]] = [[None] * N_SLOTS for _ in range(batch_size)]
+        self._slot_versions: list[list[int]] = [[-1] * N_SLOTS for _ in range(batch_size)]
+        self._counters: list[list[tuple | None]] = [[None] * N_PLAYERS for _ in range(batch_size)]
+        self._counter_versions: list[list[int]] = [[-1] * N_PLAYERS for _ in range(batch_size)]
+
+    def encode(self, index: int, game_state: GameState) -> np.ndarray:
+        """Encodes a game into row `index` from scratch and returns the row."""
+        self._games[index] = None
+        self.update(index, game_state)
+        return self.observations[index]
+
+    def update(self, index: int, game_state: GameState) -> int:
+        """
+        Brings row `index` up to date with its game. Only the slots and players that changed since
+        the last update are recomputed, and only the ones whose values differ are written. A game
+        the row does not hold yet is encoded from scratch. Returns the number of parts written.
+        """
+        if self._games[index] is not game_state:
+            self._games[index] = game_state
+            self._slots[index] = [None] * N_SLOTS
+            self._slot_cards[index] = [None] * N_SLOTS
+            self._slot_versions[index] = [-1] * N_SLOTS
+            self._counters[index] = [None] * N_PLAYERS
+            self._counter_versions[index] = [-1] * N_PLAYERS
+        row = self.observations[index]
+        slots = self._slots[index]
+        slot_cards = self._slot_cards[index]
+        slot_versions = self._slot_versions[index]
+        counters = self._counters[index]
+        counter_versions = self._counter_versions[index]
+        versions = game_state.versions
+        written = 0
+
+        for player_index, player in enumerate(game_state.players):
+            slot_index = player_index * SLOTS_PER_PLAYER
+            for slot, card in enumerate((player.active_pokemon, *player.bench), slot_index):
+                version = versions[card.instance_id] if card is not None else -1
+                if card is slot_cards[slot] and version == slot_versions[slot] and slots[slot] is not None:
+                    continue
+                slot_cards[slot] = card
+                slot_versions[slot] = version
+                values = _slot_values(card)
+                if values != slots[slot]:
+                    offset = slot_offset(player_index, slot - slot_index)
+                    row[offset:offset + SLOT_SIZE] = values
+                    slots[slot] = values
+                    written += 1
+
+            version = versions[player.instance_id]
+            if version == counter_versions[player_index]:
+                continue
+            counter_versions[player_index] = version
+            values = _counter_values(player)
+            if values != counters[player_index]:
+                offset = counters_offset(player_index)
+                row[offset:offset + PLAYER_COUNTERS_SIZE] = values
+                counters[player_index] = values
+                written += 1
+
+        # The global values are three scalars, cheaper to write than to compare.
+        row[GLOBAL_OFFSET] = game_state.turn_number
+        row[GLOBAL_OFFSET + 1] = game_state.current_player_index
+        row[GLOBAL_OFFSET + 2] = game_state.is_game_over
+        return written
+
+    def encode_batch(self, game_states: list[GameState]) -> np.ndarray:
+        """Encodes a list of games into the first rows from scratch and returns the whole batch."""
+        for index, game_state in enumerate(game_states):
+            self.encode(index, game_state)
+        return self.observations
+
+    def update_batch(self, game_states: list[GameState]) -> np.ndarray:
+        """Updates the first rows with the games previously encoded into them and returns the whole batch."""
+        for index, game_state in enumerate(game_states):
+            self.update(index, game_state)
+        return self.observations
+
+
+def encode_game_state(game_state: GameState) -> np.ndarray:
+    """Encodes a single game into a new vector of size OBSERVATION_SIZE."""
+    return ObservationEncoder(1).encode(0, game_state)
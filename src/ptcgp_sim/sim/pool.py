@@ -0,0 +1,55 @@
+"""
+Process pools whose tasks all take the same config, e.g. a MatchupConfig, as their first argument.
+
+The config is sent to each worker once, when the worker starts, instead of with every task:
+
+    with ConfigPool(config, workers) as pool:
+        results = list(pool.map(play_games, starts, counts))
+
+calls play_games(config, start, count) for each start and count. Task functions must be defined
+at module level, so that workers can unpickle them. With one worker, tasks run in this process.
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator
+
+
+# The config of the pool a worker process belongs to, set when the worker starts
+_worker_config: Any = None
+
+
+def _init_worker(config):
+    global _worker_config
+    _worker_config = config
+
+
+def _call_with_config(function: Callable, *args):
+    return function(_worker_config, *args)
+
+
+class ConfigPool:
+    """A pool of `workers` processes that all hold `config`. Use it as a context manager, or call shutdown()."""
+
+    def __init__(self, config, workers: int):
+        self.config = config
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        if workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config,))
+
+    def map(self, function: Callable, *iterables: Iterable, chunksize: int = 1) -> Iterator:
+        """Calls function(config, *args) for the args of every task, like map(); results come in task order."""
+        if self._executor is None:
+            return map(partial(function, self.config), *iterables)
+        return self._executor.map(partial(_call_with_config, function), *iterables, chunksize=chunksize)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def __enter__(self) -> ConfigPool:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
@@ -0,0 +1,253 @@
+"""
+A compact binary format for replays: every game is its seed and the ids of the actions taken.
+
+Since a game draws all of its randomness from its seed (see game.logic.rng), playing the actions
+again from the seed reproduces the game exactly, so replays can be audited or stepped through to
+any point without storing any game state.
+
+A replay file starts with MAGIC and holds a sequence of records, each starting with its type:
+
+    matchup  deck codes and energy zone types of deck A and B, max turns, engine version
+    game     seed, whether deck A went first, number of actions, action ids
+
+A game record belongs to the last matchup record before it; ReplayWriter only writes a matchup
+record when the matchup changes, so a game takes a few dozen bytes. Integers are unsigned
+LEB128 varints and strings are varint-length-prefixed UTF-8.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Mapping
+
+from ptcgp_sim.game.logic.actions import apply_action
+from ptcgp_sim.game.logic.rng import GameRandom
+from ptcgp_sim.sim.runner import DEFAULT_MAX_TURNS, MatchupConfig, create_game
+
+if TYPE_CHECKING:
+    from ptcgp_sim.game.logic.game_controller import GameController
+    from ptcgp_sim.models.card import CardData
+    from ptcgp_sim.models.energy import Energy
+
+
+MAGIC = b"PTCGPR\x01"
+ENGINE_VERSION = 2  # Bump when a change to the game logic makes recorded games play out differently
+
+MATCHUP_RECORD = 0
+GAME_RECORD = 1
+
+
+@dataclass(frozen=True)
+class ReplayHeader:
+    """The matchup a replay was played in, with cards and energy types by code."""
+    deck_a: tuple[str, ...]
+    deck_b: tuple[str, ...]
+    energy_types_a: tuple[str, ...]
+    energy_types_b: tuple[str, ...]
+    max_turns: int = DEFAULT_MAX_TURNS
+    engine_version: int = ENGINE_VERSION
+
+    @classmethod
+    def from_config(cls, config: MatchupConfig) -> ReplayHeader:
+        return cls(
+            deck_a=tuple(card_data.code for card_data in config.deck_a),
+            deck_b=tuple(card_data.code for card_data in config.deck_b),
+            energy_types_a=tuple(energy.code for energy in config.energy_types_a),
+            energy_types_b=tuple(energy.code for energy in config.energy_types_b),
+            max_turns=config.max_turns,
+        )
+
+    def to_config(self, cards: Mapping[str, CardData], energies: Mapping[str, Energy]) -> MatchupConfig:
+        """The matchup, with card data and energy types looked up by code."""
+        return MatchupConfig(
+            deck_a=[cards[code] for code in self.deck_a],
+            deck_b=[cards[code] for code in self.deck_b],
+            energy_types_a=[energies[code] for code in self.energy_types_a],
+            energy_types_b=[energies[code] for code in self.energy_types_b],
+            max_turns=self.max_turns,
+        )
+
+
+@dataclass
+class Replay:
+    """A recorded game: its matchup, seed, turn order and the action ids taken."""
+    header: ReplayHeader
+    seed: int
+    a_first: bool = True
+    actions: list[int] = field(default_factory=list)
+
+    def simulate(self, cards: Mapping[str, CardData], energies: Mapping[str, Energy]) -> Iterator[GameController]:
+        """
+        Plays the game again, one action at a time. Yields the controller once the game has
+        started and again after each action; it is the same controller every time, so stop
+        iterating to look at the game at that point.
+        Raises ValueError if the replay comes from another engine version, or stops matching the game.
+        """
+        if self.header.engine_version != ENGINE_VERSION:
+            raise ValueError(f"Replay was recorded with engine version {self.header.engine_version}, "
+                             f"this is version {ENGINE_VERSION}.")
+        config = self.header.to_config(cards, energies)
+        controller, _ = create_game(config, self.a_first, hashing=False, rng=GameRandom(self.seed), logging=False)
+        game_state = controller.game_state
+        controller.start_game()
+        yield controller
+
+        for index, action in enumerate(self.actions):
+            if not apply_action(controller, action):
+                raise ValueError(f"Action {index} of the replay ({action}) is not legal in the replayed game.")
+            if not game_state.is_game_over and game_state.turn_number > config.max_turns:
+                game_state.end_in_draw()
+            yield controller
+
+    def replay_to(self, cards: Mapping[str, CardData], energies: Mapping[str, Energy],
+                  n_actions: int | None = None) -> GameController:
+        """Plays the game again up to its first n_actions actions, or to the end, and returns the controller."""
+        n_actions = len(self.actions) if n_actions is None else n_actions
+        for index, controller in enumerate(self.simulate(cards, energies)):
+            if index == n_actions:
+                break
+        return controller
+
+
+def record_game(config: MatchupConfig, game_index: int = 0, a_first: bool | None = None) -> Replay:
+    """
+    Plays game game_index of a matchup like sim.runner does and records it. Deck A goes first in
+    even-numbered games unless a_first is given. An unseeded matchup records a fresh seed.
+    """
+    seed = config.game_seed(game_index)
+    if a_first is None:
+        a_first = game_index % 2 == 0
+    replay = Replay(ReplayHeader.from_config(config), seed, a_first)
+
+    controller, _ = create_game(config, a_first, hashing=False, rng=GameRandom(seed), logging=False,
+                                game_id=game_index)
+    controller.action_listener = replay.actions.append
+    game_state = controller.game_state
+    agents = [config.agent_cls(), config.agent_cls()]
+    controller.start_game()
+    while not game_state.is_game_over:
+        if game_state.turn_number > config.max_turns:
+            game_state.end_in_draw()
+            break
+        agents[game_state.current_player_index].take_turn(controller)
+    return replay
+
+
+# --- Encoding ---
+
+def _write_varint(buffer: bytearray, value: int):
+    while value >= 0x80:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _write_string(buffer: bytearray, value: str):
+    data = value.encode()
+    _write_varint(buffer, len(data))
+    buffer += data
+
+
+def _write_strings(buffer: bytearray, values: tuple[str, ...]):
+    _write_varint(buffer, len(values))
+    for value in values:
+        _write_string(buffer, value)
+
+
+class _Reader:
+    """Reads varints and strings from a binary stream, through a buffer."""
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = 1 << 16):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.data = b""
+        self.position = 0
+
+    def at_end(self) -> bool:
+        if self.position < len(self.data):
+            return False
+        self.data = self.stream.read(self.chunk_size)
+        self.position = 0
+        return not self.data
+
+    def byte(self) -> int:
+        if self.at_end():
+            raise ValueError("Replay file ends in the middle of a record.")
+        value = self.data[self.position]
+        self.position += 1
+        return value
+
+    def bytes(self, size: int) -> bytes:
+        parts = []
+        while size:
+            if self.at_end():
+                raise ValueError("Replay file ends in the middle of a record.")
+            part = self.data[self.position:self.position + size]
+            self.position += len(part)
+            size -= len(part)
+            parts.append(part)
+        return b"".join(parts)
+
+    def varint(self) -> int:
+        value = shift = 0
+        while True:
+            byte = self.byte()
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def string(self) -> str:
+        return self.bytes(self.varint()).decode()
+
+    def strings(self) -> tuple[str, ...]:
+        return tuple(self.string() for _ in range(self.varint()))
+
+
+class ReplayWriter:
+    """Writes replays to a binary stream, e.g. a file opened with 'wb'."""
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self._header: ReplayHeader | None = None
+        stream.write(MAGIC)
+
+    def write(self, replay: Replay):
+        buffer = bytearray()
+        header = replay.header
+        if header != self._header:
+            buffer.append(MATCHUP_RECORD)
+            for codes in (header.deck_a, header.deck_b, header.energy_types_a, header.energy_types_b):
+                _write_strings(buffer, codes)
+            _write_varint(buffer, header.max_turns)
+            _write_varint(buffer, header.engine_version)
+            self._header = header
+
+        buffer.append(GAME_RECORD)
+        _write_varint(buffer, replay.seed)
+        buffer.append(replay.a_first)
+        _write_varint(buffer, len(replay.actions))
+        for action in replay.actions:
+            _write_varint(buffer, action)
+        self.stream.write(buffer)
+
+
+def read_replays(stream: BinaryIO) -> Iterator[Replay]:
+    """Reads the replays in a binary stream one by one, without loading the whole stream."""
+    reader = _Reader(stream)
+    if reader.bytes(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a replay file.")
+
+    header: ReplayHeader | None = None
+    while not reader.at_end():
+        record_type = reader.byte()
+        if record_type == MATCHUP_RECORD:
+            decks_and_energy = [reader.strings() for _ in range(4)]
+            header = ReplayHeader(*decks_and_energy, max_turns=reader.varint(), engine_version=reader.varint())
+        elif record_type == GAME_RECORD:
+            if header is None:
+                raise ValueError("Replay file has a game before its matchup.")
+            seed = reader.varint()
+            a_first = reader.byte() == 1
+            actions = [reader.varint() for _ in range(reader.varint())]
+            yield Replay(header, seed, a_first, actions)
+        else:
+            raise ValueError(f"Unknown replay record type {record_type}.")
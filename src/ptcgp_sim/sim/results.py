@@ -0,0 +1,210 @@
+"""
+A columnar store for the outcomes of many games.
+
+Every game is one record of RESULT_DTYPE, a 24-byte NumPy structured type:
+
+    deck_a, deck_b          ids of the two decks, assigned by the caller
+    seed                    the seed the game was played with, to replay it
+    winner                  0 for deck A, 1 for deck B, -1 for a draw
+    first                   the deck that took the first turn, 0 or 1
+    turns                   the number of turns played
+    points_a, points_b      points of each deck at the end
+    knockouts_a, _b         Pokémon each deck knocked out
+
+ResultsStore appends records to a preallocated chunk. When the chunk is full it is saved as a
+.npy shard in the store's directory, or kept in memory for a store without one. records() loads
+the shards memory-mapped, so a store of many millions of games opens without reading it.
+summarize_decks() and first_player_win_rate() compute their summaries with bincount, in a few
+passes over the columns.
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ptcgp_sim.sim.runner import play_game
+
+if TYPE_CHECKING:
+    from ptcgp_sim.sim.runner import GameResult, MatchupConfig
+
+
+DEFAULT_CHUNK_SIZE = 1 << 16  # Records per shard
+DRAW = -1
+
+RESULT_DTYPE = np.dtype([
+    ("deck_a", np.int32),
+    ("deck_b", np.int32),
+    ("seed", np.uint64),
+    ("winner", np.int8),
+    ("first", np.int8),
+    ("turns", np.uint16),
+    ("points_a", np.uint8),
+    ("points_b", np.uint8),
+    ("knockouts_a", np.uint8),
+    ("knockouts_b", np.uint8),
+])
+
+SUMMARY_DTYPE = np.dtype([
+    ("deck", np.int32),
+    ("games", np.int64),
+    ("wins", np.int64),
+    ("draws", np.int64),
+    ("win_rate", np.float64),
+    ("games_first", np.int64),
+    ("wins_first", np.int64),
+    ("win_rate_first", np.float64),
+    ("games_second", np.int64),
+    ("wins_second", np.int64),
+    ("win_rate_second", np.float64),
+])
+
+
+def result_record(deck_a: int, deck_b: int, result: GameResult) -> tuple:
+    """A game result as a tuple in RESULT_DTYPE field order."""
+    return (
+        deck_a, deck_b, result.seed, DRAW if result.winner is None else result.winner, result.first,
+        result.turns, *result.points, *result.knockouts,
+    )
+
+
+def play_game_records(config: MatchupConfig, start: int, count: int, deck_a: int = 0, deck_b: int = 1) -> np.ndarray:
+    """
+    Plays games [start, start + count) of a matchup, like runner.play_games, and returns their records.
+    At 24 bytes a game, the records are cheap to send back from a worker process.
+    """
+    records = np.empty(count, dtype=RESULT_DTYPE)
+    for offset, game_index in enumerate(range(start, start + count)):
+        result = play_game(config, a_first=game_index % 2 == 0, seed=config.game_seed(game_index), game_id=game_index)
+        records[offset] = result_record(deck_a, deck_b, result)
+    return records
+
+
+class ResultsStore:
+    """
+    Game records, appended in chunks of chunk_size. With a directory, full chunks are saved there
+    as shards named results-00000.npy, results-00001.npy, ...; an existing directory is appended to.
+    """
+
+    def __init__(self, directory: str | Path | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.directory = Path(directory) if directory is not None else None
+        self.chunk_size = chunk_size
+        self._chunk = np.empty(chunk_size, dtype=RESULT_DTYPE)
+        self._size = 0  # Records in the current chunk
+        self._shards: list[np.ndarray] = []  # Full chunks of a store without a directory
+        self._shard_paths: list[Path] = []
+        self._stored = 0  # Records in full chunks
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._shard_paths = sorted(self.directory.glob("results-*.npy"))
+            self._stored = sum(len(np.load(path, mmap_mode="r")) for path in self._shard_paths)
+
+    def __len__(self) -> int:
+        return self._stored + self._size
+
+    def add(self, deck_a: int, deck_b: int, result: GameResult):
+        """Adds the result of a game between two decks."""
+        self._chunk[self._size] = result_record(deck_a, deck_b, result)
+        self._size += 1
+        if self._size == self.chunk_size:
+            self.flush()
+
+    def extend(self, records: np.ndarray):
+        """Adds records of RESULT_DTYPE, e.g. from play_game_records."""
+        position = 0
+        while position < len(records):
+            count = min(len(records) - position, self.chunk_size - self._size)
+            self._chunk[self._size:self._size + count] = records[position:position + count]
+            self._size += count
+            position += count
+            if self._size == self.chunk_size:
+                self.flush()
+
+    def flush(self):
+        """Stores the records of the current chunk as a shard, even if the chunk is not full."""
+        if not self._size:
+            return
+        records = self._chunk[:self._size].copy()
+        if self.directory is not None:
+            path = self.directory / f"results-{len(self._shard_paths):05d}.npy"
+            np.save(path, records)
+            self._shard_paths.append(path)
+        else:
+            self._shards.append(records)
+        self._stored += self._size
+        self._size = 0
+
+    def records(self) -> np.ndarray:
+        """
+        All records, in the order they were added. Shards on disk are memory-mapped; the result is
+        only a single copy when there is more than one part to join.
+        """
+        parts = [np.load(path, mmap_mode="r") for path in self._shard_paths] + self._shards
+        if self._size:
+            parts.append(self._chunk[:self._size])
+        if not parts:
+            return np.empty(0, dtype=RESULT_DTYPE)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+
+def _cells(side: int) -> np.ndarray:
+    """The (went first, outcome) cell of a side, 0 for deck A and 1 for deck B, by (winner + 1) * 2 + first."""
+    cells = np.zeros(6, dtype=np.intp)
+    for winner in (DRAW, 0, 1):
+        for first in (0, 1):
+            outcome = 2 if winner == DRAW else int(winner == side)
+            cells[(winner + 1) * 2 + first] = (first == side) * 3 + outcome
+    return cells
+
+
+_CELL_A = _cells(0)
+_CELL_B = _cells(1)
+
+
+def summarize_decks(records: np.ndarray) -> np.ndarray:
+    """
+    Per deck: games, wins, draws and win rate, overall and split by whether the deck went first.
+    Returns a SUMMARY_DTYPE array with one row per deck that played, ordered by deck id.
+    """
+    deck_a = records["deck_a"].astype(np.intp)
+    deck_b = records["deck_b"].astype(np.intp)
+    size = int(max(deck_a.max(initial=-1), deck_b.max(initial=-1))) + 1
+
+    # Count games per (deck, went first, outcome) cell with one bincount per side, where the
+    # outcome is 0 for a loss, 1 for a win and 2 for a draw. The cell of each side is looked up
+    # from the winner and the first player, combined into a single index.
+    game_kind = (records["winner"].astype(np.intp) + 1) * 2 + records["first"]
+    cells = (np.bincount(deck_a * 6 + _CELL_A[game_kind], minlength=size * 6)
+             + np.bincount(deck_b * 6 + _CELL_B[game_kind], minlength=size * 6)).reshape(size, 2, 3)
+
+    games = cells.sum(axis=(1, 2))
+    wins = cells[:, :, 1].sum(axis=1)
+    draws = cells[:, :, 2].sum(axis=1)
+    games_first = cells[:, 1].sum(axis=1)
+    wins_first = cells[:, 1, 1]
+
+    played = np.flatnonzero(games)
+    summary = np.zeros(len(played), dtype=SUMMARY_DTYPE)
+    summary["deck"] = played
+    summary["games"] = games[played]
+    summary["wins"] = wins[played]
+    summary["draws"] = draws[played]
+    summary["games_first"] = games_first[played]
+    summary["wins_first"] = wins_first[played]
+    summary["games_second"] = summary["games"] - summary["games_first"]
+    summary["wins_second"] = summary["wins"] - summary["wins_first"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for rate, won, total in [("win_rate", "wins", "games"), ("win_rate_first", "wins_first", "games_first"),
+                                 ("win_rate_second", "wins_second", "games_second")]:
+            summary[rate] = np.where(summary[total] > 0, summary[won] / summary[total], 0.0)
+    return summary
+
+
+def first_player_win_rate(records: np.ndarray) -> float:
+    """The share of decided games won by the player who went first."""
+    winner = records["winner"]
+    decided = len(records) - int(np.count_nonzero(winner == DRAW))
+    if not decided:
+        return 0.0
+    # A draw never equals the first player
+    return int(np.count_nonzero(winner == records["first"])) / decided
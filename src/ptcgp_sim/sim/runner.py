@@ -0,0 +1,231 @@
+"""
+Headless batch runner for simulating many games between two decks.
+
+Games are played by AI controllers through the public GameController API and are
+spread over a process pool. Each worker plays a chunk of games and only sends back
+aggregated counts, so the cost of inter-process communication does not grow with
+the number of games.
+
+With a seed, game i of a matchup draws all of its randomness from GameRandom.for_game(seed, i),
+so any game can be played again on its own, in any process, with the same outcome.
+"""
+from __future__ import annotations
+import os
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from ptcgp_sim.ai.simple_ai_controller import SimpleAIController
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+from ptcgp_sim.game.logic.game_controller import GameController
+from ptcgp_sim.game.logic.game_log import NullGameLog
+from ptcgp_sim.game.logic.rng import GameRandom, derive_seed
+from ptcgp_sim.setup.setup_player import setup_player
+from ptcgp_sim.sim.pool import ConfigPool
+
+if TYPE_CHECKING:
+    from ptcgp_sim.game.objects.player import Player
+    from ptcgp_sim.models.card import CardData
+    from ptcgp_sim.models.energy import Energy
+
+
+DEFAULT_MAX_TURNS = 100  # Games that are still running after this many turns end in a draw
+DEFAULT_CHUNK_SIZE = 250  # Number of games a worker plays per task
+DECK_NAMES = ("A", "B")
+
+
+@dataclass
+class GameResult:
+    """The outcome of a single game between deck A (0) and deck B (1)."""
+    winner: int | None  # 0 or 1, or None for a draw
+    turns: int
+    first: int  # The deck that took the first turn
+    points: tuple[int, int]
+    knockouts: tuple[int, int] = (0, 0)  # Pokémon each deck knocked out
+    seed: int = 0  # The seed the game was played with
+
+
+@dataclass
+class MatchupResult:
+    """Aggregated outcomes of many games between deck A and deck B."""
+    games: int = 0
+    wins: list[int] = field(default_factory=lambda: [0, 0])
+    draws: int = 0
+    first_player_wins: int = 0
+    total_turns: int = 0
+    turn_histogram: dict[int, int] = field(default_factory=dict)
+
+    def add(self, result: GameResult):
+        """Adds the outcome of a single game."""
+        self.games += 1
+        if result.winner is None:
+            self.draws += 1
+        else:
+            self.wins[result.winner] += 1
+            if result.winner == result.first:
+                self.first_player_wins += 1
+        self.total_turns += result.turns
+        self.turn_histogram[result.turns] = self.turn_histogram.get(result.turns, 0) + 1
+
+    def merge(self, other: MatchupResult):
+        """Adds the outcomes aggregated in another result."""
+        self.games += other.games
+        self.wins[0] += other.wins[0]
+        self.wins[1] += other.wins[1]
+        self.draws += other.draws
+        self.first_player_wins += other.first_player_wins
+        self.total_turns += other.total_turns
+        for turns, count in other.turn_histogram.items():
+            self.turn_histogram[turns] = self.turn_histogram.get(turns, 0) + count
+
+    @property
+    def win_rate_a(self) -> float:
+        return self.wins[0] / self.games if self.games else 0.0
+
+    @property
+    def win_rate_b(self) -> float:
+        return self.wins[1] / self.games if self.games else 0.0
+
+    @property
+    def draw_rate(self) -> float:
+        return self.draws / self.games if self.games else 0.0
+
+    @property
+    def first_player_win_rate(self) -> float:
+        decided = self.games - self.draws
+        return self.first_player_wins / decided if decided else 0.0
+
+    @property
+    def mean_turns(self) -> float:
+        return self.total_turns / self.games if self.games else 0.0
+
+
+@dataclass
+class MatchupConfig:
+    """Everything a worker needs to play games of a matchup."""
+    deck_a: list[CardData]
+    deck_b: list[CardData]
+    energy_types_a: list[Energy]
+    energy_types_b: list[Energy]
+    max_turns: int = DEFAULT_MAX_TURNS
+    agent_cls: type = SimpleAIController
+    seed: int | None = None  # Master seed of the games; None for unseeded games
+
+    def game_seed(self, game_index: int) -> int:
+        """The seed of a game of the matchup; a fresh one every time if the matchup is unseeded."""
+        if self.seed is None:
+            return GameRandom().getrandbits(64)
+        return derive_seed(self.seed, game_index)
+
+    def game_rng(self, game_index: int) -> GameRandom:
+        """The random number generator of a game of the matchup."""
+        return GameRandom(self.game_seed(game_index))
+
+
+def run_game(controller: GameController, agents: list, max_turns: int = DEFAULT_MAX_TURNS):
+    """
+    Drives a game to completion. agents[i] plays for controller.game_state.players[i]
+    and must end its turn through the controller.
+    """
+    game_state = controller.game_state
+    controller.start_game()
+    while not game_state.is_game_over:
+        if game_state.turn_number > max_turns:
+            game_state.end_in_draw()
+            break
+        agents[game_state.current_player_index].take_turn(controller)
+    return game_state
+
+
+def create_game(
+        config: MatchupConfig, a_first: bool = True, hashing: bool = True, rng: GameRandom | None = None,
+        logging: bool = True, game_id: int = 0,
+) -> tuple[GameController, list[Player]]:
+    """
+    Sets up both players from the deck lists and a controller for a game between them, drawing all
+    randomness from rng. Without logging, the controller gets a NullGameLog. The game_id, e.g. the
+    game's index in the matchup, tells games apart in traces. Returns the controller
+    and the players in deck order (A, B); the game is not started yet.
+    """
+    rng = rng if rng is not None else GameRandom()
+    players = [
+        setup_player(DECK_NAMES[0], Deck([Card(card_data) for card_data in config.deck_a]), config.energy_types_a,
+                     rng=rng),
+        setup_player(DECK_NAMES[1], Deck([Card(card_data) for card_data in config.deck_b]), config.energy_types_b,
+                     rng=rng),
+    ]
+    turn_order = players if a_first else players[::-1]
+    game_log = None if logging else NullGameLog()
+    return GameController(turn_order, hashing=hashing, rng=rng, game_log=game_log, game_id=game_id), players
+
+
+def play_game(config: MatchupConfig, a_first: bool = True, seed: int | None = None, game_id: int = 0) -> GameResult:
+    """Sets up both players from the deck lists and plays a single game, with a fresh seed unless one is given."""
+    if seed is None:
+        seed = GameRandom().getrandbits(64)
+    # Nothing looks up or reads states while games are played out, so they are not hashed or logged
+    controller, players = create_game(config, a_first, hashing=False, rng=GameRandom(seed), logging=False,
+                                      game_id=game_id)
+    first = 0 if a_first else 1
+    game_state = run_game(controller, [config.agent_cls(), config.agent_cls()], config.max_turns)
+
+    winner = players.index(game_state.winner) if game_state.winner is not None else None
+    return GameResult(
+        winner=winner,
+        turns=min(game_state.turn_number, config.max_turns),
+        first=first,
+        points=(players[0].points, players[1].points),
+        # Only knocked out Pokémon end up in the discard pile
+        knockouts=(sum(1 for card in players[1].discard_pile if card.max_hp),
+                   sum(1 for card in players[0].discard_pile if card.max_hp)),
+        seed=seed,
+    )
+
+
+def play_games(config: MatchupConfig, start: int, count: int) -> MatchupResult:
+    """Plays games [start, start + count) of a matchup. Deck A goes first in even-numbered games."""
+    result = MatchupResult()
+    for game_index in range(start, start + count):
+        seed = config.game_seed(game_index)
+        result.add(play_game(config, a_first=game_index % 2 == 0, seed=seed, game_id=game_index))
+    return result
+
+
+def run_matchup(
+        deck_a: list[CardData],
+        deck_b: list[CardData],
+        n_games: int,
+        energy_types_a: list[Energy],
+        energy_types_b: list[Energy] | None = None,
+        max_turns: int = DEFAULT_MAX_TURNS,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        seed: int | None = None,
+) -> MatchupResult:
+    """
+    Plays n_games between deck A and deck B and returns the aggregated results.
+    Decks are lists of 20 CardData. Games are spread over `workers` processes
+    (defaults to the number of CPUs); with workers=1 everything runs in this process.
+    With a seed, the results are the same for any number of workers and chunk size.
+    """
+    config = MatchupConfig(
+        deck_a=deck_a,
+        deck_b=deck_b,
+        energy_types_a=energy_types_a,
+        energy_types_b=energy_types_b if energy_types_b is not None else energy_types_a,
+        max_turns=max_turns,
+        seed=seed,
+    )
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or n_games <= chunk_size:
+        return play_games(config, 0, n_games)
+
+    starts = list(range(0, n_games, chunk_size))
+    counts = [min(chunk_size, n_games - start) for start in starts]
+
+    result = MatchupResult()
+    with ConfigPool(config, workers) as pool:
+        for chunk_result in pool.map(play_games, starts, counts):
+            result.merge(chunk_result)
+    return result
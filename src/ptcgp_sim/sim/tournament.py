@@ -0,0 +1,167 @@
+"""
+A racing tournament: finds the strongest decks of a pool without playing a full round robin.
+
+The tournament is played in rounds. In every round, each deck still in the race plays a few short
+matchups against opponents drawn at random from the other decks in the race, going first in half
+of the games. After the round, every deck's score (wins plus half of the draws, over all of its
+games) gets a Wilson confidence interval. A deck is eliminated once the upper bound of its
+interval falls below the lower bound of the deck ranked n_winners-th, i.e. once it is clearly
+worse than the leaders. Games are therefore spent on the decks that are still close, and bad
+decks drop out after a few rounds.
+
+Scores are measured against the field of decks in the race at the time, so they shift a little
+as weak decks leave it. The result keeps the record of every game in a ResultsStore.
+"""
+from __future__ import annotations
+import os
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ptcgp_sim.ai.simple_ai_controller import SimpleAIController
+from ptcgp_sim.game.logic.rng import GameRandom
+from ptcgp_sim.sim.pool import ConfigPool
+from ptcgp_sim.sim.results import ResultsStore, play_game_records, summarize_decks
+from ptcgp_sim.sim.runner import DEFAULT_MAX_TURNS, MatchupConfig
+
+if TYPE_CHECKING:
+    from ptcgp_sim.models.card import CardData
+    from ptcgp_sim.models.energy import Energy
+
+
+DEFAULT_CONFIDENCE_Z = 2.576  # Two-sided 99% intervals
+DEFAULT_OPPONENTS_PER_ROUND = 4
+DEFAULT_GAMES_PER_MATCHUP = 4  # Even, so each deck goes first in half of the games
+DEFAULT_MIN_GAMES = 40  # Games a deck plays before it can be eliminated
+
+
+@dataclass
+class TournamentConfig:
+    """Everything the workers need to play games between decks of the pool."""
+    decks: list[list[CardData]]
+    energy_types: list[list[Energy]]  # Per deck
+    seed: int
+    max_turns: int = DEFAULT_MAX_TURNS
+    agent_cls: type = SimpleAIController
+
+    def matchup(self, deck_a: int, deck_b: int) -> MatchupConfig:
+        return MatchupConfig(
+            deck_a=self.decks[deck_a],
+            deck_b=self.decks[deck_b],
+            energy_types_a=self.energy_types[deck_a],
+            energy_types_b=self.energy_types[deck_b],
+            max_turns=self.max_turns,
+            agent_cls=self.agent_cls,
+            seed=self.seed,
+        )
+
+
+@dataclass
+class TournamentResult:
+    """The outcome of a racing tournament. Decks are identified by their index in the pool."""
+    ranking: list[int]  # Decks still in the race, best score first
+    eliminated: dict[int, int] = field(default_factory=dict)  # Deck -> round it was eliminated in
+    rounds: int = 0
+    games: np.ndarray | None = None  # Games played per deck
+    scores: np.ndarray | None = None  # Score per deck, wins plus half the draws over games
+    store: ResultsStore | None = None
+
+    @property
+    def games_played(self) -> int:
+        return int(self.games.sum()) // 2 if self.games is not None else 0
+
+
+def wilson_interval(scores: np.ndarray, games: np.ndarray, z: float = DEFAULT_CONFIDENCE_Z) -> tuple[np.ndarray, np.ndarray]:
+    """Lower and upper bounds of the Wilson score interval of each deck. Decks without games get (0, 1)."""
+    n = np.maximum(games, 1)
+    rate = scores / n
+    denominator = 1 + z * z / n
+    center = (rate + z * z / (2 * n)) / denominator
+    half_width = z * np.sqrt(rate * (1 - rate) / n + z * z / (4 * n * n)) / denominator
+    lower = np.where(games > 0, np.maximum(center - half_width, 0.0), 0.0)
+    upper = np.where(games > 0, np.minimum(center + half_width, 1.0), 1.0)
+    return lower, upper
+
+
+def _play_matchup(config: TournamentConfig, deck_a: int, deck_b: int, start: int, count: int) -> np.ndarray:
+    """A ConfigPool task: games [start, start + count) between two decks of the pool."""
+    return play_game_records(config.matchup(deck_a, deck_b), start, count, deck_a, deck_b)
+
+
+def run_tournament(
+        decks: list[list[CardData]],
+        energy_types: list[list[Energy]],
+        n_winners: int = 1,
+        max_rounds: int = 50,
+        max_games: int | None = None,
+        opponents_per_round: int = DEFAULT_OPPONENTS_PER_ROUND,
+        games_per_matchup: int = DEFAULT_GAMES_PER_MATCHUP,
+        min_games: int = DEFAULT_MIN_GAMES,
+        z: float = DEFAULT_CONFIDENCE_Z,
+        max_turns: int = DEFAULT_MAX_TURNS,
+        workers: int | None = None,
+        seed: int | None = None,
+        store: ResultsStore | None = None,
+) -> TournamentResult:
+    """
+    Races the decks of a pool against each other until at most n_winners are left, or max_rounds
+    rounds or about max_games games have been played. energy_types[i] are the energy zone types of
+    decks[i]. Games are spread over `workers` processes (defaults to the number of CPUs); with
+    workers=1 everything runs in this process. With a seed, the tournament plays the same games for
+    any number of workers.
+    """
+    if games_per_matchup % 2:
+        raise ValueError("games_per_matchup must be even, so that both decks go first equally often.")
+    if seed is None:
+        seed = GameRandom().getrandbits(64)
+    config = TournamentConfig(decks, energy_types, seed, max_turns)
+    store = store if store is not None else ResultsStore()
+    workers = workers or os.cpu_count() or 1
+    pairing_rng = np.random.default_rng(seed)
+
+    n_decks = len(decks)
+    games = np.zeros(n_decks, dtype=np.int64)
+    scores = np.zeros(n_decks, dtype=np.float64)  # Wins plus half the draws
+    in_race = np.arange(n_decks)
+    result = TournamentResult(ranking=[])
+    next_game = 0
+
+    with ConfigPool(config, workers) as pool:
+        while len(in_race) > n_winners and result.rounds < max_rounds:
+            if max_games is not None and next_game >= max_games:
+                break
+            result.rounds += 1
+
+            # Every deck in the race meets a few others; each meeting is a short matchup
+            tasks = []
+            opponents = min(opponents_per_round, len(in_race) - 1)
+            for deck in in_race:
+                others = in_race[in_race != deck]
+                for opponent in pairing_rng.choice(others, size=opponents, replace=False):
+                    tasks.append((int(deck), int(opponent), next_game, games_per_matchup))
+                    next_game += games_per_matchup
+
+            chunksize = max(1, len(tasks) // (workers * 4))
+            round_records = list(pool.map(_play_matchup, *zip(*tasks), chunksize=chunksize))
+            records = np.concatenate(round_records)
+            store.extend(records)
+
+            summary = summarize_decks(records)
+            games[summary["deck"]] += summary["games"]
+            scores[summary["deck"]] += summary["wins"] + 0.5 * summary["draws"]
+
+            # Drop the decks that are clearly behind the n_winners-th best
+            lower, upper = wilson_interval(scores[in_race], games[in_race], z)
+            threshold = np.sort(lower)[::-1][n_winners - 1]
+            behind = (upper < threshold) & (games[in_race] >= min_games)
+            for deck in in_race[behind]:
+                result.eliminated[int(deck)] = result.rounds
+            in_race = in_race[~behind]
+
+    rates = scores[in_race] / np.maximum(games[in_race], 1)
+    result.ranking = [int(deck) for deck in in_race[np.argsort(-rates, kind="stable")]]
+    result.games = games
+    result.scores = scores
+    result.store = store
+    return result
@@ -0,0 +1,127 @@
+"""
+A vectorized environment that steps many games at once, for self-play and training.
+
+The environment owns K games. Every step takes one action id (see game.logic.actions) per game,
+for whichever player's turn it is, and returns batched NumPy arrays:
+
+    observations  (K, OBSERVATION_SIZE) float32, see sim.encoder
+    rewards       (K,) float32, for the player who took the action: 1 for a win, -1 for a loss, else 0
+    dones         (K,) bool, True where the action ended the game
+    legal_masks   (K, N_ACTIONS) bool, the actions the player to move may take next
+
+A game that ends is replaced by a new one right away, so the observation and legal mask of a done
+game describe the first turn of its next game. The arrays are preallocated and overwritten by
+every step; copy them to keep them. Games are not hashed (see game.logic.zobrist) unless hashing
+is turned on, e.g. to look up states in a search.
+
+With a seed, the n-th game of environment k is game n * K + k of the seed, see sim.runner: the
+same seed and, as in sim.runner, deck A goes first in the even-numbered games.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ptcgp_sim.game.logic.actions import N_ACTIONS, apply_action, legal_actions
+from ptcgp_sim.sim.encoder import ObservationEncoder
+from ptcgp_sim.sim.runner import DEFAULT_MAX_TURNS, MatchupConfig, create_game
+
+if TYPE_CHECKING:
+    from ptcgp_sim.game.logic.game_controller import GameController
+    from ptcgp_sim.game.logic.game_state import GameState
+    from ptcgp_sim.models.card import CardData
+    from ptcgp_sim.models.energy import Energy
+
+
+class VecEnv:
+    """K games between deck A and deck B, stepped together. Deck A goes first in even-numbered games."""
+
+    def __init__(
+            self,
+            num_envs: int,
+            deck_a: list[CardData],
+            deck_b: list[CardData],
+            energy_types_a: list[Energy],
+            energy_types_b: list[Energy] | None = None,
+            max_turns: int = DEFAULT_MAX_TURNS,
+            seed: int | None = None,
+            hashing: bool = False,
+    ):
+        self.num_envs = num_envs
+        self.hashing = hashing  # Zobrist hashing of the games, only needed to look states up
+        self.config = MatchupConfig(
+            deck_a=deck_a,
+            deck_b=deck_b,
+            energy_types_a=energy_types_a,
+            energy_types_b=energy_types_b if energy_types_b is not None else energy_types_a,
+            max_turns=max_turns,
+            seed=seed,
+        )
+        self.controllers: list[GameController | None] = [None] * num_envs
+        self.games_played = [0] * num_envs
+
+        self.encoder = ObservationEncoder(num_envs)
+        self.observations = self.encoder.observations
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+        self.legal_masks = np.zeros((num_envs, N_ACTIONS), dtype=bool)
+
+    @property
+    def game_states(self) -> list[GameState]:
+        return [controller.game_state for controller in self.controllers]
+
+    def reset(self) -> tuple[np.ndarray, np.ndarray]:
+        """Starts a new game in every environment. Returns the observations and legal masks."""
+        for index in range(self.num_envs):
+            self._new_game(index)
+        self.rewards[:] = 0
+        self.dones[:] = False
+        return self.observations, self.legal_masks
+
+    def step(self, actions) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Takes actions[k] in game k. Returns the observations, rewards, done flags and legal masks.
+        Raises ValueError for an action that is not legal, so mask actions with the legal masks.
+        """
+        max_turns = self.config.max_turns
+        rewards = self.rewards
+        dones = self.dones
+
+        for index, action in enumerate(actions):
+            controller = self.controllers[index]
+            game_state = controller.game_state
+            actor = game_state.current_player
+            if not apply_action(controller, int(action)):
+                raise ValueError(f"Action {action} is not legal in environment {index}.")
+
+            if not game_state.is_game_over and game_state.turn_number > max_turns:
+                game_state.end_in_draw()
+
+            if game_state.is_game_over:
+                winner = game_state.winner
+                rewards[index] = 0.0 if winner is None else (1.0 if winner is actor else -1.0)
+                dones[index] = True
+                self._new_game(index)
+            else:
+                rewards[index] = 0.0
+                dones[index] = False
+                self.encoder.update(index, game_state)
+                self._write_legal_mask(index, game_state)
+
+        return self.observations, rewards, dones, self.legal_masks
+
+    def _new_game(self, index: int):
+        game_index = self.games_played[index] * self.num_envs + index
+        self.games_played[index] += 1
+        rng = self.config.game_rng(game_index)
+        controller, _ = create_game(self.config, game_index % 2 == 0, hashing=self.hashing, rng=rng, logging=False,
+                                    game_id=game_index)
+        controller.start_game()
+        self.controllers[index] = controller
+        self.encoder.encode(index, controller.game_state)
+        self._write_legal_mask(index, controller.game_state)
+
+    def _write_legal_mask(self, index: int, game_state: GameState):
+        mask = self.legal_masks[index]
+        mask[:] = False
+        mask[list(legal_actions(game_state))] = True
@@ -0,0 +1,74 @@
+import random
+
+from ptcgp_sim.ai.deck_builder import DECK_SIZE, DeckBuilder, Opponent, canonical_deck, is_legal_deck
+from ptcgp_sim.sim.pool import ConfigPool
+from tests.cards import ENERGIES, make_pokemon
+
+
+def card_pool() -> list:
+    """Basic Pokémon whose single attack gets stronger with the card index, and an evolution."""
+    pool = [make_pokemon(400 + i, f"Mon {i}", 60, [("C", "Hit", str(10 * (i + 1)))]) for i in range(12)]
+    pool.append(make_pokemon(450, "Evolved Mon", 90, [("C", "Hit", "10")], stage="Stage 1"))
+    return pool
+
+
+def make_builder(**kwargs) -> DeckBuilder:
+    gauntlet = [Opponent([make_pokemon(499, "Rival", 60, [("C", "Hit", "30")])] * 20, ENERGIES[:8])]
+    return DeckBuilder(card_pool(), gauntlet, ENERGIES[:8], **kwargs)
+
+
+def test_repair_makes_decks_legal():
+    # Arrange
+    builder = make_builder(workers=1)
+    evolved = builder.cards[450]
+
+    # Act
+    decks = [builder.repair([evolved] * 30), builder.repair([]), builder.random_deck()]
+    decks += [builder.mutate(builder.crossover(decks[0], decks[1]))]
+
+    # Assert
+    for deck in decks:
+        assert len(deck) == DECK_SIZE
+        assert is_legal_deck(deck)
+
+
+def test_canonical_deck_ignores_card_order():
+    # Arrange
+    deck = make_builder(workers=1).random_deck()
+    shuffled = deck.copy()
+    random.Random(0).shuffle(shuffled)
+
+    # Act & Assert
+    assert canonical_deck(deck) == canonical_deck(shuffled)
+
+
+def test_evolution_finds_stronger_cards_and_caches_fitness():
+    # Arrange
+    builder = make_builder(games_per_opponent=4, workers=1, seed=2)
+
+    # Act
+    result = builder.evolve(generations=4, population_size=8, elite=2)
+
+    # Assert
+    assert is_legal_deck(result.best_deck)
+    assert result.best_fitness == max(result.best_fitness_per_generation)
+    # With elitism, the best fitness never drops
+    assert result.best_fitness_per_generation == sorted(result.best_fitness_per_generation)
+    # The elite decks come back every generation and are not simulated again
+    assert result.cache_hits >= 4 * 2
+    assert result.evaluations + result.cache_hits == 5 * 8
+    assert result.best_fitness > 0.5
+
+
+def test_fitness_does_not_depend_on_workers():
+    # Arrange
+    decks = [make_builder(workers=1, seed=seed).random_deck() for seed in range(3)]
+
+    # Act
+    single = make_builder(games_per_opponent=2, workers=1).fitness(decks)
+    builder = make_builder(games_per_opponent=2, workers=2)
+    with ConfigPool(builder.fitness_config, workers=2) as pool:
+        pooled = builder.fitness(decks, pool)
+
+    # Assert
+    assert single == pooled
@@ -0,0 +1,36 @@
+from ptcgp_sim.models.attack import Attack
+from ptcgp_sim.models.card import CardData
+from ptcgp_sim.models.energy import Energy
+from ptcgp_sim.models.supertype import Supertype
+
+# Card data built in memory, so that game logic can be tested without a database.
+ENERGIES = [
+    Energy(1, "Grass", "G"),
+    Energy(2, "Fire", "R"),
+    Energy(3, "Water", "W"),
+    Energy(4, "Lightning", "L"),
+    Energy(5, "Psychic", "P"),
+    Energy(6, "Fighting", "F"),
+    Energy(7, "Darkness", "D"),
+    Energy(8, "Metal", "M"),
+    Energy(9, "Dragon", "A"),
+    Energy(10, "Colorless", "C"),
+]
+POKEMON = Supertype(1, "Pokemon")
+
+
+def make_pokemon(card_id: int, name: str, hp: int, attacks: list[tuple[str, str, str]],
+                 stage: str = "Basic", energy_type: Energy = ENERGIES[0]) -> CardData:
+    """Creates Pokémon card data. Attacks are (costs, name, damage) tuples, e.g. ("GC", "Vine Whip", "40")."""
+    return CardData(
+        id=card_id,
+        code=f"T-{card_id:03d}",
+        name=name,
+        supertype=POKEMON,
+        hp=hp,
+        energy_type=energy_type,
+        stage=stage,
+        retreat_cost=1,
+        attacks=[Attack(id=card_id * 10 + i, card_id=card_id, costs=costs, name=attack_name, damage=damage)
+                 for i, (costs, attack_name, damage) in enumerate(attacks)],
+    )
@@ -0,0 +1,70 @@
+import pytest
+
+from ptcgp_sim.game.logic.actions import legal_actions
+from ptcgp_sim.game.logic.game_controller import GameController
+from ptcgp_sim.game.logic.game_state import GameState
+from ptcgp_sim.game.logic.rng import GameRandom
+from ptcgp_sim.models.card import CardData
+from ptcgp_sim.models.energy import Energy
+from ptcgp_sim.sim.runner import MatchupConfig, create_game
+from tests.cards import ENERGIES, make_pokemon
+
+
+@pytest.fixture
+def energies() -> list[Energy]:
+    return ENERGIES
+
+
+@pytest.fixture
+def deck_lists() -> tuple[list[CardData], list[CardData]]:
+    """Two 20-card deck lists of Basic Pokémon whose attacks only need Colorless energy."""
+    grass = [make_pokemon(100 + i, f"Grass Mon {i}", 60, [("CC", "Tackle", "30")]) for i in range(10)]
+    fire = [make_pokemon(200 + i, f"Fire Mon {i}", 70, [("C", "Scratch", "20"), ("CCC", "Flare", "60")],
+                         energy_type=ENERGIES[1]) for i in range(10)]
+    return grass * 2, fire * 2
+
+
+# --- Helpers for tests that play games; import them from tests.conftest ---
+
+def start_game(deck_lists, energies, seed: int | None = None, hashing: bool = True) -> GameController:
+    """Sets up a game between the deck lists with sim.runner.create_game and starts it. Unseeded by default."""
+    deck_a, deck_b = deck_lists
+    config = MatchupConfig(deck_a, deck_b, energies[:8], energies[:8])
+    controller, _ = create_game(config, hashing=hashing, rng=GameRandom(seed))
+    controller.start_game()
+    return controller
+
+
+def signature(game_state: GameState, exact: bool = True) -> tuple:
+    """
+    The state of a game, to tell states apart. The exact signature includes the order of cards in
+    every zone, the discarded energy, the hash and the legal actions. Otherwise it holds only what
+    the Zobrist hash covers: the cards of each zone, in any order, with their hp and energy counts.
+    """
+    if exact:
+        def describe(card):
+            if card is None:
+                return None
+            return (card.instance_id, card.current_hp, tuple(card.attached_energy), tuple(card.energy_counts),
+                    tuple(c.instance_id for c in card.attached_cards))
+
+        def zone(cards):
+            return tuple(map(describe, cards))
+    else:
+        def describe(card):
+            return (card.instance_id, card.current_hp, tuple(card.energy_counts)) if card is not None else None
+
+        def zone(cards):
+            return frozenset(map(describe, cards))
+
+    players = []
+    for player in game_state.players:
+        energy_zone = player.energy_zone
+        players.append((
+            zone(player.deck), zone(player.hand), describe(player.active_pokemon), tuple(map(describe, player.bench)),
+            zone(player.discard_pile), tuple(player.discarded_energy) if exact else None,
+            player.points, player.has_retreated, energy_zone.current, energy_zone.next,
+        ))
+    winner = game_state.winner.instance_id if game_state.winner else None
+    state = (game_state.turn_number, game_state.current_player_index, game_state.is_game_over, winner, *players)
+    return (game_state.zobrist, legal_actions(game_state), *state) if exact else state
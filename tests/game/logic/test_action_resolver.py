@@ -0,0 +1,164 @@
+from tests.cards import make_pokemon
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+from ptcgp_sim.game.objects.player import Player
+from ptcgp_sim.game.logic.action_resolver import ActionResolver
+from ptcgp_sim.game.logic.effects import DealDamageEffect
+from ptcgp_sim.game.logic.game_log import GameLog
+from ptcgp_sim.game.logic.events import DamageDealtEvent, CardDiedEvent, CardDrawnEvent
+from ptcgp_sim.game.logic.game_state import GameState
+from ptcgp_sim.game.logic.rule_engine import RuleEngine
+from ptcgp_sim.game.logic.rules import Rule
+
+
+class SpreadDamageRule(Rule):
+    """Deals 10 damage to each Pokémon on the defender's bench, like a spread attack."""
+    event_types = (DamageDealtEvent,)
+
+    def condition(self, event, game_state) -> bool:
+        return event.source is not None
+
+    def action(self, event, game_state):
+        owner = game_state.find_owner(event.target)
+        return [DealDamageEffect(card.instance_id, 10) for card in owner.bench if card is not None]
+
+
+class DeathRecorder(Rule):
+    """Records the knockouts fired, and what was in play when each fired."""
+    event_types = (CardDiedEvent,)
+
+    def __init__(self):
+        self.deaths = []
+
+    def condition(self, event, game_state) -> bool:
+        return True
+
+    def action(self, event, game_state):
+        self.deaths.append((event.card, event.owner, event.owner.active_pokemon))
+        return []
+
+
+class DrawRecorder(Rule):
+    """Records the cards drawn, and whether each was already in its player's hand when the event fired."""
+    event_types = (CardDrawnEvent,)
+
+    def __init__(self):
+        self.draws = []
+
+    def condition(self, event, game_state) -> bool:
+        return True
+
+    def action(self, event, game_state):
+        self.draws.append((event.player, event.card, event.card in event.player.hand))
+        return []
+
+
+def setup_game(benched: int, extra_rules=()):
+    """Alice's active Pokémon against Bob's active Pokémon and `benched` benched ones."""
+    card_data = make_pokemon(1, "Bulbasaur", 70, [("GC", "Vine Whip", "40")])
+    alice = Player("Alice", Deck([Card(card_data)]), GameLog())
+    bob = Player("Bob", Deck([Card(card_data) for _ in range(1 + benched)]), GameLog())
+    game_state = GameState([alice, bob])
+    alice.set_active_pokemon_from_hand(alice.draw_card())
+    bob.set_active_pokemon_from_hand(bob.draw_card())
+    for _ in range(benched):
+        bob.play_card_to_bench(bob.draw_card())
+
+    rule_engine = RuleEngine()
+    for rule in extra_rules:
+        rule_engine.add_rule(rule)
+    return game_state, ActionResolver(rule_engine), alice, bob
+
+
+def test_lethal_attack_discards_defender_and_promotes_benched():
+    # Arrange
+    game_state, resolver, alice, bob = setup_game(benched=1)
+    defender, benched = bob.active_pokemon, bob.bench[0]
+    defender.current_hp = 40
+
+    # Act
+    resolver.resolve_attack(game_state, alice.active_pokemon, defender, alice.active_pokemon.attacks[0])
+
+    # Assert
+    assert defender in bob.discard_pile
+    assert bob.active_pokemon is benched and bob.bench[0] is None
+    assert alice.points == 1
+    assert not game_state.is_game_over
+    assert game_state.knockout_queue == []
+
+
+def test_non_lethal_attack_queues_no_knockout():
+    game_state, resolver, alice, bob = setup_game(benched=0)
+    defender = bob.active_pokemon
+
+    resolver.resolve_attack(game_state, alice.active_pokemon, defender, alice.active_pokemon.attacks[0])
+
+    assert bob.active_pokemon is defender and defender.current_hp == 30
+    assert alice.points == 0
+    assert game_state.knockout_queue == []
+
+
+def test_knockouts_of_a_step_are_resolved_in_one_batch():
+    """
+    Tests that a spread attack knocking out the active Pokémon and two benched ones removes all
+    three before any CardDiedEvent fires, so that no knocked out Pokémon is promoted.
+    """
+    # Arrange
+    recorder = DeathRecorder()
+    game_state, resolver, alice, bob = setup_game(benched=3, extra_rules=(SpreadDamageRule(), recorder))
+    defender = bob.active_pokemon
+    defender.current_hp = 40
+    first, survivor, third = bob.bench[0], bob.bench[1], bob.bench[2]
+    first.current_hp = 10
+    third.current_hp = 10
+
+    # Act
+    resolver.resolve_attack(game_state, alice.active_pokemon, defender, alice.active_pokemon.attacks[0])
+
+    # Assert
+    assert [card for card, _, _ in recorder.deaths] == [defender, first, third]
+    assert list(bob.discard_pile) == [defender, first, third]
+    assert all(owner is bob and active is survivor for _, owner, active in recorder.deaths)
+    assert bob.active_pokemon is survivor and survivor.current_hp == 60
+    assert bob.bench.occupied() == 0
+    assert alice.points == 3
+    assert game_state.is_game_over and game_state.winner is alice
+    assert game_state.knockout_queue == []
+
+
+def test_knockouts_of_effects_applied_outside_the_resolver_stay_queued():
+    """Tests that a knockout by an effect applied directly, here to a clone, is queued until a resolver drains it."""
+    # Arrange
+    game_state, resolver, alice, bob = setup_game(benched=1)
+    copy = game_state.clone()
+    copied_bob = copy.players[1]
+    defender, benched = copied_bob.active_pokemon, copied_bob.bench[0]
+
+    # Act
+    DealDamageEffect(defender.instance_id, 1000).apply(copy)
+
+    # Assert
+    assert copy.knockout_queue == [defender] and copied_bob.active_pokemon is defender
+    assert copy.clone().knockout_queue[0] is not defender
+    resolver.resolve_knockouts(copy)
+    assert copy.knockout_queue == []
+    assert copied_bob.active_pokemon is benched and defender in copied_bob.discard_pile
+    assert copy.players[0].points == 1
+    assert game_state.knockout_queue == [] and bob.active_pokemon.current_hp == 70 and alice.points == 0
+
+
+def test_drawing_a_card_fires_a_card_drawn_event():
+    # Arrange
+    recorder = DrawRecorder()
+    alice = Player("Alice", Deck([Card(make_pokemon(1, "Bulbasaur", 70, [("GC", "Vine Whip", "40")]))]), GameLog())
+    game_state = GameState([alice])
+    rule_engine = RuleEngine()
+    rule_engine.add_rule(recorder)
+    resolver = ActionResolver(rule_engine)
+
+    # Act
+    resolver.resolve_draw(game_state, alice)
+    resolver.resolve_draw(game_state, alice)  # The deck is empty now
+
+    # Assert
+    assert recorder.draws == [(alice, alice.hand[0], True)]
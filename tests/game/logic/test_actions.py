@@ -0,0 +1,85 @@
+import random
+
+from ptcgp_sim.game.logic.actions import (
+    END_TURN, ATTACK, ATTACH_ENERGY, PLAY_TO_BENCH, RETREAT, apply_action, legal_action_mask, legal_actions,
+)
+from tests.conftest import start_game
+
+
+def test_first_turn_has_no_energy_and_no_attack(deck_lists, energies):
+    # Arrange
+    controller = start_game(deck_lists, energies)
+
+    # Act
+    actions = legal_actions(controller.game_state)
+
+    # Assert
+    assert actions[0] == END_TURN
+    assert not any(ATTACK <= action < PLAY_TO_BENCH for action in actions)
+
+
+def test_apply_action_attaches_energy_and_attacks(deck_lists, energies):
+    """Tests that the second player can attach energy and then use the attack it pays for."""
+    # Arrange
+    controller = start_game(deck_lists, energies)
+    game_state = controller.game_state
+    apply_action(controller, END_TURN)
+    player = game_state.current_player
+
+    # Act & Assert
+    assert ATTACH_ENERGY in legal_actions(game_state)
+    assert apply_action(controller, ATTACH_ENERGY)
+    assert len(player.active_pokemon.attached_energy) == 1
+    assert ATTACH_ENERGY not in legal_actions(game_state)
+
+    # The Fire deck's first attack costs one energy of any type
+    assert ATTACK in legal_actions(game_state)
+    assert apply_action(controller, ATTACK)
+    assert game_state.current_player is not player
+
+
+def test_apply_action_rejects_illegal_action(deck_lists, energies):
+    # Arrange
+    controller = start_game(deck_lists, energies)
+    game_state = controller.game_state
+    turn = game_state.turn_number
+
+    # Act & Assert
+    assert not apply_action(controller, ATTACK)
+    assert game_state.turn_number == turn
+
+
+def test_retreat_pays_cost_and_is_allowed_once_per_turn(deck_lists, energies):
+    # Arrange
+    controller = start_game(deck_lists, energies)
+    game_state = controller.game_state
+    player = game_state.current_player
+    active, benched = player.active_pokemon, player.bench[0]
+    assert RETREAT not in legal_actions(game_state)  # No energy to pay the retreat cost of 1
+    active.attach_energy(energies[0])
+    game_state.legal_actions_cache = None
+
+    # Act & Assert
+    assert RETREAT in legal_actions(game_state)
+    assert apply_action(controller, RETREAT)
+    assert player.active_pokemon is benched and player.bench[0] is active
+    assert active.attached_energy == [] and player.discarded_energy == [energies[0]]
+    assert not any(action >= RETREAT for action in legal_actions(game_state))
+
+
+def test_cache_is_reused_and_reset_by_state_changes(deck_lists, energies):
+    """Tests that the cached actions always match a fresh computation while random legal actions are played."""
+    # Arrange
+    controller = start_game(deck_lists, energies)
+    game_state = controller.game_state
+    rng = random.Random(0)
+
+    # Act & Assert
+    assert legal_actions(game_state) is legal_actions(game_state)
+    for _ in range(200):
+        if game_state.is_game_over:
+            break
+        actions, mask = legal_actions(game_state), legal_action_mask(game_state)
+        game_state.legal_actions_cache = None
+        assert (legal_actions(game_state), legal_action_mask(game_state)) == (actions, mask)
+        assert apply_action(controller, rng.choice(actions))
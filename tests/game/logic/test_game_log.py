@@ -0,0 +1,89 @@
+import io
+import json
+
+import pytest
+
+from tests.cards import make_pokemon
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+from ptcgp_sim.game.objects.player import Player
+from ptcgp_sim.game.logic.game_log import GameLog, NullGameLog
+
+
+def test_unbounded_log_keeps_everything():
+    # Arrange
+    log = GameLog()
+
+    # Act
+    for i in range(2_500):
+        log.log_message("message %s", i)
+
+    # Assert
+    assert len(log.entries) == 2_500
+    assert log.entries[0].message == "message 0"
+
+
+def test_ring_buffer_keeps_last_entries():
+    # Arrange
+    log = GameLog(max_entries=10)
+
+    # Act
+    for i in range(2_500):
+        log.log_message("message %s", i)
+
+    # Assert
+    assert [entry.message for entry in log.entries] == [f"message {i}" for i in range(2_490, 2_500)]
+
+
+def test_streaming_log_writes_chunks_to_sink():
+    # Arrange
+    sink = io.StringIO()
+    log = GameLog(sink=sink, chunk_size=100)
+
+    # Act
+    for i in range(250):
+        log.log_message("message %s", i)
+    written_before_flush = len(sink.getvalue().splitlines())
+    log.flush()
+
+    # Assert
+    assert written_before_flush == 200
+    assert len(log.entries) == 0
+    lines = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == [f"message {i}" for i in range(250)]
+    assert all(line["kind"] == "text" for line in lines)
+    assert log.entries_written == 250
+
+
+def test_ring_buffer_and_sink_are_exclusive():
+    with pytest.raises(ValueError):
+        GameLog(max_entries=10, sink=io.StringIO())
+
+
+def test_null_log_is_falsy_and_keeps_nothing():
+    # Arrange
+    log = NullGameLog()
+
+    # Act
+    log.log_message("message %s", 1)
+
+    # Assert
+    assert not log
+    assert len(log.entries) == 0
+
+
+def test_messages_show_the_state_when_logged(energies):
+    """Tests that a logged card is not re-read later: damage and energy after a draw leave the entry unchanged."""
+    # Arrange
+    log = GameLog()
+    player = Player("Ash", Deck([Card(make_pokemon(1, "Bulbasaur", 70, [("GC", "Vine Whip", "40")]))]), log)
+    card = player.draw_card()
+    message = log.entries[-1].message
+
+    # Act
+    card.take_damage(50)
+    card.attach_energy(energies[0])
+
+    # Assert
+    assert "HP: 70/70" in message
+    assert log.entries[-1].message == message
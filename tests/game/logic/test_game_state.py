@@ -0,0 +1,137 @@
+import pytest
+
+from tests.cards import make_pokemon
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+from ptcgp_sim.game.objects.player import Player
+from ptcgp_sim.game.objects.zone import Zone
+from ptcgp_sim.game.logic.game_log import GameLog
+from ptcgp_sim.game.logic.game_state import GameState
+
+
+@pytest.fixture
+def game_setup():
+    """Two players with three cards each in their deck, and a game tracking them."""
+    card_data = make_pokemon(1, "Bulbasaur", 70, [("GC", "Vine Whip", "40")])
+    player1 = Player("Alice", Deck([Card(card_data) for _ in range(3)]), GameLog())
+    player2 = Player("Bob", Deck([Card(card_data) for _ in range(3)]), GameLog())
+    game_state = GameState([player1, player2])
+    return game_state, player1, player2
+
+
+def test_find_object_by_id_finds_players(game_setup):
+    game_state, player1, player2 = game_setup
+
+    assert game_state.find_object_by_id(player1.instance_id) is player1
+    assert game_state.find_object_by_id(player2.instance_id) is player2
+
+
+def test_find_object_by_id_hides_cards_in_deck(game_setup):
+    game_state, player1, _ = game_setup
+    card = player1.deck.cards[-1]
+
+    assert game_state.zone_of(card) is Zone.DECK
+    assert game_state.find_object_by_id(card.instance_id) is None
+
+
+def test_index_follows_cards_between_zones(game_setup):
+    """Tests that the index is updated as a card moves from deck to hand, to the bench, to active and to discard."""
+    # Arrange
+    game_state, player1, _ = game_setup
+
+    # Act & Assert
+    card = player1.draw_card()
+    assert game_state.zone_of(card) is Zone.HAND
+    assert game_state.find_object_by_id(card.instance_id) is card
+
+    player1.play_card_to_bench(card)
+    assert game_state.zone_of(card) is Zone.BENCH
+
+    player1.promote_from_bench(0)
+    assert game_state.zone_of(card) is Zone.ACTIVE
+
+    card.take_damage(1000)
+    player1.knock_out(card)
+    assert game_state.zone_of(card) is Zone.DISCARD
+    assert game_state.find_object_by_id(card.instance_id) is card
+
+
+def test_promote_swaps_zones_of_active_and_benched(game_setup):
+    # Arrange
+    game_state, player1, _ = game_setup
+    first = player1.draw_card()
+    second = player1.draw_card()
+    player1.set_active_pokemon_from_hand(first)
+    player1.play_card_to_bench(second)
+
+    # Act
+    player1.promote_from_bench(0)
+
+    # Assert
+    assert game_state.zone_of(first) is Zone.BENCH
+    assert game_state.zone_of(second) is Zone.ACTIVE
+
+
+def test_find_object_by_id_unknown_id(game_setup):
+    game_state, _, _ = game_setup
+
+    assert game_state.find_object_by_id(object()) is None
+
+
+def test_game_assigns_dense_integer_ids(game_setup):
+    """Tests that players get ids 0 and 1 and their cards the following ids, so ids can index arrays."""
+    game_state, player1, player2 = game_setup
+
+    assert (player1.instance_id, player2.instance_id) == (0, 1)
+    card_ids = sorted(card.instance_id for player in (player1, player2) for card in player.all_cards())
+    assert card_ids == list(range(2, 8))
+    assert game_state.ids.next_id == 8
+
+
+def test_clone_copies_state_and_shares_card_data(game_setup):
+    # Arrange
+    game_state, player1, player2 = game_setup
+    active = player1.draw_card()
+    player1.set_active_pokemon_from_hand(active)
+    active.take_damage(30)
+
+    # Act
+    copy = game_state.clone()
+
+    # Assert
+    copied_player = copy.players[0]
+    copied_active = copied_player.active_pokemon
+    assert copied_player is not player1 and copied_active is not active
+    assert copied_active.card_data is active.card_data
+    assert copied_active.instance_id == active.instance_id
+    assert copied_active.current_hp == 40
+    assert copy.find_object_by_id(active.instance_id) is copied_active
+    assert copy.find_object_by_id(player2.instance_id) is copy.players[1]
+    assert len(copied_player.deck) == len(player1.deck)
+
+
+def test_clone_is_independent_of_original(game_setup):
+    """Tests that playing on in a clone, including a knockout, leaves the original untouched."""
+    # Arrange
+    game_state, player1, _ = game_setup
+    active = player1.draw_card()
+    benched = player1.draw_card()
+    player1.set_active_pokemon_from_hand(active)
+    player1.play_card_to_bench(benched)
+    copy = game_state.clone()
+    copied_player = copy.players[0]
+
+    # Act
+    copied_player.draw_card()
+    copied_player.active_pokemon.take_damage(1000)
+    copied_player.knock_out(copied_player.active_pokemon)
+    copied_player.fill_active_spot()
+    game_state.advance_turn()
+
+    # Assert
+    assert copied_player.active_pokemon.instance_id == benched.instance_id
+    assert copy.zone_of(copied_player.active_pokemon) is Zone.ACTIVE
+    assert copy.turn_number == 1
+    assert player1.active_pokemon is active and active.current_hp == 70
+    assert game_state.zone_of(active) is Zone.ACTIVE
+    assert len(player1.deck) == 1 and len(player1.hand) == 0
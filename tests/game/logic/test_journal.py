@@ -0,0 +1,73 @@
+import random
+
+from ptcgp_sim.game.logic import zobrist
+from ptcgp_sim.game.logic.actions import apply_action, legal_actions
+from tests.conftest import signature, start_game
+
+
+def play_out(controller, rng, max_turns=60):
+    game_state = controller.game_state
+    while not game_state.is_game_over and game_state.turn_number <= max_turns:
+        apply_action(controller, rng.choice(legal_actions(game_state)))
+
+
+def test_rollback_restores_game_exactly(deck_lists, energies):
+    rng = random.Random(0)
+    for seed in range(5):
+        # Arrange
+        controller = start_game(deck_lists, energies, seed)
+        game_state = controller.game_state
+        for _ in range(rng.randrange(10)):
+            apply_action(controller, rng.choice(legal_actions(game_state)))
+        before = signature(game_state)
+        checkpoint = game_state.checkpoint()
+        next_random = game_state.rng.random()
+
+        # Act
+        play_out(controller, rng)
+        game_state.rollback(checkpoint)
+
+        # Assert
+        assert signature(game_state) == before
+        assert game_state.zobrist == zobrist.compute_hash(game_state)
+        assert game_state.rng.random() == next_random
+        # The game goes on normally
+        play_out(controller, rng)
+        assert game_state.zobrist == zobrist.compute_hash(game_state)
+
+
+def test_nested_checkpoints(deck_lists, energies):
+    # Arrange
+    rng = random.Random(1)
+    controller = start_game(deck_lists, energies)
+    game_state = controller.game_state
+    root = signature(game_state)
+    outer = game_state.checkpoint()
+    for _ in range(6):
+        apply_action(controller, rng.choice(legal_actions(game_state)))
+    middle = signature(game_state)
+    inner = game_state.checkpoint()
+
+    # Act & Assert
+    for _ in range(3):
+        play_out(controller, rng)
+        game_state.rollback(inner)
+        assert signature(game_state) == middle
+    play_out(controller, rng)
+    game_state.rollback(outer)
+    assert signature(game_state) == root
+
+
+def test_stop_journal(deck_lists, energies):
+    # Arrange
+    controller = start_game(deck_lists, energies)
+    game_state = controller.game_state
+    game_state.checkpoint()
+
+    # Act
+    game_state.stop_journal()
+    play_out(controller, random.Random(2))
+
+    # Assert
+    assert game_state.journal is None
+    assert all(player.journal is None for player in game_state.players)
@@ -1,6 +1,7 @@
 import pytest
 from ptcgp_sim.game.logic import RuleEngine, GameState, GameEvent, Effect
 from ptcgp_sim.game.logic.rules import Rule
+from ptcgp_sim.game.logic.events import TurnStartEvent, DamageDealtEvent
 
 # --- Mock/Dummy Classes for Testing ---
 class MockEffect(Effect):
@@ -62,4 +63,93 @@ def test_rule_engine_multiple_rules_triggered():
     effects = engine.process_event(event, game_state)
 
     # Assert
-    assert len(effects) == 2
\ No newline at end of file
+    assert len(effects) == 2
+
+class DamageOnlyRule(Rule):
+    """A mock rule that only subscribes to damage events and records every event it sees."""
+    event_types = (DamageDealtEvent,)
+
+    def __init__(self):
+        self.seen = []
+
+    def condition(self, event, game_state) -> bool:
+        self.seen.append(event)
+        return True
+
+    def action(self, event, game_state):
+        return [MockEffect()]
+
+class DamageSubclassEvent(DamageDealtEvent):
+    """An event class defined after the rule engine was created."""
+
+def test_rule_engine_dispatches_by_event_type():
+    """Tests that a rule is only evaluated for the event types it subscribes to."""
+    # Arrange
+    engine = RuleEngine()
+    damage_rule = DamageOnlyRule()
+    engine.rules = [damage_rule, AlwaysTrueRule()]
+    game_state = GameState([])
+
+    # Act
+    turn_effects = engine.process_event(TurnStartEvent(player=None), game_state)
+    damage_effects = engine.process_event(DamageDealtEvent(source=None, target=None, amount=10), game_state)
+
+    # Assert
+    assert len(turn_effects) == 1
+    assert len(damage_effects) == 2
+    assert len(damage_rule.seen) == 1
+    assert isinstance(damage_rule.seen[0], DamageDealtEvent)
+
+def test_rule_engine_dispatch_respects_event_subclasses():
+    """Tests that a rule subscribed to an event class also receives events of its subclasses."""
+    # Arrange
+    engine = RuleEngine()
+    damage_rule = DamageOnlyRule()
+    engine.add_rule(damage_rule)
+    game_state = GameState([])
+
+    # Act
+    engine.process_event(DamageSubclassEvent(source=None, target=None, amount=10), game_state)
+
+    # Assert
+    assert len(damage_rule.seen) == 1
+
+def test_rules_property_is_read_only():
+    """Tests that rules can only be added through add_rule, which keeps the dispatch table current."""
+    # Arrange
+    engine = RuleEngine()
+    engine.rules = [NeverTrueRule()]
+
+    # Act
+    engine.add_rule(AlwaysTrueRule())
+
+    # Assert
+    assert isinstance(engine.rules, tuple)
+    with pytest.raises(AttributeError):
+        engine.rules.append(AlwaysTrueRule())
+    assert len(engine.process_event(GameEvent(), GameState([]))) == 1
+
+def test_events_have_increasing_integer_ids():
+    """Tests that events get cheap integer ids from their own game and are not timestamped by default."""
+    # Arrange
+    game_state, other_game_state = GameState([]), GameState([])
+
+    # Act
+    first, second = GameEvent(game_state.event_ids.allocate()), GameEvent(game_state.event_ids.allocate())
+    other = GameEvent(other_game_state.event_ids.allocate())
+
+    # Assert
+    assert (first.event_id, second.event_id) == (0, 1)
+    assert other.event_id == 0
+    assert GameEvent().event_id == -1
+    assert first.timestamp is None
+
+def test_events_are_slotted_with_class_level_names():
+    """Tests that events have no per-instance __dict__ and take their name from the class."""
+    # Act
+    event = DamageDealtEvent(source=None, target=None, amount=10)
+
+    # Assert
+    assert not hasattr(event, "__dict__")
+    assert event.name == "DamageDealtEvent"
+    assert DamageSubclassEvent.name == "DamageSubclassEvent"
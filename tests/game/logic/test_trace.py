@@ -0,0 +1,35 @@
+from ptcgp_sim.game.logic import trace
+from ptcgp_sim.game.logic.trace import ListSink, TraceRecord
+from ptcgp_sim.sim.runner import MatchupConfig, play_game
+
+
+def test_engine_is_silent_when_tracing_is_off(deck_lists, energies, capsys):
+    """Tests that a full game writes nothing to stdout while tracing is off."""
+    # Arrange
+    deck_a, deck_b = deck_lists
+    assert trace.enabled is False
+
+    # Act
+    play_game(MatchupConfig(deck_a, deck_b, energies[:8], energies[:8]))
+
+    # Assert
+    assert capsys.readouterr().out == ""
+
+
+def test_tracing_collects_structured_records(deck_lists, energies):
+    """Tests that an installed sink receives structured records from the engine."""
+    # Arrange
+    deck_a, deck_b = deck_lists
+    sink = ListSink()
+
+    # Act
+    with trace.tracing(sink):
+        play_game(MatchupConfig(deck_a, deck_b, energies[:8], energies[:8]))
+
+    # Assert
+    assert trace.enabled is False
+    assert all(isinstance(record, TraceRecord) for record in sink.records)
+    turn_starts = [r for r in sink.records if r.source == "CONTROLLER" and r.event == "turn_start"]
+    assert turn_starts[0].fields["turn"] == 1
+    damage = [r for r in sink.records if r.source == "CARD" and r.event == "take_damage"]
+    assert damage and all(r.fields["amount"] > 0 for r in damage)
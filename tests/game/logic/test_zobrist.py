@@ -0,0 +1,58 @@
+import random
+
+from ptcgp_sim.game.logic import zobrist
+from ptcgp_sim.game.logic.actions import apply_action, legal_actions
+from tests.conftest import signature, start_game
+
+
+def test_incremental_hash_matches_hash_from_scratch(deck_lists, energies):
+    """Tests that the hash stays consistent while games are played with random legal actions."""
+    rng = random.Random(0)
+    for _ in range(5):
+        # Arrange
+        controller = start_game(deck_lists, energies)
+        game_state = controller.game_state
+
+        # Act & Assert
+        assert game_state.zobrist == zobrist.compute_hash(game_state)
+        while not game_state.is_game_over and game_state.turn_number <= 60:
+            apply_action(controller, rng.choice(legal_actions(game_state)))
+            assert game_state.zobrist == zobrist.compute_hash(game_state)
+
+
+def test_no_collisions_between_distinct_states(deck_lists, energies):
+    # Arrange
+    rng = random.Random(1)
+    seen: dict[int, tuple] = {}
+
+    # Act & Assert
+    for _ in range(10):
+        controller = start_game(deck_lists, energies)
+        game_state = controller.game_state
+        while not game_state.is_game_over and game_state.turn_number <= 60:
+            apply_action(controller, rng.choice(legal_actions(game_state)))
+            state = signature(game_state, exact=False)
+            assert seen.setdefault(game_state.zobrist, state) == state
+
+
+def test_clone_keeps_hash_and_diverges(deck_lists, energies):
+    # Arrange
+    controller = start_game(deck_lists, energies)
+    game_state = controller.game_state
+    copy = game_state.clone()
+
+    # Act & Assert
+    assert copy.zobrist == game_state.zobrist
+    copy.advance_turn()
+    assert copy.zobrist != game_state.zobrist
+    assert copy.zobrist == zobrist.compute_hash(copy)
+
+
+def test_hashing_can_be_turned_off(deck_lists, energies):
+    # Arrange & Act
+    controller = start_game(deck_lists, energies, hashing=False)
+    apply_action(controller, legal_actions(controller.game_state)[-1])
+
+    # Assert
+    assert controller.game_state.zobrist is None
+    assert controller.game_state.clone().zobrist is None
@@ -36,28 +36,14 @@ def test_card_takes_non_lethal_damage(sample_card_data):
     assert card.current_hp == 10
 
 
-def test_card_death_event_fires_on_lethal_damage(sample_card_data):
-    """
-    Tests the crucial event-firing mechanism when a card dies.
-    This demonstrates how to test an event system with a mock handler.
-    """
+def test_card_is_not_alive_after_lethal_damage(sample_card_data):
+    """Tests that lethal damage leaves a card at 0 HP. Knockouts are resolved by the ActionResolver."""
     # Arrange
     card = Card(sample_card_data)
 
-    # Create a simple "spy" or mock handler to track if the event was called.
-    mock_handler_state = {"called": False, "dead_card": None}
-
-    def mock_death_handler(dead_card):
-        mock_handler_state["called"] = True
-        mock_handler_state["dead_card"] = dead_card
-
-    card.subscribe_to_death(mock_death_handler)
-
     # Act
     card.take_damage(80)  # More than enough to be lethal
 
     # Assert
-    assert card.current_hp <= 0
-    assert mock_handler_state["called"] is True
-    # Check that the event passed the correct instance back to the handler
-    assert mock_handler_state["dead_card"] is card
\ No newline at end of file
+    assert card.current_hp == 0
+    assert not card.is_alive()
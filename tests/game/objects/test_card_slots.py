@@ -0,0 +1,33 @@
+import pytest
+
+from tests.cards import make_pokemon
+from ptcgp_sim.game.objects.card import Card
+
+
+def test_cards_share_card_data_and_have_no_instance_dict():
+    """Tests that copies of a card share one CardData and only store their own state in slots."""
+    # Arrange
+    card_data = make_pokemon(1, "Bulbasaur", 70, [("GC", "Vine Whip", "40")])
+
+    # Act
+    first, second = Card(card_data), Card(card_data)
+
+    # Assert
+    assert first.card_data is second.card_data
+    assert first.name == "Bulbasaur" and first.attacks is card_data.attacks
+    assert not hasattr(first, "__dict__")
+    with pytest.raises(AttributeError):
+        first.nickname = "Bulby"
+
+
+def test_lethal_damage_stops_at_zero_hp():
+    """Tests that a card knocked out by damage only loses its HP; the ActionResolver resolves knockouts."""
+    # Arrange
+    card = Card(make_pokemon(1, "Bulbasaur", 70, [("GC", "Vine Whip", "40")]))
+
+    # Act
+    card.take_damage(100)
+
+    # Assert
+    assert card.current_hp == 0
+    assert not card.is_alive()
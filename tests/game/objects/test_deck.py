@@ -0,0 +1,114 @@
+from ptcgp_sim.game.logic.rng import GameRandom
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+from tests.cards import make_pokemon
+
+BASIC = make_pokemon(1, "Basic Mon", 60, [("C", "Hit", "10")])
+EVOLUTION = make_pokemon(2, "Evolved Mon", 90, [("C", "Hit", "10")], stage="Stage 1")
+
+
+def make_deck(n_basics: int = 4, n_evolutions: int = 16) -> Deck:
+    return Deck([Card(BASIC) for _ in range(n_basics)] + [Card(EVOLUTION) for _ in range(n_evolutions)])
+
+
+def test_unshuffled_deck_draws_its_last_card():
+    # Arrange
+    deck = make_deck()
+    last = deck.cards[-1]
+
+    # Act
+    drawn = deck.draw()
+
+    # Assert
+    assert drawn is last
+    assert len(deck) == 19 and drawn not in deck.cards
+
+
+def test_shuffled_deck_draws_every_card_once():
+    # Arrange
+    deck = make_deck()
+    cards = deck.cards
+    deck.shuffle(GameRandom(3))
+
+    # Act
+    drawn = [deck.draw() for _ in range(20)]
+
+    # Assert
+    assert sorted(map(id, drawn)) == sorted(map(id, cards))
+    assert drawn != cards
+    assert deck.draw() is None
+
+
+def test_seeded_draws_are_reproducible():
+    # Arrange
+    decks = [make_deck(), make_deck()]
+    for deck in decks:
+        deck.shuffle(GameRandom(8))
+
+    # Act
+    orders = [[deck.cards.index(deck.draw()) for _ in range(10)] for deck in decks]
+
+    # Assert
+    assert orders[0] == orders[1]
+
+
+def test_draw_stage_searches_by_stage_and_keeps_counts():
+    # Arrange
+    deck = make_deck(n_basics=2)
+    deck.shuffle(GameRandom(1))
+
+    # Act
+    basics = [deck.draw_stage("Basic"), deck.draw_stage("Basic"), deck.draw_stage("Basic")]
+
+    # Assert
+    assert [card.stage for card in basics[:2]] == ["Basic", "Basic"]
+    assert basics[2] is None
+    assert deck.count("Basic") == 0 and deck.count("Stage 1") == 16 and len(deck) == 16
+
+
+def test_remove_and_add_cards():
+    # Arrange
+    deck = make_deck()
+    card = deck.cards[3]
+
+    # Act
+    deck.remove(card)
+    removed = (len(deck), card in deck.cards, deck.count("Basic"))
+    deck.add(card)
+
+    # Assert
+    assert removed == (19, False, 3)
+    assert len(deck) == 20 and deck.cards[-1] is card and deck.count("Basic") == 4
+
+
+def test_snapshot_and_restore():
+    # Arrange
+    deck = make_deck()
+    deck.shuffle(GameRandom(4))
+    deck.draw()
+    snapshot = deck.snapshot()
+    cards = deck.cards
+
+    # Act
+    deck.draw_stage("Basic")
+    deck.draw()
+    deck.restore(snapshot)
+
+    # Assert
+    assert deck.cards == cards
+    assert deck.count("Basic") + deck.count("Stage 1") == 19
+
+
+def test_reset_puts_every_card_back():
+    # Arrange
+    deck = make_deck()
+    deck.shuffle(GameRandom(2))
+    drawn = [deck.draw() for _ in range(5)]
+    drawn[0].take_damage(20)
+
+    # Act
+    deck.reset()
+
+    # Assert
+    assert len(deck) == 20 and deck.count("Basic") == 4 and not deck.is_shuffled
+    assert all(card.current_hp == card.max_hp for card in deck.cards)
@@ -66,8 +66,9 @@ def test_player_handles_duplicate_card_death_correctly(player_setup):
 
     # Act
     # Simulate the death of ONLY the second dragon instance.
-    # The player's handle_card_death method will be called via the event system.
+    # The ActionResolver knocks it out once its knockout queue is drained.
     bulbasaur2.take_damage(1000)
+    player.knock_out(bulbasaur2)
 
     # Assert
     assert len(player.discard_pile) == 1
@@ -0,0 +1,75 @@
+import pytest
+
+from ptcgp_sim.game.logic.game_log import GameLog
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+from ptcgp_sim.game.objects.player import Player
+from ptcgp_sim.game.objects.zone import Bench, CardPile
+from tests.cards import make_pokemon
+
+BULBASAUR = make_pokemon(1, "Bulbasaur", 70, [("GC", "Vine Whip", "40")])
+
+
+def test_card_pile_tells_copies_apart():
+    # Arrange
+    first, second = Card(BULBASAUR), Card(BULBASAUR)
+    second.instance_id = first.instance_id  # Equal field by field
+    pile = CardPile([first])
+
+    # Act & Assert
+    assert first in pile and second not in pile
+    with pytest.raises(ValueError):
+        pile.remove(second)
+    pile.append(second)
+    pile.remove(first)
+    assert list(pile) == [second] and pile[0] is second and len(pile) == 1
+
+
+def test_card_pile_keeps_order():
+    # Arrange
+    cards = [Card(BULBASAUR) for _ in range(5)]
+    pile = CardPile(cards)
+
+    # Act
+    pile.remove(cards[1])
+    pile += [cards[1]]
+    copy = pile.copy()
+    pile.clear()
+
+    # Assert
+    assert list(copy) == [cards[0], cards[2], cards[3], cards[4], cards[1]]
+    assert copy.index(cards[3]) == 2 and not pile
+
+
+def test_bench_tracks_spots():
+    # Arrange
+    bench = Bench(3)
+    first, second = Card(BULBASAUR), Card(BULBASAUR)
+
+    # Act
+    bench[1] = first
+    bench[0] = second
+    states = [(bench.occupied(), bench.first_free(), bench.first_occupied(), None in bench)]
+    bench[2] = Card(BULBASAUR)
+    states.append((bench.occupied(), bench.first_free(), bench.is_full(), None in bench))
+    bench[0] = None
+
+    # Assert
+    assert states == [(2, 2, 0, True), (3, None, True, False)]
+    assert bench.spot_of(first) == 1 and bench.spot_of(second) is None and second not in bench
+    assert bench.first_free() == 0 and bench.first_occupied() == 1 and len(bench) == 3
+
+
+def test_player_moves_the_exact_copy():
+    # Arrange
+    player = Player("Ash", Deck([]), GameLog())
+    first, second = Card(BULBASAUR), Card(BULBASAUR)
+    player.hand = CardPile([first, second])
+
+    # Act
+    player.set_active_pokemon_from_hand(second)
+    player.play_card_to_bench(first)
+
+    # Assert
+    assert player.active_pokemon is second and player.bench[0] is first
+    assert not player.hand and player.bench.occupied() == 1
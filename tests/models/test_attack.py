@@ -0,0 +1,73 @@
+import pytest
+
+from tests.cards import ENERGIES, make_pokemon
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.models.attack import Attack
+from ptcgp_sim.models.energy import ENERGY_INDEX
+
+
+@pytest.mark.parametrize("damage, base_damage, modifier", [
+    ("40", 40, None),
+    ("30+", 30, "+"),
+    ("50x", 50, "x"),
+    ("20×", 20, "x"),
+    (None, 0, None),
+])
+def test_damage_is_compiled(damage, base_damage, modifier):
+    attack = Attack(costs="C", damage=damage)
+
+    assert attack.get_damage() == base_damage
+    assert attack.damage_modifier == modifier
+
+
+def test_costs_are_compiled_to_count_vector():
+    attack = Attack(costs="GGRCC")
+
+    assert attack.cost_vector[ENERGY_INDEX["G"]] == 2
+    assert attack.cost_vector[ENERGY_INDEX["R"]] == 1
+    assert sum(attack.cost_vector) == 3
+    assert attack.colorless_cost == 2
+    assert attack.total_cost == 5
+
+
+def test_unknown_energy_code_is_rejected():
+    with pytest.raises(ValueError):
+        Attack(costs="GQ")
+
+
+def test_available_attacks_use_typed_energy_first():
+    """Tests that colorless costs are paid with the energy left over after the typed costs."""
+    # Arrange
+    grass, fire = ENERGIES[0], ENERGIES[1]
+    card = Card(make_pokemon(1, "Venusaur", 160, [("GC", "Razor Leaf", "60"), ("GGCC", "Giant Bloom", "100")]))
+
+    # Act & Assert
+    assert card.get_available_attacks() == []
+
+    card.attach_energy(fire)
+    card.attach_energy(grass)
+    assert [attack.name for attack in card.get_available_attacks()] == ["Razor Leaf"]
+
+    card.attach_energy(fire)
+    assert [attack.name for attack in card.get_available_attacks()] == ["Razor Leaf"]
+
+    card.attach_energy(grass)
+    assert [attack.name for attack in card.get_available_attacks()] == ["Razor Leaf", "Giant Bloom"]
+    assert len(card.attached_energy) == 4
+
+
+def test_available_attacks_are_cached_until_energy_changes():
+    # Arrange
+    grass = ENERGIES[0]
+    card = Card(make_pokemon(1, "Bulbasaur", 70, [("GC", "Vine Whip", "40")]), attached_energy=[grass])
+    no_attacks = card.get_available_attacks()
+
+    # Act & Assert
+    assert card.get_available_attacks() is no_attacks
+
+    card.attach_energy(grass)
+    assert [attack.name for attack in card.get_available_attacks()] == ["Vine Whip"]
+
+    assert card.detach_all_energy() == [grass, grass]
+    assert card.get_available_attacks() == []
+    assert not any(card.energy_counts)
@@ -0,0 +1,122 @@
+from collections import Counter
+from itertools import product
+
+import numpy as np
+
+from ptcgp_sim.game.logic.rng import GameRandom
+from ptcgp_sim.game.objects.card import Card
+from ptcgp_sim.game.objects.deck import Deck
+from ptcgp_sim.setup.opening_hand import (
+    basics_seen, bench_size, cards_seen, hand_distribution, prob_seen, prob_seen_by_turn,
+)
+from ptcgp_sim.setup.setup_player import setup_player
+from tests.cards import ENERGIES, make_pokemon
+
+# A 7-card deck small enough to deal in every way: kinds 0 and 1 are Basics
+COUNTS = np.array([2, 1, 3, 1])
+BASIC = np.array([True, True, False, False])
+KINDS = [make_pokemon(10 + kind, f"Kind {kind}", 60, [], stage="Basic" if basic else "Stage 1")
+         for kind, basic in enumerate(BASIC)]
+
+
+class ScriptedDeck(Deck):
+    """A shuffled deck that takes its random numbers from the given choices, in order."""
+    __slots__ = ("choices",)
+
+    def __init__(self, cards, choices: tuple[int, ...]):
+        super().__init__(cards)
+        self.shuffle(GameRandom(0))
+        self.choices = iter(choices)
+
+    def _random_below(self, stop: int) -> int:
+        choice = next(self.choices)
+        assert choice < stop
+        return choice
+
+
+def dealt_distribution(n_cards: int) -> dict[tuple, float]:
+    """Deals the small deck like setup_player does, with every sequence of random choices, and counts the hands."""
+    n_basics = COUNTS[BASIC].sum()
+    ranges = [range(n_basics)] + [range(size) for size in range(COUNTS.sum() - 1, COUNTS.sum() - n_cards, -1)]
+    seen = Counter()
+    for choices in product(*ranges):
+        deck = ScriptedDeck([Card(KINDS[kind]) for kind, count in enumerate(COUNTS) for _ in range(count)], choices)
+        hand = [deck.draw_stage("Basic")] + [deck.draw() for _ in range(n_cards - 1)]
+        seen[tuple(np.bincount([card.id - 10 for card in hand], minlength=len(COUNTS)))] += 1
+    total = sum(seen.values())
+    return {hand: count / total for hand, count in seen.items()}
+
+
+def test_hand_distribution_matches_every_deal():
+    for n_cards in (3, 5):
+        # Arrange
+        dealt = dealt_distribution(n_cards)
+
+        # Act
+        hands, probs = hand_distribution(COUNTS, BASIC, n_cards)
+
+        # Assert
+        exact = {tuple(hand): prob for hand, prob in zip(hands, probs) if prob > 0}
+        assert exact.keys() == dealt.keys()
+        for hand, prob in dealt.items():
+            assert np.isclose(exact[hand], prob)
+
+
+def test_marginals_match_hand_distribution():
+    # Arrange
+    hands, probs = hand_distribution(COUNTS, BASIC, 4)
+    n_basics = COUNTS[BASIC].sum()
+    deck_size = COUNTS.sum()
+
+    # Act
+    basics = basics_seen(n_basics, 4, deck_size)
+    seen = prob_seen(COUNTS, BASIC, n_basics, 4, deck_size)
+
+    # Assert
+    hand_basics = (hands * BASIC).sum(axis=1)
+    assert np.allclose(basics, np.bincount(hand_basics, weights=probs, minlength=5))
+    assert np.allclose(seen, [(probs * (hands[:, kind] > 0)).sum() for kind in range(len(COUNTS))])
+
+
+def test_distributions_are_vectorized_over_decks():
+    # Arrange
+    n_basics = np.arange(1, 21)
+
+    # Act
+    basics = basics_seen(n_basics)
+    bench = bench_size(n_basics)
+    by_turn = prob_seen_by_turn(2, False, n_basics[:, None], np.arange(1, 11)[None, :])
+
+    # Assert
+    assert basics.shape == (20, 6) and bench.shape == (20, 4)
+    assert np.allclose(basics.sum(axis=1), 1.0) and np.allclose(bench.sum(axis=1), 1.0)
+    # A deck of only Basics opens with 5 of them and a full bench
+    assert basics[-1, 5] == 1.0 and bench[-1, 3] == 1.0
+    # The chance of having drawn a card only grows with the turns
+    assert by_turn.shape == (20, 10) and (np.diff(by_turn, axis=1) >= -1e-12).all()
+
+
+def test_cards_seen():
+    assert list(cards_seen([1, 2, 3, 4])) == [6, 6, 7, 7]
+    assert list(cards_seen([1, 2, 3, 4], went_first=False)) == [5, 6, 6, 7]
+
+
+def test_bench_size_matches_setup_player():
+    # Arrange
+    basic = make_pokemon(1, "Basic Mon", 60, [("C", "Hit", "10")])
+    evolution = make_pokemon(2, "Evolved Mon", 90, [("C", "Hit", "10")], stage="Stage 1")
+    deck_cards = [basic] * 6 + [evolution] * 14
+    rng = GameRandom(5)
+    n_games = 4000
+
+    # Act
+    benched = Counter()
+    for _ in range(n_games):
+        deck = Deck([Card(card_data) for card_data in deck_cards])
+        player = setup_player("Player", deck, ENERGIES[:8], rng=rng)
+        benched[sum(card is not None for card in player.bench)] += 1
+
+    # Assert
+    expected = bench_size(6)
+    observed = np.array([benched[size] for size in range(4)]) / n_games
+    assert np.allclose(observed, expected, atol=0.03)
@@ -0,0 +1,107 @@
+import numpy as np
+
+from ptcgp_sim.ai.simple_ai_controller import SimpleAIController
+from ptcgp_sim.game.logic.effects import DealDamageEffect
+from ptcgp_sim.sim import encoder as encoder_module
+from ptcgp_sim.sim.encoder import (
+    OBSERVATION_SIZE, GLOBAL_OFFSET, ObservationEncoder, encode_game_state, counters_offset, slot_offset,
+)
+from tests.conftest import start_game
+
+
+def test_encode_game_state(deck_lists, energies):
+    # Arrange
+    controller = start_game(deck_lists, energies)
+    game_state = controller.game_state
+    player = game_state.players[0]
+    active = player.active_pokemon
+    active.take_damage(10)
+    active.attach_energy(energies[1])
+
+    # Act
+    observation = encode_game_state(game_state)
+
+    # Assert
+    assert observation.shape == (OBSERVATION_SIZE,) and observation.dtype == np.float32
+    offset = slot_offset(0, 0)
+    assert list(observation[offset:offset + 3]) == [1.0, active.max_hp - 10, active.max_hp]
+    assert observation[offset + 3 + 1] == 1.0  # One Fire energy
+    assert list(observation[counters_offset(0):counters_offset(0) + 4]) == [len(player.hand), len(player.deck), 0, 0]
+    assert observation[GLOBAL_OFFSET] == game_state.turn_number
+
+
+def test_incremental_updates_match_full_encoding(deck_lists, energies):
+    """Tests that updating the rows after every turn gives the same batch as encoding from scratch."""
+    # Arrange
+    controllers = [start_game(deck_lists, energies) for _ in range(3)]
+    game_states = [controller.game_state for controller in controllers]
+    encoder = ObservationEncoder(len(controllers))
+    encoder.encode_batch(game_states)
+    agent = SimpleAIController()
+
+    for _ in range(30):
+        # Act
+        for controller in controllers:
+            if not controller.game_state.is_game_over:
+                agent.take_turn(controller)
+        batch = encoder.update_batch(game_states)
+
+        # Assert
+        assert np.array_equal(batch, ObservationEncoder(len(controllers)).encode_batch(game_states))
+
+
+def test_update_only_writes_changed_parts(deck_lists, energies):
+    # Arrange
+    controller = start_game(deck_lists, energies)
+    encoder = ObservationEncoder(1)
+    encoder.encode(0, controller.game_state)
+
+    # Act & Assert
+    assert encoder.update(0, controller.game_state) == 0
+
+    DealDamageEffect(controller.game_state.players[1].active_pokemon.instance_id, 10).apply(controller.game_state)
+    assert encoder.update(0, controller.game_state) == 1
+    offset = slot_offset(1, 0)
+    assert encoder.observations[0, offset + 1] == controller.game_state.players[1].active_pokemon.current_hp
+
+
+def test_update_skips_unchanged_slots_and_players(deck_lists, energies, monkeypatch):
+    # Arrange
+    controller = start_game(deck_lists, energies)
+    game_state = controller.game_state
+    encoder = ObservationEncoder(1)
+    encoder.encode(0, game_state)
+    computed = []
+    slot_values, counter_values = encoder_module._slot_values, encoder_module._counter_values
+    monkeypatch.setattr(encoder_module, "_slot_values", lambda card: computed.append(card) or slot_values(card))
+    monkeypatch.setattr(encoder_module, "_counter_values",
+                        lambda player: computed.append(player) or counter_values(player))
+    defender = game_state.players[1].active_pokemon
+
+    # Act
+    DealDamageEffect(defender.instance_id, 10).apply(game_state)
+    encoder.update(0, game_state)
+
+    # Assert
+    assert computed == [defender]
+
+
+def test_update_after_rollback_matches_full_encoding(deck_lists, energies):
+    # Arrange
+    controller = start_game(deck_lists, energies)
+    game_state = controller.game_state
+    encoder = ObservationEncoder(1)
+    encoder.encode(0, game_state)
+    checkpoint = game_state.checkpoint()
+    agent = SimpleAIController()
+    for _ in range(4):
+        if not game_state.is_game_over:
+            agent.take_turn(controller)
+    encoder.update(0, game_state)
+
+    # Act
+    game_state.rollback(checkpoint)
+    encoder.update(0, game_state)
+
+    # Assert
+    assert np.array_equal(encoder.observations[0], encode_game_state(game_state))
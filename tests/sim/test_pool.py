@@ -0,0 +1,19 @@
+from ptcgp_sim.sim.pool import ConfigPool
+
+
+def scale(config: int, value: int, offset: int) -> int:
+    return config * value + offset
+
+
+def test_tasks_get_the_config_in_and_out_of_process():
+    # Arrange
+    values, offsets = range(10), range(10, 20)
+
+    # Act
+    with ConfigPool(3, workers=1) as pool:
+        in_process = list(pool.map(scale, values, offsets))
+    with ConfigPool(3, workers=2) as pool:
+        pooled = list(pool.map(scale, values, offsets, chunksize=3))
+
+    # Assert
+    assert in_process == pooled == [3 * value + offset for value, offset in zip(values, offsets)]
@@ -0,0 +1,108 @@
+import io
+import random
+
+import pytest
+
+from ptcgp_sim.game.logic.actions import apply_action, legal_actions
+from ptcgp_sim.game.logic.rng import GameRandom
+from ptcgp_sim.models.attack import Attack
+from ptcgp_sim.sim.replay import Replay, ReplayHeader, ReplayWriter, read_replays, record_game
+from ptcgp_sim.sim.runner import MatchupConfig, create_game, play_game
+
+
+def lookups(deck_lists, energies):
+    cards = {card_data.code: card_data for deck in deck_lists for card_data in deck}
+    return cards, {energy.code: energy for energy in energies}
+
+
+def describe(game_state) -> tuple:
+    return (game_state.turn_number, game_state.is_game_over,
+            game_state.winner.name if game_state.winner else None,
+            *((player.points, len(player.hand), len(player.deck), len(player.discard_pile)) for player in game_state.players))
+
+
+def test_replay_reproduces_recorded_games(deck_lists, energies):
+    # Arrange
+    deck_a, deck_b = deck_lists
+    config = MatchupConfig(deck_a, deck_b, energies[:8], energies[:8], seed=11)
+    cards, energy_types = lookups(deck_lists, energies)
+
+    for game_index in range(4):
+        # Act
+        replay = record_game(config, game_index)
+        result = play_game(config, a_first=game_index % 2 == 0, seed=config.game_seed(game_index))
+        controller = replay.replay_to(cards, energy_types)
+
+        # Assert
+        game_state = controller.game_state
+        assert game_state.is_game_over
+        players = sorted(game_state.players, key=lambda player: player.name)
+        assert (players[0].points, players[1].points) == result.points
+        assert min(game_state.turn_number, config.max_turns) == result.turns
+
+
+def test_write_and_read_stream(deck_lists, energies):
+    # Arrange
+    deck_a, deck_b = deck_lists
+    config = MatchupConfig(deck_a, deck_b, energies[:8], energies[:8], seed=5)
+    other = MatchupConfig(deck_b, deck_a, energies[:3], energies[2:5], max_turns=30, seed=5)
+    replays = [record_game(config, i) for i in range(3)] + [record_game(other, 0), record_game(config, 3)]
+    stream = io.BytesIO()
+
+    # Act
+    writer = ReplayWriter(stream)
+    for replay in replays:
+        writer.write(replay)
+    stream.seek(0)
+    read = list(read_replays(stream))
+
+    # Assert
+    assert read == replays
+    # Games in a matchup already written only take their seed and actions
+    game_sizes = (len(stream.getvalue()) - 7) / len(replays)
+    assert game_sizes < 200
+
+
+def test_simulate_steps_through_the_game(deck_lists, energies):
+    # Arrange
+    deck_a, deck_b = deck_lists
+    config = MatchupConfig(deck_a, deck_b, energies[:8], energies[:8])
+    cards, energy_types = lookups(deck_lists, energies)
+    controller, _ = create_game(config, rng=GameRandom(99))
+    controller.start_game()
+    replay = Replay(ReplayHeader.from_config(config), seed=99)
+    controller.action_listener = replay.actions.append
+    game_state = controller.game_state
+    rng = random.Random(0)
+    states = [describe(game_state)]
+    while not game_state.is_game_over and game_state.turn_number <= config.max_turns:
+        apply_action(controller, rng.choice(legal_actions(game_state)))
+        states.append(describe(game_state))
+
+    # Act
+    replayed = [describe(replayed.game_state) for replayed in replay.simulate(cards, energy_types)]
+
+    # Assert
+    assert replayed[:len(states)] == states
+
+
+def test_attacks_without_an_action_id_are_refused(deck_lists, energies):
+    # Arrange
+    deck_a, deck_b = deck_lists
+    config = MatchupConfig(deck_a, deck_b, energies[:8], energies[:8])
+    controller, _ = create_game(config, rng=GameRandom(3))
+    controller.start_game()
+    actions = []
+    controller.action_listener = actions.append
+    game_state = controller.game_state
+    attacker = game_state.current_player.active_pokemon
+    defender = game_state.opponent.active_pokemon
+    unknown_attack = Attack(id=-1, card_id=-1, costs="", name="Unknown Attack", damage="200")
+    turn_number = game_state.turn_number
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        controller.request_attack(attacker.instance_id, defender.instance_id, unknown_attack)
+    assert actions == []
+    assert defender.current_hp == defender.card_data.hp
+    assert game_state.turn_number == turn_number
@@ -0,0 +1,75 @@
+import numpy as np
+
+from ptcgp_sim.sim.results import (
+    RESULT_DTYPE, ResultsStore, first_player_win_rate, play_game_records, summarize_decks,
+)
+from ptcgp_sim.sim.runner import GameResult, MatchupConfig, play_games
+
+
+def make_records(rows) -> np.ndarray:
+    """Records from (deck_a, deck_b, winner, first) rows."""
+    records = np.zeros(len(rows), dtype=RESULT_DTYPE)
+    for i, (deck_a, deck_b, winner, first) in enumerate(rows):
+        records[i]["deck_a"], records[i]["deck_b"] = deck_a, deck_b
+        records[i]["winner"], records[i]["first"] = winner, first
+    return records
+
+
+def test_summarize_decks():
+    # Arrange
+    records = make_records([
+        (0, 1, 0, 0),   # Deck 0 wins going first
+        (0, 1, 1, 0),   # Deck 1 wins going second
+        (1, 0, 0, 1),   # Deck 1 wins going second
+        (2, 0, -1, 0),  # Draw
+    ])
+
+    # Act
+    summary = summarize_decks(records)
+
+    # Assert
+    assert list(summary["deck"]) == [0, 1, 2]
+    assert list(summary["games"]) == [4, 3, 1]
+    assert list(summary["wins"]) == [1, 2, 0]
+    assert list(summary["draws"]) == [1, 0, 1]
+    assert list(summary["games_first"]) == [3, 0, 1]
+    assert list(summary["wins_first"]) == [1, 0, 0]
+    assert list(summary["wins_second"]) == [0, 2, 0]
+    assert summary["win_rate"][1] == 2 / 3
+    assert first_player_win_rate(records) == 1 / 3
+
+
+def test_store_flushes_chunks_to_shards(tmp_path):
+    # Arrange
+    store = ResultsStore(tmp_path, chunk_size=4)
+    result = GameResult(winner=1, turns=12, first=0, points=(1, 3), knockouts=(1, 3), seed=2 ** 63 + 5)
+
+    # Act
+    for deck in range(10):
+        store.add(deck, deck + 1, result)
+    store.flush()
+
+    # Assert
+    assert len(store) == 10
+    assert len(list(tmp_path.glob("results-*.npy"))) == 3
+    records = ResultsStore(tmp_path).records()
+    assert list(records["deck_a"]) == list(range(10))
+    assert records[0]["seed"] == 2 ** 63 + 5
+    assert (records["winner"][0], records["points_b"][0], records["knockouts_b"][0]) == (1, 3, 3)
+
+
+def test_play_game_records_match_runner(deck_lists, energies):
+    # Arrange
+    deck_a, deck_b = deck_lists
+    config = MatchupConfig(deck_a, deck_b, energies[:8], energies[:8], seed=7)
+    store = ResultsStore(chunk_size=8)
+
+    # Act
+    store.extend(play_game_records(config, 0, 20, deck_a=3, deck_b=4))
+    matchup = play_games(config, 0, 20)
+
+    # Assert
+    summary = summarize_decks(store.records())
+    assert list(summary["deck"]) == [3, 4]
+    assert list(summary["wins"]) == matchup.wins
+    assert summary["draws"][0] == matchup.draws
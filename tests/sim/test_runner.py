@@ -0,0 +1,60 @@
+from ptcgp_sim.sim.runner import MatchupConfig, play_game, run_matchup
+
+
+def test_play_game_runs_to_completion(deck_lists, energies):
+    """Tests that a single game between two AI controllers finishes with a consistent result."""
+    # Arrange
+    deck_a, deck_b = deck_lists
+    config = MatchupConfig(deck_a, deck_b, energies[:8], energies[:8], max_turns=100)
+
+    # Act
+    result = play_game(config, a_first=True)
+
+    # Assert
+    assert 1 <= result.turns <= 100
+    assert result.first == 0
+    if result.winner is not None:
+        loser = 1 - result.winner
+        assert result.points[result.winner] >= 3 or result.points[loser] < 3
+
+
+def test_run_matchup_in_process(deck_lists, energies):
+    """Tests that outcomes of all games are aggregated when running in a single process."""
+    # Arrange
+    deck_a, deck_b = deck_lists
+
+    # Act
+    result = run_matchup(deck_a, deck_b, 10, energies[:8], workers=1)
+
+    # Assert
+    assert result.games == 10
+    assert result.wins[0] + result.wins[1] + result.draws == 10
+    assert sum(result.turn_histogram.values()) == 10
+    assert abs(result.win_rate_a + result.win_rate_b + result.draw_rate - 1.0) < 1e-9
+    assert result.mean_turns > 0
+
+
+def test_run_matchup_process_pool(deck_lists, energies):
+    """Tests that games are spread over worker processes and merged into one result."""
+    # Arrange
+    deck_a, deck_b = deck_lists
+
+    # Act
+    result = run_matchup(deck_a, deck_b, 12, energies[:8], workers=2, chunk_size=5)
+
+    # Assert
+    assert result.games == 12
+    assert result.wins[0] + result.wins[1] + result.draws == 12
+
+
+def test_seeded_matchup_does_not_depend_on_chunking(deck_lists, energies):
+    """Tests that every game of a seeded matchup has the same outcome however the games are split."""
+    # Arrange
+    deck_a, deck_b = deck_lists
+
+    # Act
+    whole = run_matchup(deck_a, deck_b, 12, energies[:8], workers=1, seed=3)
+    split = run_matchup(deck_a, deck_b, 12, energies[:8], workers=2, chunk_size=5, seed=3)
+
+    # Assert
+    assert whole == split
@@ -0,0 +1,50 @@
+import numpy as np
+
+from ptcgp_sim.sim.tournament import run_tournament, wilson_interval
+from tests.cards import ENERGIES, make_pokemon
+
+
+def pool_of_decks(n_decks: int) -> list:
+    """Decks of one Basic Pokémon each, whose single attack gets stronger with the deck index."""
+    return [[make_pokemon(300 + i, f"Mon {i}", 60, [("C", "Hit", str(10 * (i + 1)))])] * 20
+            for i in range(n_decks)]
+
+
+def test_wilson_interval():
+    # Act
+    lower, upper = wilson_interval(np.array([50.0, 0.0, 0.0]), np.array([100, 10, 0]))
+
+    # Assert
+    assert lower[0] < 0.5 < upper[0]
+    assert lower[1] < 1e-9 and upper[1] < 0.5
+    assert (lower[2], upper[2]) == (0.0, 1.0)
+
+
+def test_strongest_deck_wins_and_weak_decks_drop_out():
+    # Arrange
+    decks = pool_of_decks(6)
+    energy_types = [ENERGIES[:8]] * len(decks)
+
+    # Act
+    result = run_tournament(decks, energy_types, n_winners=1, max_rounds=30, workers=1, seed=1)
+
+    # Assert
+    assert result.ranking[0] == 5
+    assert 0 in result.eliminated
+    assert len(result.ranking) + len(result.eliminated) == 6
+    # The race ends well before the round limit
+    assert result.rounds < 30
+    assert len(result.store) == result.games_played
+
+
+def test_seeded_tournament_does_not_depend_on_workers():
+    # Arrange
+    decks = pool_of_decks(4)
+    energy_types = [ENERGIES[:8]] * len(decks)
+
+    # Act
+    single = run_tournament(decks, energy_types, max_rounds=2, workers=1, seed=3)
+    parallel = run_tournament(decks, energy_types, max_rounds=2, workers=2, seed=3)
+
+    # Assert
+    assert np.array_equal(single.store.records(), parallel.store.records())
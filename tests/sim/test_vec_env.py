@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from ptcgp_sim.game.logic.actions import END_TURN, N_ACTIONS
+from ptcgp_sim.sim.encoder import OBSERVATION_SIZE, ObservationEncoder
+from ptcgp_sim.sim.runner import create_game
+from ptcgp_sim.sim.vec_env import VecEnv
+from tests.conftest import signature
+
+
+def test_step_with_random_legal_actions(deck_lists, energies):
+    """Tests that games played with random legal actions finish, are rewarded and reset."""
+    # Arrange
+    deck_a, deck_b = deck_lists
+    env = VecEnv(4, deck_a, deck_b, energies[:8], max_turns=30)
+    rng = np.random.default_rng(0)
+    observations, legal_masks = env.reset()
+    finished = 0
+
+    # Act & Assert
+    assert observations.shape == (4, OBSERVATION_SIZE)
+    assert legal_masks.shape == (4, N_ACTIONS)
+    for _ in range(500):
+        actions = [rng.choice(np.flatnonzero(mask)) for mask in legal_masks]
+        observations, rewards, dones, legal_masks = env.step(actions)
+
+        assert legal_masks[:, END_TURN].all()
+        assert np.all(rewards[~dones] == 0)
+        finished += int(dones.sum())
+
+    assert finished > 0
+    assert np.array_equal(observations, ObservationEncoder(4).encode_batch(env.game_states))
+
+
+def test_games_match_the_runner_games_of_the_seed(deck_lists, energies):
+    """Tests that the n-th game of environment k is game n * K + k of sim.runner, seat order included."""
+    # Arrange
+    deck_a, deck_b = deck_lists
+    env = VecEnv(3, deck_a, deck_b, energies[:8], max_turns=10, seed=7)
+    rng = np.random.default_rng(0)
+    _, legal_masks = env.reset()
+
+    for _ in range(100):
+        # Act
+        _, _, dones, legal_masks = env.step([rng.choice(np.flatnonzero(mask)) for mask in legal_masks])
+
+        # Assert
+        for index in map(int, np.flatnonzero(dones)):
+            game_index = (env.games_played[index] - 1) * env.num_envs + index
+            controller, _ = create_game(env.config, game_index % 2 == 0, hashing=False,
+                                        rng=env.config.game_rng(game_index), logging=False)
+            controller.start_game()
+            assert signature(env.game_states[index]) == signature(controller.game_state)
+    assert min(env.games_played) > 2
+    assert all(game_state.zobrist is None for game_state in env.game_states)
+
+
+def test_illegal_action_is_rejected(deck_lists, energies):
+    # Arrange
+    deck_a, deck_b = deck_lists
+    env = VecEnv(1, deck_a, deck_b, energies[:8])
+    _, legal_masks = env.reset()
+    illegal = int(np.flatnonzero(~legal_masks[0])[0])
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        env.step([illegal])